@@ -1,14 +1,18 @@
 # SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
 #
 # SPDX-License-Identifier: MPL-2.0
+from power_grid_model_ds._core.grid_results import GridResults
 from power_grid_model_ds._core.model.arrays.base.array import FancyArray
 from power_grid_model_ds._core.model.graphs.container import GraphContainer
 from power_grid_model_ds._core.model.grids.base import Grid
+from power_grid_model_ds._core.model_cache import ModelCache
 from power_grid_model_ds._core.power_grid_model_interface import PowerGridModelInterface
 
 __all__ = [
     "FancyArray",
     "GraphContainer",
     "Grid",
+    "GridResults",
+    "ModelCache",
     "PowerGridModelInterface",
 ]
@@ -15,10 +15,18 @@ AVERAGE_ROUTE_SIZE = 20
 
 
 class LineGenerator(BaseGenerator):
-    """Generator for line elements in the grid"""
+    """Generator for line elements in the grid
 
-    def __init__(self, grid: Grid, seed: int) -> None:
+    Args:
+        grid: the grid to generate lines for
+        seed: the seed of the random number generator
+        vectorized: if True, all unconnected nodes are connected in a single pass (see connect_all_nodes)
+            instead of one by one. This scales to grids with millions of nodes.
+    """
+
+    def __init__(self, grid: Grid, seed: int, vectorized: bool = False) -> None:
         super().__init__(grid=grid, seed=seed)
+        self.vectorized = vectorized
         self.connected_nodes: list = []
         self.unconnected_nodes: list = []
         self.line_array: LineArray = self.grid.line.__class__()
@@ -38,12 +46,16 @@ class LineGenerator(BaseGenerator):
 
         # while not all connected, add lines from a connected node to an unconnected node
         self.set_unconnected_nodes()
+        if self.vectorized:
+            self.connect_all_nodes()
         while any(self.unconnected_nodes):
             self.connect_nodes()
             self.set_unconnected_nodes()
 
         number_of_nops = amount
-        if number_of_nops > 0:
+        if number_of_nops > 0 and self.vectorized:
+            self.create_nop_lines_vectorized(number_of_nops)
+        elif number_of_nops > 0:
             self.create_nop_lines(number_of_nops)
 
         return self.line_array
@@ -95,6 +107,47 @@ class LineGenerator(BaseGenerator):
         new_line.i_n = capacity
         self.line_array = fp.concatenate(self.line_array, new_line)
 
+    def connect_all_nodes(self, voltage_level: float | None = None) -> None:
+        """Connect all unconnected nodes at once, by building a random spanning tree per voltage level.
+
+        The unconnected nodes are shuffled. Each of them is connected to a random node of the same voltage level
+        that is either already connected or precedes it in the shuffled order. This results in the same kind of
+        trees as connecting the nodes one by one (see connect_nodes), but in a single vectorized pass.
+
+        Args:
+            voltage_level: if given, only the nodes of this voltage level are connected.
+        """
+        unconnected_nodes = self.grid.node.filter(self.unconnected_nodes)
+        connected_nodes = self.grid.node.filter(self.connected_nodes)
+        voltage_levels = np.unique(unconnected_nodes.u_rated) if voltage_level is None else [voltage_level]
+        from_nodes, to_nodes = [], []
+        for level in voltage_levels:
+            level_connected = connected_nodes.id[connected_nodes.u_rated == level]
+            if not level_connected.size:
+                raise ValueError(f"Cannot connect nodes of {level} V: no connected node at this voltage.")
+            level_unconnected = self.rng.permutation(unconnected_nodes.id[unconnected_nodes.u_rated == level])
+            # the k-th shuffled node picks a parent from the connected nodes and the k shuffled nodes before it
+            candidates = np.concatenate((level_connected, level_unconnected))
+            n_options = len(level_connected) + np.arange(len(level_unconnected))
+            parent_index = np.floor(self.rng.random(len(level_unconnected)) * n_options).astype(np.int64)
+            from_nodes.append(candidates[parent_index])
+            to_nodes.append(level_unconnected)
+
+        if not from_nodes:
+            return
+        amount = sum(len(nodes) for nodes in to_nodes)
+        new_lines = self.grid.line.__class__.zeros(amount)
+        new_lines.id = 1 + max(int(self.line_array.id.max(initial=0)), self.grid.max_id) + np.arange(amount)
+        new_lines.from_node = np.concatenate(from_nodes)
+        new_lines.to_node = np.concatenate(to_nodes)
+        new_lines.from_status = 1
+        new_lines.to_status = 1
+        new_lines.r1 = self.rng.exponential(0.2, amount)
+        new_lines.x1 = self.rng.exponential(0.02, amount)
+        new_lines.i_n = 100 + self.rng.exponential(200, amount)
+        self.line_array = fp.concatenate(self.line_array, new_lines)
+        self.set_unconnected_nodes()
+
     def create_nop_lines(self, number_of_nops: int):
         """Create the inactive lines between different routes (Normally Open Points)"""
         nops = [self.rng.choice(self.grid.node.id, 2, replace=False) for _ in range(number_of_nops)]
@@ -102,7 +155,7 @@ class LineGenerator(BaseGenerator):
         to_nodes = [nop[1] for nop in nops]
         capacities = 100 + self.rng.exponential(200, number_of_nops)
         nop_lines = self.grid.line.__class__.zeros(number_of_nops)
-        nop_lines.id = 1 + self.line_array.id.max() + np.arange(number_of_nops)
+        nop_lines.id = 1 + max(int(self.line_array.id.max(initial=0)), self.grid.max_id) + np.arange(number_of_nops)
         nop_lines.from_node = from_nodes
         nop_lines.to_node = to_nodes
         nop_lines.from_status = [1] * number_of_nops
@@ -112,6 +165,43 @@ class LineGenerator(BaseGenerator):
         nop_lines.i_n = capacities
         self.line_array = fp.concatenate(self.line_array, nop_lines)
 
+    def create_nop_lines_vectorized(self, number_of_nops: int):
+        """Create the inactive lines between different routes (Normally Open Points) in a single pass.
+
+        Like create_nop_lines, each NOP connects two different random nodes.
+        """
+        node_ids = self.grid.node.id
+        from_index = self.rng.integers(0, len(node_ids), number_of_nops)
+        # a random non-zero offset guarantees that from_node and to_node differ
+        to_index = (from_index + self.rng.integers(1, len(node_ids), number_of_nops)) % len(node_ids)
+        nop_lines = self.grid.line.__class__.zeros(number_of_nops)
+        nop_lines.id = 1 + max(int(self.line_array.id.max(initial=0)), self.grid.max_id) + np.arange(number_of_nops)
+        nop_lines.from_node = node_ids[from_index]
+        nop_lines.to_node = node_ids[to_index]
+        nop_lines.from_status = 1
+        nop_lines.to_status = 0
+        nop_lines.r1 = self.rng.exponential(0.2, number_of_nops)
+        nop_lines.x1 = self.rng.exponential(0.02, number_of_nops)
+        nop_lines.i_n = 100 + self.rng.exponential(200, number_of_nops)
+        self.line_array = fp.concatenate(self.line_array, nop_lines)
+
+    def connect(self, from_nodes: np.ndarray, to_nodes: np.ndarray, active: bool = True) -> LineArray:
+        """Generate lines between the given (existing) nodes, e.g. to create cycles in a grid.
+
+        Inactive lines are open at the to_node side (Normally Open Points).
+        """
+        amount = len(from_nodes)
+        new_lines = self.grid.line.__class__.zeros(amount)
+        new_lines.id = 1 + max(int(self.line_array.id.max(initial=0)), self.grid.max_id) + np.arange(amount)
+        new_lines.from_node = from_nodes
+        new_lines.to_node = to_nodes
+        new_lines.from_status = 1
+        new_lines.to_status = int(active)
+        new_lines.r1 = self.rng.exponential(0.2, amount)
+        new_lines.x1 = self.rng.exponential(0.02, amount)
+        new_lines.i_n = 100 + self.rng.exponential(200, amount)
+        return new_lines
+
     def set_unconnected_nodes(self) -> None:
         """From a line array and total set of nodes determine which are not yet connected"""
         connected_link_mask = np.logical_or(
@@ -122,10 +212,17 @@ class LineGenerator(BaseGenerator):
             np.isin(self.grid.node.id, self.trafo_array.from_node),
             np.isin(self.grid.node.id, self.trafo_array.to_node),
         )
-        connected_mask = np.logical_or(
-            connected_link_mask,
-            connected_trafo_mask,
+        connected_trafo3_mask = np.isin(
+            self.grid.node.id,
+            np.concatenate(
+                (
+                    self.grid.three_winding_transformer.node_1,
+                    self.grid.three_winding_transformer.node_2,
+                    self.grid.three_winding_transformer.node_3,
+                )
+            ),
         )
+        connected_mask = connected_link_mask | connected_trafo_mask | connected_trafo3_mask
         connected_nodes = self.grid.node.id[connected_mask]
         unconnected_nodes = self.grid.node.id[~connected_mask]
 
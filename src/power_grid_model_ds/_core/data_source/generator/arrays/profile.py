@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Generator for time series load profiles"""
+
+from collections.abc import Iterator
+
+import numpy as np
+from power_grid_model import ComponentType, initialize_array
+from power_grid_model.data_types import BatchDataset
+
+from power_grid_model_ds._core.data_source.generator.arrays.base import BaseGenerator
+from power_grid_model_ds._core.model.grids.base import Grid
+
+_MINUTES_PER_DAY = 24 * 60
+
+
+class LoadProfileGenerator(BaseGenerator):
+    """Generator for synthetic sym_load profiles, as power-grid-model batch update data.
+
+    The specified power of each load in the grid is scaled with a daily shape (with a morning and an evening peak),
+    a seasonal shape (with a peak in winter) and multiplicative noise per load and time step.
+    The profiles are generated chunk by chunk, so the memory use is bounded by the chunk size.
+
+    Examples:
+        >>> profile_generator = LoadProfileGenerator(grid, seed=0)
+        >>> chunks = profile_generator.run(n_steps=35_040, chunk_size=1_000)  # one year with a 15 minute resolution
+        >>> PowerGridModelInterface(grid).run_time_series(chunks, n_steps=35_040)
+    """
+
+    def __init__(self, grid: Grid, seed: int, noise: float = 0.05, seasonal_amplitude: float = 0.2) -> None:
+        super().__init__(grid=grid, seed=seed)
+        self.noise = noise
+        self.seasonal_amplitude = seasonal_amplitude
+
+    # pylint: disable=arguments-differ
+    def run(self, n_steps: int, chunk_size: int = 1000, resolution: int = 15) -> Iterator[BatchDataset]:
+        """Yield the sym_load update data of n_steps time steps, in dense batch datasets of chunk_size time steps.
+
+        Args:
+            n_steps: the total number of time steps.
+            chunk_size: the (maximum) number of time steps per chunk.
+            resolution: the duration of a time step in minutes. The first time step starts at January 1st, 00:00.
+
+        Yields:
+            BatchDataset: the sym_load update data of a chunk, with shape (chunk_steps, n_loads).
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size should be at least 1")
+        loads = self.grid.sym_load
+        for start in range(0, n_steps, chunk_size):
+            steps = np.arange(start, min(start + chunk_size, n_steps))
+            factors = self.get_load_shape(steps * resolution)[:, np.newaxis]
+            factors = factors * self.rng.normal(1.0, self.noise, (len(steps), len(loads)))
+
+            update = initialize_array("update", ComponentType.sym_load, (len(steps), len(loads)))
+            update["id"] = loads.id
+            update["p_specified"] = factors * loads.p_specified
+            update["q_specified"] = factors * loads.q_specified
+            yield {ComponentType.sym_load: update}
+
+    def get_load_shape(self, minutes: np.ndarray) -> np.ndarray:
+        """Return the load factor (without noise) at the given number of minutes since January 1st, 00:00.
+
+        The daily shape has an average of (about) 1.0.
+        """
+        hours = (minutes % _MINUTES_PER_DAY) / 60
+        days = minutes / _MINUTES_PER_DAY
+        daily = 1.0 + 0.15 * np.cos(2 * np.pi * (hours - 8) / 12) + 0.25 * np.cos(2 * np.pi * (hours - 19) / 24)
+        seasonal = 1.0 + self.seasonal_amplitude * np.cos(2 * np.pi * (days - 15) / 365)
+        return daily * seasonal
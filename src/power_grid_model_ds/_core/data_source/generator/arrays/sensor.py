@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Generator for sensor arrays"""
+
+import numpy as np
+from power_grid_model import ComponentType, MeasuredTerminalType
+
+from power_grid_model_ds._core.data_source.generator.arrays.base import BaseGenerator
+from power_grid_model_ds._core.power_grid_model_interface import PowerGridModelInterface
+from power_grid_model_ds.arrays import SymPowerSensorArray, SymVoltageSensorArray
+
+_VOLTAGE_SIGMA = 0.005
+"""The standard deviation of the voltage measurements, relative to the rated voltage."""
+
+_POWER_SIGMA = 0.05
+"""The standard deviation of the power measurements, relative to the measured apparent power."""
+
+_MIN_POWER_SIGMA = 1e3
+"""The minimum standard deviation of the power measurements in VA."""
+
+
+class SensorGenerator(BaseGenerator):
+    """Generator for sensor elements in the grid"""
+
+    # pylint: disable=arguments-differ
+    def run(self, amount: int) -> tuple[SymVoltageSensorArray, SymPowerSensorArray]:
+        """Generate voltage sensors on random nodes and power sensors on the loads and sources of those nodes.
+
+        The measured values are taken from a power flow calculation of the grid, with normally distributed noise
+        that matches the standard deviation of the sensors. The measurements are therefore consistent with each
+        other, so a state estimation with sensors on all nodes converges to the power flow solution.
+        """
+        output = PowerGridModelInterface(grid=self.grid).calculate_power_flow(
+            output_component_types=[ComponentType.node, ComponentType.sym_load, ComponentType.source]
+        )
+        node_mask = np.zeros(len(self.grid.node), dtype=bool)
+        node_mask[self.rng.choice(len(self.grid.node), amount, replace=False)] = True
+        node_output = _align(output[ComponentType.node], self.grid.node.id[node_mask])
+
+        voltage_sensor_array = self.grid.sym_voltage_sensor.__class__.zeros(amount)
+        voltage_sensor_array.id = 1 + self.grid.max_id + np.arange(amount)
+        voltage_sensor_array.measured_object = node_output["id"]
+        voltage_sensor_array.u_sigma = _VOLTAGE_SIGMA * self.grid.node.u_rated[node_mask]
+        voltage_sensor_array.u_measured = node_output["u"] + self.rng.normal(0, voltage_sensor_array.u_sigma)
+        voltage_sensor_array.u_angle_measured = np.nan
+
+        load_ids = self.grid.sym_load.id[np.isin(self.grid.sym_load.node, node_output["id"])]
+        source_ids = self.grid.source.id[np.isin(self.grid.source.node, node_output["id"])]
+        load_output = _align(output[ComponentType.sym_load], load_ids)
+        source_output = _align(output[ComponentType.source], source_ids)
+        power_output = {
+            name: np.concatenate((load_output[name], source_output[name])) for name in ("id", "p", "q", "s")
+        }
+        amount_power = len(power_output["id"])
+        power_sigma = np.maximum(_POWER_SIGMA * power_output["s"], _MIN_POWER_SIGMA)
+
+        power_sensor_array = self.grid.sym_power_sensor.__class__.zeros(amount_power)
+        power_sensor_array.id = 1 + voltage_sensor_array.id.max(initial=self.grid.max_id) + np.arange(amount_power)
+        power_sensor_array.measured_object = power_output["id"]
+        power_sensor_array.measured_terminal_type = np.repeat(
+            [MeasuredTerminalType.load, MeasuredTerminalType.source], [len(load_ids), len(source_ids)]
+        )
+        power_sensor_array.power_sigma = power_sigma
+        power_sensor_array.p_measured = power_output["p"] + self.rng.normal(0, power_sigma)
+        power_sensor_array.q_measured = power_output["q"] + self.rng.normal(0, power_sigma)
+        power_sensor_array.p_sigma = np.nan
+        power_sensor_array.q_sigma = np.nan
+
+        return voltage_sensor_array, power_sensor_array
+
+
+def _align(output: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """Return the output records of the given ids, in the order of the ids."""
+    sorter = np.argsort(output["id"], kind="stable")
+    return output[sorter[np.searchsorted(output["id"], ids, sorter=sorter)]]
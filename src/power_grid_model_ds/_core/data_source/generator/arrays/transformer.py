@@ -7,7 +7,7 @@
 import numpy as np
 
 from power_grid_model_ds._core.data_source.generator.arrays.base import BaseGenerator
-from power_grid_model_ds.arrays import TransformerArray
+from power_grid_model_ds.arrays import ThreeWindingTransformerArray, TransformerArray
 
 _V_10_5_KV: int = 10_500
 _V_3_KV: int = 3_000
@@ -37,3 +37,64 @@ class TransformerGenerator(BaseGenerator):
         transformer_array.pk = [100e3] * amount
 
         return transformer_array
+
+    def connect(self, from_nodes: np.ndarray, to_nodes: np.ndarray) -> TransformerArray:
+        """Generate transformers between the given (existing) nodes, rated at the voltages of those nodes"""
+        amount = len(from_nodes)
+        transformer_array = self.grid.transformer.__class__.zeros(amount)
+        transformer_array.id = 1 + self.grid.max_id + np.arange(amount)
+        transformer_array.from_node = from_nodes
+        transformer_array.to_node = to_nodes
+        transformer_array.from_status = 1
+        transformer_array.to_status = 1
+        transformer_array.u1 = self._get_u_rated(from_nodes)
+        transformer_array.u2 = self._get_u_rated(to_nodes)
+        transformer_array.sn = 30e6
+        transformer_array.clock = 12
+        transformer_array.uk = 0.203
+        transformer_array.pk = 100e3
+        return transformer_array
+
+    def connect_three_winding(
+        self, nodes_1: np.ndarray, nodes_2: np.ndarray, nodes_3: np.ndarray
+    ) -> ThreeWindingTransformerArray:
+        """Generate three-winding transformers between the given (existing) nodes"""
+        amount = len(nodes_1)
+        transformer_array = self.grid.three_winding_transformer.__class__.empty(amount)
+        transformer_array.id = 1 + self.grid.max_id + np.arange(amount)
+        transformer_array.node_1 = nodes_1
+        transformer_array.node_2 = nodes_2
+        transformer_array.node_3 = nodes_3
+        transformer_array.status_1 = 1
+        transformer_array.status_2 = 1
+        transformer_array.status_3 = 1
+        transformer_array.u1 = self._get_u_rated(nodes_1)
+        transformer_array.u2 = self._get_u_rated(nodes_2)
+        transformer_array.u3 = self._get_u_rated(nodes_3)
+        transformer_array.sn_1 = 30e6
+        transformer_array.sn_2 = 30e6
+        transformer_array.sn_3 = 30e6
+        transformer_array.uk_12 = 0.09
+        transformer_array.uk_13 = 0.06
+        transformer_array.uk_23 = 0.06
+        transformer_array.pk_12 = 100e3
+        transformer_array.pk_13 = 100e3
+        transformer_array.pk_23 = 100e3
+        transformer_array.i0 = 0
+        transformer_array.p0 = 0
+        transformer_array.winding_1 = 0
+        transformer_array.winding_2 = 0
+        transformer_array.winding_3 = 0
+        transformer_array.clock_12 = 0
+        transformer_array.clock_13 = 0
+        transformer_array.tap_side = 0
+        transformer_array.tap_pos = 0
+        transformer_array.tap_min = -10
+        transformer_array.tap_max = 10
+        transformer_array.tap_nom = 0
+        transformer_array.tap_size = 0.01 * transformer_array.u1
+        return transformer_array
+
+    def _get_u_rated(self, node_ids: np.ndarray) -> np.ndarray:
+        sorter = np.argsort(self.grid.node.id)
+        return self.grid.node.u_rated[sorter[np.searchsorted(self.grid.node.id, node_ids, sorter=sorter)]]
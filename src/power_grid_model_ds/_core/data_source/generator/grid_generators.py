@@ -4,17 +4,28 @@
 
 """Generators for the grid"""
 
+import math
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
 import numpy as np
 
 from power_grid_model_ds._core.data_source.generator.arrays.line import LineGenerator
 from power_grid_model_ds._core.data_source.generator.arrays.node import NodeGenerator
+from power_grid_model_ds._core.data_source.generator.arrays.sensor import SensorGenerator
 from power_grid_model_ds._core.data_source.generator.arrays.source import SourceGenerator
 from power_grid_model_ds._core.data_source.generator.arrays.transformer import TransformerGenerator
 from power_grid_model_ds._core.model.graphs.models.base import BaseGraphModel
 from power_grid_model_ds._core.model.graphs.models.rustworkx import RustworkxGraphModel
 from power_grid_model_ds._core.model.grids.base import Grid
 
-# pylint: disable=too-few-public-methods,too-many-arguments,too-many-positional-arguments
+# pylint: disable=too-few-public-methods,too-many-arguments,too-many-positional-arguments,too-many-locals
+
+_NR_THREE_WINDING_LEVELS = 3
+"""The number of voltage levels connected by a three-winding transformer."""
 
 
 class RadialGridGenerator[T: Grid]:
@@ -34,10 +45,12 @@ class RadialGridGenerator[T: Grid]:
         self.nr_sources = nr_sources
         self.nr_nops = nr_nops
 
-    def run(self, seed=None, create_10_3_kv_net: bool = False) -> T:
+    def run(self, seed=None, create_10_3_kv_net: bool = False, vectorized: bool = False) -> T:
         """Run the generator to create a random radial grid.
 
         if a seed is provided, this will be used to set rng.
+        Use vectorized=True to generate large grids (e.g. for load testing): the lines are then created in a
+        single pass per voltage level instead of one by one. This results in a different grid for the same seed.
         """
         grid = self.grid_class.empty(graph_model=self.graph_model)
 
@@ -55,7 +68,7 @@ class RadialGridGenerator[T: Grid]:
         grid.append(sources)
 
         # create lineArray
-        line_generator = LineGenerator(grid=grid, seed=seed)
+        line_generator = LineGenerator(grid=grid, seed=seed, vectorized=vectorized)
         lines = line_generator.run(amount=self.nr_nops)
         grid.append(lines)
 
@@ -74,3 +87,287 @@ class RadialGridGenerator[T: Grid]:
             grid.append(lines[~np.isin(lines.id, grid.line.id)])
 
         return grid
+
+    def generate_many(
+        self,
+        n: int,
+        seed: int | np.random.SeedSequence | None = None,
+        workers: int | None = None,
+        output_dir: Path | None = None,
+        **run_kwargs: Any,
+    ) -> list[T] | list[Path]:
+        """Generate n random radial grids in parallel (in a process pool).
+
+        Each grid gets an independent random stream, spawned from a single np.random.SeedSequence,
+        so the same seed always results in the same list of grids, regardless of the number of workers.
+
+        Args:
+            n: the number of grids to generate.
+            seed: the seed (or SeedSequence) from which the seeds of the grids are spawned.
+            workers: the number of worker processes. Defaults to the number of CPUs, 1 runs in the current process.
+            output_dir: if given, each grid is written as a binary (pickle) snapshot to this directory
+                ('grid_<index>.pkl') and the paths are returned instead of the grids.
+            **run_kwargs: passed on to RadialGridGenerator.run(), e.g. create_10_3_kv_net or vectorized.
+
+        Returns:
+            list[Grid] | list[Path]: the grids, or the paths of the snapshots if output_dir is given.
+        """
+        seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        seeds = seed_sequence.spawn(n)
+        if output_dir is None:
+            paths: list[Path | None] = [None] * n
+        else:
+            Path(output_dir).mkdir(parents=True, exist_ok=True)
+            paths = [Path(output_dir) / f"grid_{index:0{len(str(n - 1))}d}.pkl" for index in range(n)]
+
+        if workers == 1:
+            return [
+                _generate_grid(self, grid_seed, path, run_kwargs) for grid_seed, path in zip(seeds, paths, strict=True)
+            ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_generate_grid, [self] * n, seeds, paths, [run_kwargs] * n))
+
+
+def _generate_grid(
+    generator: RadialGridGenerator, seed: np.random.SeedSequence, path: Path | None, run_kwargs: dict[str, Any]
+):
+    """Generate a single grid (in a worker process) and optionally write it to path."""
+    grid = generator.run(seed=seed, **run_kwargs)
+    if path is None:
+        return grid
+    with path.open("wb") as file:
+        pickle.dump(grid, file, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+@dataclass
+class MeshedGridStatistics:  # pylint: disable=too-many-instance-attributes
+    """Target statistics of a grid generated by the MeshedGridGenerator"""
+
+    nr_nodes: int = 1000
+    """The number of (non-substation) nodes, spread evenly over the voltage levels."""
+
+    voltage_levels: tuple[int, ...] = (10_500, 3_000)
+    """The rated voltages in V, from high to low. The sources are connected to the first level."""
+
+    nr_sources: int = 2
+    """The number of sources (substations)."""
+
+    average_feeder_size: float = 20.0
+    """The average number of nodes per feeder. Feeders of lower voltage levels start at a transformer."""
+
+    feeder_size_sigma: float = 0.5
+    """The spread of the feeder sizes: the sizes follow a lognormal distribution with this shape parameter."""
+
+    branching_probability: float = 0.3
+    """The probability that a node branches off from a random earlier node of its feeder, instead of extending
+    the feeder from the previous node. Lower values result in longer feeders."""
+
+    load_per_node: float = 30e3
+    """The average active power of the load of a node of the first voltage level in W. The loads and the line
+    impedances of lower voltage levels scale with the rated voltage, so that the relative voltage drop is similar
+    on all voltage levels."""
+
+    cycles_per_feeder: float = 0.5
+    """The average number of cycles (extra active lines within a feeder) per feeder."""
+
+    nops_per_feeder: float = 0.5
+    """The average number of normally open points (inactive lines within a voltage level) per feeder."""
+
+    nr_three_winding_transformers: int = 0
+    """The number of feeders of the second and third voltage level that are fed by a three-winding transformer
+    from the first voltage level, instead of by two-winding transformers. Requires three voltage levels or more."""
+
+    sensors_per_node: float = 0.0
+    """The fraction of nodes with a voltage sensor. The loads and sources of those nodes get a power sensor."""
+
+
+class MeshedGridGenerator[T: Grid]:
+    """Generates a random meshed grid with multiple voltage levels, based on target statistics.
+
+    All arrays are constructed vectorized, so grids with a large number of nodes can be generated quickly.
+
+    Examples:
+        >>> statistics = MeshedGridStatistics(nr_nodes=10_000, voltage_levels=(20_000, 10_500, 3_000))
+        >>> grid = MeshedGridGenerator(grid_class=Grid, statistics=statistics).run(seed=0)
+    """
+
+    def __init__(
+        self,
+        grid_class: type[T],
+        statistics: MeshedGridStatistics | None = None,
+        graph_model: type[BaseGraphModel] = RustworkxGraphModel,
+    ):
+        self.grid_class = grid_class
+        self.statistics = statistics or MeshedGridStatistics()
+        self.graph_model = graph_model
+
+    def run(self, seed=None) -> T:
+        """Run the generator to create a random meshed grid.
+
+        if a seed is provided, this will be used to set rng.
+        """
+        statistics = self.statistics
+        nr_levels = len(statistics.voltage_levels)
+        if statistics.nr_nodes < nr_levels:
+            raise ValueError("nr_nodes should be at least the number of voltage levels")
+        if statistics.nr_three_winding_transformers and nr_levels < _NR_THREE_WINDING_LEVELS:
+            raise ValueError("Three-winding transformers require at least three voltage levels")
+
+        grid = self.grid_class.empty(graph_model=self.graph_model)
+        rng = np.random.default_rng(seed)
+        level_sizes = np.diff(np.linspace(0, statistics.nr_nodes, nr_levels + 1).round().astype(int))
+        nr_feeders = [math.ceil(size / statistics.average_feeder_size) for size in level_sizes]
+        level_node_ids = [
+            self._add_nodes(grid, int(size), voltage_level, rng).id
+            for size, voltage_level in zip(level_sizes, statistics.voltage_levels, strict=True)
+        ]
+        substation_nodes, sources = SourceGenerator(grid=grid, seed=seed).run(amount=statistics.nr_sources)
+        substation_nodes.u_rated = statistics.voltage_levels[0]
+        grid.append(substation_nodes)
+        grid.append(sources)
+
+        # first voltage level: feeders start at the substations, each substation has at least one feeder
+        extra_roots = rng.choice(sources.node, max(nr_feeders[0] - statistics.nr_sources, 0))
+        feeder_roots = [np.concatenate((sources.node, extra_roots))]
+        # lower voltage levels: feeders start at a node that is fed by a transformer from the level above
+        feeder_roots += [
+            rng.choice(node_ids, level_feeders, replace=False)
+            for node_ids, level_feeders in zip(level_node_ids[1:], nr_feeders[1:], strict=True)
+        ]
+        nr_three_winding = self._add_three_winding_transformers(grid, feeder_roots, rng)
+        line_generator = LineGenerator(grid=grid, seed=seed)
+        feeder_node_ids, feeder_labels = [], []
+        for level_index, (node_ids, level_roots) in enumerate(zip(level_node_ids, feeder_roots, strict=True)):
+            if level_index:
+                fed_by_three_winding = nr_three_winding if level_index < _NR_THREE_WINDING_LEVELS else 0
+                self._add_transformers(grid, level_roots[fed_by_three_winding:], level_index, rng)
+            from_nodes, to_nodes, feeders = self._draw_feeder_lines(
+                level_roots, node_ids[~np.isin(node_ids, level_roots)], rng
+            )
+            self._add_lines(grid, line_generator, from_nodes, to_nodes)
+            feeder_node_ids.append(to_nodes)
+            feeder_labels.append(feeders + sum(nr_feeders[:level_index]))
+
+        # meshing: cycles within a feeder and normally open points between nodes of the same voltage level
+        from_nodes, to_nodes = _draw_node_pairs(
+            np.concatenate(feeder_node_ids),
+            np.concatenate(feeder_labels),
+            round(statistics.cycles_per_feeder * sum(nr_feeders)),
+            rng,
+        )
+        self._add_lines(grid, line_generator, from_nodes, to_nodes)
+        from_nodes, to_nodes = _draw_node_pairs(
+            grid.node.id, grid.node.u_rated, round(statistics.nops_per_feeder * sum(nr_feeders)), rng
+        )
+        self._add_lines(grid, line_generator, from_nodes, to_nodes, active=False)
+
+        if nr_sensors := round(statistics.sensors_per_node * len(grid.node)):
+            voltage_sensors, power_sensors = SensorGenerator(grid=grid, seed=seed).run(amount=nr_sensors)
+            grid.append(voltage_sensors)
+            grid.append(power_sensors)
+        return grid
+
+    def _add_nodes(self, grid: Grid, amount: int, voltage_level: int, rng: np.random.Generator):
+        """Add nodes with a (consuming) load. The loads scale with the voltage level, see load_per_node."""
+        node_generator = NodeGenerator(grid=grid, seed=int(rng.integers(2**32)))
+        nodes, loads, _loads_high = node_generator.run(amount=amount, voltage_level=voltage_level)
+        # lognormal loads with a mean of load_per_node (scaled) and a power factor between 0.93 and 0.99
+        mean_load = self.statistics.load_per_node * self._get_level_scale(voltage_level)
+        loads.p_specified = np.round(mean_load * rng.lognormal(-0.125, 0.5, amount))
+        loads.q_specified = np.round(loads.p_specified * rng.uniform(0.15, 0.4, amount))
+        grid.append(nodes)
+        grid.append(loads)
+        return nodes
+
+    def _add_lines(
+        self,
+        grid: Grid,
+        line_generator: LineGenerator,
+        from_nodes: np.ndarray,
+        to_nodes: np.ndarray,
+        active: bool = True,
+    ) -> None:
+        """Add lines between the given nodes, with impedances that scale with the voltage level of the nodes."""
+        line_generator.line_array = grid.line
+        lines = line_generator.connect(from_nodes, to_nodes, active=active)
+        sorter = np.argsort(grid.node.id, kind="stable")
+        u_rated = grid.node.u_rated[sorter[np.searchsorted(grid.node.id, from_nodes, sorter=sorter)]]
+        scale = self._get_level_scale(u_rated)
+        lines.r1 = lines.r1 * scale
+        lines.x1 = lines.x1 * scale
+        grid.append(lines)
+
+    def _get_level_scale(self, voltage_level):
+        """The scale of the loads and line impedances of a voltage level, relative to the first voltage level."""
+        return np.asarray(voltage_level) / self.statistics.voltage_levels[0]
+
+    def _add_three_winding_transformers(
+        self, grid: Grid, feeder_roots: list[np.ndarray], rng: np.random.Generator
+    ) -> int:
+        """Feed the first feeder roots of the second and third voltage level from the first voltage level."""
+        if not self.statistics.nr_three_winding_transformers:
+            return 0
+        amount = min(self.statistics.nr_three_winding_transformers, len(feeder_roots[1]), len(feeder_roots[2]))
+        nodes_1 = rng.choice(grid.node.id[grid.node.u_rated == self.statistics.voltage_levels[0]], amount)
+        transformer_generator = TransformerGenerator(grid=grid, seed=int(rng.integers(2**32)))
+        grid.append(
+            transformer_generator.connect_three_winding(nodes_1, feeder_roots[1][:amount], feeder_roots[2][:amount])
+        )
+        return amount
+
+    def _add_transformers(
+        self, grid: Grid, feeder_roots: np.ndarray, level_index: int, rng: np.random.Generator
+    ) -> None:
+        """Feed the feeder roots from random nodes of the level above."""
+        from_options = grid.node.id[grid.node.u_rated == self.statistics.voltage_levels[level_index - 1]]
+        transformer_generator = TransformerGenerator(grid=grid, seed=int(rng.integers(2**32)))
+        grid.append(transformer_generator.connect(rng.choice(from_options, len(feeder_roots)), feeder_roots))
+
+    def _draw_feeder_lines(
+        self, feeder_roots: np.ndarray, node_ids: np.ndarray, rng: np.random.Generator
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Distribute the nodes over feeders that start at the feeder roots and draw the lines of the feeders.
+
+        The feeder sizes follow a lognormal distribution. Within a feeder, each node extends the feeder from the
+        previous node, or branches off from a random earlier node of the feeder (or the root).
+
+        Returns:
+            the from nodes and to nodes of the lines, and the index of the feeder (root) of each to node.
+        """
+        nr_feeders = len(feeder_roots)
+        weights = rng.lognormal(0.0, self.statistics.feeder_size_sigma, nr_feeders)
+        # every feeder gets at least one node, if there are enough nodes
+        minimum = int(len(node_ids) >= nr_feeders)
+        sizes = minimum + rng.multinomial(len(node_ids) - minimum * nr_feeders, weights / weights.sum())
+        starts = np.cumsum(sizes) - sizes
+        feeders = np.repeat(np.arange(nr_feeders), sizes)
+        positions = np.arange(len(node_ids)) - starts[feeders]
+
+        # the position of the parent within the feeder, where -1 is the root
+        parent_positions = positions - 1
+        branches = rng.random(len(node_ids)) < self.statistics.branching_probability
+        parent_positions[branches] = (rng.random(branches.sum()) * (positions[branches] + 1)).astype(np.int64) - 1
+
+        to_nodes = rng.permutation(node_ids)
+        parent_nodes = to_nodes[np.maximum(starts[feeders] + parent_positions, 0)]
+        from_nodes = np.where(parent_positions < 0, feeder_roots[feeders], parent_nodes)
+        return from_nodes, to_nodes, feeders
+
+
+def _draw_node_pairs(
+    node_ids: np.ndarray, groups: np.ndarray, amount: int, rng: np.random.Generator
+) -> tuple[np.ndarray, np.ndarray]:
+    """Draw pairs of different random nodes within the same group (e.g. feeder or rated voltage)."""
+    if not len(node_ids):
+        return node_ids, node_ids
+    order = np.argsort(groups, kind="stable")
+    node_ids = node_ids[order]
+    _, starts, counts = np.unique(groups[order], return_index=True, return_counts=True)
+
+    first = rng.integers(0, len(node_ids), amount)
+    group = np.searchsorted(starts, first, side="right") - 1
+    # a random non-zero offset within the group guarantees a different node (if the group has more than one node)
+    second = starts[group] + (first - starts[group] + rng.integers(1, np.maximum(counts[group], 2))) % counts[group]
+    different = first != second
+    return node_ids[first[different]], node_ids[second[different]]
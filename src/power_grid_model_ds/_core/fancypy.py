@@ -48,6 +48,7 @@ def unique[T: FancyArray](array: T, **kwargs):
 def sort[T: FancyArray](array: T, axis=-1, kind=None, order=None) -> T:
     """Sort the array in-place and return sorted array."""
     array.data.sort(axis=axis, kind=kind, order=order)
+    array.mark_modified()
     return array
 
 
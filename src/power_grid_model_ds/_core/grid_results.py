@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Stores the GridResults class"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from power_grid_model.data_types import Dataset
+
+from power_grid_model_ds._core.time_series import create_memmap
+from power_grid_model_ds._core.utils.fields import copy_fields
+
+if TYPE_CHECKING:
+    from power_grid_model_ds._core.model.grids.base import Grid
+
+
+class GridResults:
+    """Store of (batch) calculation output per component, aligned with the arrays of a grid.
+
+    Each component holds a structured array with shape (n_scenarios, n_elements), in which the elements are ordered
+    as in the corresponding grid array. Results can be reduced over the scenarios without creating Grid objects.
+
+    Examples:
+        >>> output = PowerGridModelInterface(grid).calculate_power_flow(update_data=update_data)
+        >>> results = GridResults.from_output(output, grid)
+        >>> results.max("line", "loading")  # maximum loading per line over all scenarios
+        >>> results.argmax("line", "loading")  # scenario in which the maximum occurs
+        >>> results.write_scenario(grid, scenario=3)  # write the output of scenario 3 into the grid
+    """
+
+    def __init__(self, data: dict[str, np.ndarray]):
+        self._data = data
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(n_scenarios={self.n_scenarios}, components={self.components})"
+
+    @classmethod
+    def from_output(cls, output_data: Dataset, grid: "Grid | None" = None, output_dir: Path | None = None):
+        """Create a GridResults from the (batch) output of a power-grid-model calculation.
+
+        Args:
+            output_data: the output dataset. Single-scenario output is treated as a batch of one scenario.
+            grid: if given, the elements of each component are ordered as in the corresponding grid array.
+            output_dir: if given, the results are stored in memory-mapped .npy files ('<component>.npy')
+                in this directory instead of in memory.
+
+        Raises:
+            ValueError: if the output does not contain all elements of the grid arrays.
+        """
+        data: dict[str, np.ndarray] = {}
+        for component, output_array in output_data.items():
+            if not isinstance(output_array, np.ndarray):
+                raise NotImplementedError(f"Columnar output is not supported ({component}).")
+            array = output_array.reshape(1, -1) if output_array.ndim == 1 else output_array
+            positions = None
+            if grid is not None and hasattr(grid, component):
+                positions = _get_aligned_positions(array, getattr(grid, component).id)
+            if output_dir is not None:
+                array = _write_memmap(Path(output_dir) / f"{component}.npy", array, positions)
+            elif positions is not None:
+                array = array[:, positions]
+            data[str(component)] = array
+        return cls(data)
+
+    @classmethod
+    def load(cls, output_dir: Path) -> "GridResults":
+        """Open (read-only) results that were stored in output_dir with GridResults.from_output()."""
+        return cls({path.stem: np.load(path, mmap_mode="r") for path in sorted(Path(output_dir).glob("*.npy"))})
+
+    @property
+    def components(self) -> list[str]:
+        """The components in the results."""
+        return list(self._data)
+
+    @property
+    def n_scenarios(self) -> int:
+        """The number of scenarios."""
+        return next((array.shape[0] for array in self._data.values()), 0)
+
+    def ids(self, component: str) -> np.ndarray:
+        """The ids of the elements of a component."""
+        return self._data[component]["id"][0] if self.n_scenarios else np.empty(0, dtype=np.int32)
+
+    def get(self, component: str, attribute: str | None = None) -> np.ndarray:
+        """Get the results of a component, or of a single attribute, with shape (n_scenarios, n_elements)."""
+        array = self._data[component]
+        return array if attribute is None else array[attribute]
+
+    def scenario(self, index: int) -> Dataset:
+        """Get the output of a single scenario, as a single dataset."""
+        return {component: array[index] for component, array in self._data.items()}
+
+    def max(self, component: str, attribute: str) -> np.ndarray:
+        """Maximum value per element over all scenarios (NaN values are ignored)."""
+        return np.nanmax(self.get(component, attribute), axis=0)
+
+    def min(self, component: str, attribute: str) -> np.ndarray:
+        """Minimum value per element over all scenarios (NaN values are ignored)."""
+        return np.nanmin(self.get(component, attribute), axis=0)
+
+    def argmax(self, component: str, attribute: str) -> np.ndarray:
+        """Scenario index of the maximum value per element (NaN values are ignored)."""
+        values = self.get(component, attribute)
+        return np.argmax(np.where(np.isnan(values), -np.inf, values), axis=0)
+
+    def argmin(self, component: str, attribute: str) -> np.ndarray:
+        """Scenario index of the minimum value per element (NaN values are ignored)."""
+        values = self.get(component, attribute)
+        return np.argmin(np.where(np.isnan(values), np.inf, values), axis=0)
+
+    def max_loading(self) -> dict[str, np.ndarray]:
+        """Maximum loading per element over all scenarios, for all components with a loading."""
+        return {
+            component: self.max(component, "loading")
+            for component, array in self._data.items()
+            if "loading" in (array.dtype.names or ())
+        }
+
+    def u_pu_range(self) -> tuple[np.ndarray, np.ndarray]:
+        """Minimum and maximum u_pu per node over all scenarios."""
+        return self.min("node", "u_pu"), self.max("node", "u_pu")
+
+    def write_scenario(self, grid: "Grid", scenario: int) -> None:
+        """Write the output of a single scenario into the matching columns of the grid arrays.
+
+        The results must have been aligned with the same grid (see GridResults.from_output).
+        """
+        for component, array in self._data.items():
+            if not hasattr(grid, component):
+                continue
+            grid_array = getattr(grid, component)
+            if copy_fields(array[scenario], grid_array.data):
+                grid_array.mark_modified()
+
+
+def _write_memmap(path: Path, array: np.ndarray, positions: np.ndarray | None) -> np.memmap:
+    """Write a batch output array into a memory-mapped file, with the elements (columns) in the given order.
+
+    The array is reordered scenario by scenario, so no reordered copy of the full array is made in memory.
+    """
+    memmap = create_memmap(path, array.dtype, array.shape)
+    if positions is None:
+        memmap[...] = array
+    else:
+        for scenario, scenario_array in enumerate(array):
+            memmap[scenario] = scenario_array[positions]
+    return memmap
+
+
+def _get_aligned_positions(array: np.ndarray, ids: np.ndarray) -> np.ndarray | None:
+    """Get the positions of the elements (columns) of a batch output array that match the given ids.
+
+    Returns None if the elements are already in the order of the ids.
+    """
+    output_ids = array["id"][0] if array.shape[0] else np.empty(0, dtype=ids.dtype)
+    if np.array_equal(output_ids, ids):
+        return None
+    sorter = np.argsort(output_ids)
+    positions = sorter[np.searchsorted(output_ids, ids, sorter=sorter).clip(max=max(len(output_ids) - 1, 0))]
+    if len(output_ids) != len(ids) or not np.array_equal(output_ids[positions], ids):
+        raise ValueError("The output does not match the ids of the grid.")
+    return positions
@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Module for conversion between structured arrays and Arrow tables."""
+
+from typing import Any
+
+import numpy as np
+
+from power_grid_model_ds._core.model.arrays.base._optional import pa
+from power_grid_model_ds._core.model.constants import empty
+
+
+def convert_array_to_arrow(array: np.ndarray) -> Any:
+    """Convert a structured array to a pyarrow Table with a column per field.
+
+    Columns with a fixed shape (e.g. the three phases of NDArray3 columns) become fixed-size lists.
+    The structured layout interleaves the columns, so each column is copied once into a contiguous buffer.
+    That buffer is used by Arrow without a further copy (except for booleans, which Arrow stores as bits).
+    """
+    if pa is None:
+        raise ImportError("pyarrow is not installed")
+    columns = {}
+    for name in array.dtype.names or ():
+        column = np.ascontiguousarray(array[name])
+        if column.ndim == 1:
+            columns[name] = pa.array(column)
+        else:
+            values = pa.array(column.reshape(-1))
+            columns[name] = pa.FixedSizeListArray.from_arrays(values, int(np.prod(column.shape[1:])))
+    return pa.table(columns)
+
+
+def convert_arrow_to_array(table: Any, dtype: np.dtype) -> np.ndarray:
+    """Convert the columns of a pyarrow Table that are in dtype to a structured array (with only those columns).
+
+    Numeric columns without nulls are read from Arrow without a copy where Arrow allows it,
+    and then copied once into the structured array. Null values are replaced by the 'empty' value of the column.
+    """
+    if pa is None:
+        raise ImportError("pyarrow is not installed")
+    names = [name for name in table.column_names if name in (dtype.names or ())]
+    array = np.zeros(table.num_rows, dtype=[(name, dtype[name]) for name in names])
+    for name in names:
+        field_dtype = dtype[name]
+        column = table.column(name).combine_chunks()
+        if pa.types.is_fixed_size_list(column.type):
+            if column.null_count:
+                column = column.fill_null(
+                    pa.scalar([empty(field_dtype.base.type)] * column.type.list_size, column.type)
+                )
+            values = _fill_null(column.flatten(), field_dtype.base).to_numpy(zero_copy_only=False)
+            array[name] = values.reshape(-1, *field_dtype.shape)
+        else:
+            array[name] = _fill_null(column, field_dtype).to_numpy(zero_copy_only=False)
+    return array
+
+
+def _fill_null(values: Any, dtype: np.dtype) -> Any:
+    """Replace the null values of a pyarrow array with the 'empty' value of dtype."""
+    if not values.null_count:
+        return values
+    return values.fill_null(pa.scalar(empty(dtype.type), values.type))
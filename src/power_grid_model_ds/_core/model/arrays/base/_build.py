@@ -11,6 +11,7 @@ from typing import Any
 import numpy as np
 
 from power_grid_model_ds._core.model.constants import empty
+from power_grid_model_ds._core.utils.fields import copy_fields
 from power_grid_model_ds._core.utils.misc import is_sequence
 
 _logger = logging.getLogger(__name__)
@@ -80,23 +81,15 @@ def _fill_with_kwargs(array: np.ndarray, kwargs: dict[str, np.ndarray]):
 
 
 def _parse_structured_array(from_array: np.ndarray, to_array: np.ndarray) -> np.ndarray:
-    shared_columns, ignored_columns = _determine_column_overlap(from_array, to_array)
-    if ignored_columns:
+    shared_columns = copy_fields(from_array, to_array)
+    if len(shared_columns) < len(from_array.dtype.names or ()):
+        ignored_columns = set(from_array.dtype.names or ()) - set(shared_columns)
         _logger.debug(
             "Ignored provided columns %s during build of array with columns %s", ignored_columns, to_array.dtype.names
         )
-    to_array[shared_columns] = from_array[shared_columns]  # type: ignore[index]
     return to_array
 
 
-def _determine_column_overlap(from_array: np.ndarray, to_array: np.ndarray) -> tuple[list[str], list[str]]:
-    """Returns two lists: columns present in both arrays and the columns that are only present in from_array"""
-    from_columns = set(from_array.dtype.names or ())
-    to_columns = set(to_array.dtype.names or ())
-
-    return list(from_columns & to_columns), list(from_columns - to_columns)
-
-
 def _parse_array(array: np.ndarray, dtype: np.dtype):
     if len(array.shape) == 1 and array.dtype == dtype:
         return array
@@ -9,4 +9,9 @@ try:
 except ImportError:
     pd = None  # pylint: disable=invalid-name
 
-__all__ = ["pd"]
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None  # pylint: disable=invalid-name
+
+__all__ = ["pa", "pd"]
@@ -2,17 +2,20 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
+import hashlib
 from abc import ABC
 from collections import namedtuple
 from collections.abc import Iterable
 from copy import copy
 from functools import lru_cache
+from itertools import count
 from typing import Any, ClassVar, Literal, TypeVar, get_args, get_origin, overload
 
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
 from packaging import version
 
+from power_grid_model_ds._core.model.arrays.base._arrow import convert_array_to_arrow, convert_arrow_to_array
 from power_grid_model_ds._core.model.arrays.base._build import build_array
 from power_grid_model_ds._core.model.arrays.base._filters import apply_exclude, apply_filter, apply_get, get_filter_mask
 from power_grid_model_ds._core.model.arrays.base._modify import check_ids, re_order, update_by_id
@@ -24,6 +27,7 @@ from power_grid_model_ds._core.utils.misc import (
     array_equal_with_nan,
     combine_attribute_from_parent_classes,
     get_public_annotations,
+    update_digest_with_array,
 )
 
 # pylint: disable=missing-function-docstring, too-many-public-methods
@@ -32,6 +36,9 @@ _RESERVED_COLUMN_NAMES: set = set(dir(np.array([]))).union({"data"})
 _DEFAULT_STR_LENGTH: int = 50
 _MAX_DATA_SIZE: int = 3
 
+# Shared by all arrays, so that a newly created array never has the version of the array it replaces.
+_VERSION_COUNTER = count(1)
+
 Column = NDArray
 
 Self = TypeVar("Self", bound="FancyArray")
@@ -71,9 +78,16 @@ class FancyArray(ABC):  # noqa: B024
 
     Extra note on string-columns:
         Where possible, it is recommended use IntEnum's instead of string-columns to reduce memory usage.
+
+    Note on versions:
+        Each array has a version that increases whenever the array is modified through the FancyArray interface
+        (setting a column, setting items, update_by_id, etc.). This can be used to invalidate derived structures.
+        In-place modifications through numpy views (e.g. array.column[mask] = value or array.data[...] = value)
+        are not tracked. Call mark_modified() after such modifications.
     """
 
     _data: NDArray = np.ndarray([])
+    _version: int = 0
     _defaults: ClassVar[dict[str, Any]] = {}
     _str_lengths: ClassVar[dict[str, int]] = {}
     _id_columns: ClassVar[set[str]] = set()
@@ -88,6 +102,28 @@ class FancyArray(ABC):  # noqa: B024
     def data(self) -> NDArray:
         return self._data
 
+    @property
+    def version(self) -> int:
+        """Monotonically increasing version of the array. Changes on every (tracked) modification."""
+        return self._version
+
+    def fingerprint(self) -> str:
+        """Returns a hash (hex digest) of the class and content of the array.
+
+        Arrays that are equal (see __eq__, NaN values are considered equal) have the same fingerprint,
+        which makes it usable as a cache key. The content is hashed with blake2b, column by column.
+        """
+        digest = hashlib.blake2b(self.__class__.__name__.encode(), digest_size=16)
+        update_digest_with_array(digest, self._data)
+        return digest.hexdigest()
+
+    def mark_modified(self) -> None:
+        """Increase the version of the array.
+
+        Use this after modifying the data in-place through a numpy view, which cannot be tracked automatically.
+        """
+        self._version = next(_VERSION_COUNTER)
+
     @classmethod
     @lru_cache
     def get_defaults(cls) -> dict[str, Any]:
@@ -177,13 +213,16 @@ class FancyArray(ABC):  # noqa: B024
         return getattr(self._data, attr)
 
     def __setattr__(self: Self, attr: str, value: object) -> None:
-        if attr in ["_data", "_defaults"]:
+        if attr in ["_data", "_defaults", "_version"]:
             super().__setattr__(attr, value)
+            if attr == "_data":
+                self.mark_modified()
             return
         try:
             self._data[attr] = value  # type: ignore[call-overload]
         except (AttributeError, ValueError) as error:
             raise AttributeError(f"Cannot set attribute {attr} on {self.__class__.__name__}") from error
+        self.mark_modified()
 
     @overload
     def __getitem__(
@@ -216,7 +255,8 @@ class FancyArray(ABC):  # noqa: B024
     def __setitem__(self: Self, key, value):
         if isinstance(value, FancyArray):
             value = value.data
-        return self._data.__setitem__(key, value)
+        self._data.__setitem__(key, value)
+        self.mark_modified()
 
     def __contains__(self: Self, item: Self) -> bool:
         if isinstance(item, FancyArray):
@@ -224,7 +264,7 @@ class FancyArray(ABC):  # noqa: B024
         return False
 
     def __hash__(self):
-        return hash(f"{self.__class__} {self}")
+        return hash(self.fingerprint())
 
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -287,6 +327,7 @@ class FancyArray(ABC):  # noqa: B024
         """Set a column to its 'empty' value."""
         array_dtype = self.get_dtype()
         self._data[column] = empty(array_dtype[column])  # type: ignore[call-overload]
+        self.mark_modified()
 
     @property
     def columns(self) -> list[str]:
@@ -356,6 +397,7 @@ class FancyArray(ABC):  # noqa: B024
             _ = update_by_id(self._data, ids, allow_missing, **kwargs)
         except ValueError as error:
             raise ValueError(f"Cannot update {self.__class__.__name__}. {error}") from error
+        self.mark_modified()
 
     def get_updated_by_id(self: Self, ids: ArrayLike, allow_missing: bool = False, **kwargs) -> Self:
         try:
@@ -376,6 +418,19 @@ class FancyArray(ABC):  # noqa: B024
             raise ImportError("pandas is not installed")
         return pd.DataFrame(self._data)
 
+    def as_arrow(self):
+        """Convert to a pyarrow Table. Columns with multiple values per record (e.g. NDArray3) are fixed-size lists."""
+        return convert_array_to_arrow(self._data)
+
+    @classmethod
+    def from_arrow(cls: type[Self], table) -> Self:
+        """Create an instance from a pyarrow Table (e.g. as created with .as_arrow()).
+
+        Columns that are not in the array are ignored, missing columns get their default value
+        and null values are replaced by the 'empty' value of the column.
+        """
+        return cls(convert_arrow_to_array(table, cls.get_dtype()))
+
     @classmethod
     def from_extended(cls: type[Self], extended: Self) -> Self:
         """Create an instance from an extended array."""
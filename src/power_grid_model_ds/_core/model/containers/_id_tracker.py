@@ -4,6 +4,8 @@
 
 """Tracks a set of ids and its maximum value."""
 
+import numpy as np
+
 
 class IdTracker:
     """Wrapper around a set of ids that keeps track of the maximum id."""
@@ -15,6 +17,14 @@ class IdTracker:
         self._ids = set(ids) if ids is not None else set()
         self._max_id = max(self._ids) if self._ids else 0
 
+    @classmethod
+    def from_array(cls, ids: np.ndarray) -> "IdTracker":
+        """Initialize the tracker from an array of ids. The maximum id is taken from the array."""
+        tracker = cls()
+        tracker._ids = set(ids.tolist())
+        tracker._max_id = int(ids.max(initial=0))
+        return tracker
+
     @property
     def ids(self) -> set[int]:
         """Return the tracked ids."""
@@ -5,6 +5,7 @@
 """Stores the FancyArrayContainer class"""
 
 import dataclasses
+import hashlib
 import inspect
 import logging
 from dataclasses import dataclass
@@ -39,6 +40,43 @@ class FancyArrayContainer:
             return False
         return container_equal(self, other, ignore_extras=False, early_exit=True)
 
+    def __setattr__(self, name: str, value) -> None:
+        # (Re)assigning an array counts as a modification, also when the same array object is assigned again.
+        if isinstance(value, FancyArray):
+            value.mark_modified()
+        super().__setattr__(name, value)
+
+    @property
+    def array_versions(self) -> dict[str, int]:
+        """Returns the version of each array in the container, by field name.
+
+        Can be stored and compared later on to find out which arrays have been modified in the meantime.
+        See FancyArray.version for which modifications are tracked.
+        """
+        return {
+            field.name: attribute.version
+            for field in dataclasses.fields(self)
+            if isinstance(attribute := getattr(self, field.name, None), FancyArray)
+        }
+
+    @property
+    def version(self) -> int:
+        """Returns the version of the container, which increases whenever one of its arrays is modified."""
+        return max(self.array_versions.values(), default=0)
+
+    def fingerprint(self) -> str:
+        """Returns a hash (hex digest) of the class and the content of all arrays in the container.
+
+        Containers with equal arrays have the same fingerprint, so it can be used as a cache key
+        (e.g. for constructed models or calculation results). See FancyArray.fingerprint().
+        """
+        digest = hashlib.blake2b(self.__class__.__name__.encode(), digest_size=16)
+        for field in dataclasses.fields(self):
+            attribute = getattr(self, field.name, None)
+            if isinstance(attribute, FancyArray):
+                digest.update(f"{field.name}:{attribute.fingerprint()}".encode())
+        return digest.hexdigest()
+
     @property
     def ids(self):
         """Returns the ids across all arrays"""
@@ -49,24 +87,36 @@ class FancyArrayContainer:
         """Returns the cached max id across all arrays within the container."""
         return self._id_tracker.max_id
 
-    def rebuild_ids(self) -> None:
+    def rebuild_ids(self, check_ids: bool = True) -> None:
         """Rebuild the id tracker based on the arrays in the container.
 
+        Args:
+            check_ids: whether to check for duplicate ids between arrays. Use False if the ids have already been
+                validated, e.g. with check_ids().
+
         Raises:
-            ValueError: if duplicate ids are found between or within arrays.
+            ValueError: if duplicate ids are found between arrays.
         """
-        new_ids: set[int] = set()
-
-        for array in self.all_arrays():
-            if not hasattr(array, "id"):
-                continue
-
-            array_ids = set(array.id.tolist())
-            if array_ids & new_ids:
-                raise ValueError(f"Duplicate ids found between arrays ({array.__class__.__name__})")
-            new_ids |= array_ids
+        id_arrays = [array for array in self.all_arrays() if hasattr(array, "id")]
+        if not id_arrays:
+            self._id_tracker = IdTracker()
+            return
+        if not check_ids:
+            self._id_tracker = IdTracker.from_array(np.concatenate([array.id for array in id_arrays]))
+            return
 
-        self._id_tracker = IdTracker(new_ids)
+        unique_ids_per_array = [np.unique(array.id) for array in id_arrays]
+        all_ids = np.concatenate(unique_ids_per_array)
+        sorter = np.argsort(all_ids, kind="stable")
+        sorted_ids = all_ids[sorter]
+        # positions of ids that already occurred in an earlier array (the sort is stable)
+        duplicate_positions = sorter[1:][sorted_ids[1:] == sorted_ids[:-1]]
+        if duplicate_positions.size:
+            array_indices = np.repeat(np.arange(len(id_arrays)), [len(ids) for ids in unique_ids_per_array])
+            array = id_arrays[array_indices[duplicate_positions].min()]
+            raise ValueError(f"Duplicate ids found between arrays ({array.__class__.__name__})")
+
+        self._id_tracker = IdTracker.from_array(sorted_ids)
 
     def check_ids(self, check_between_arrays: bool = True, check_within_arrays: bool = True) -> None:
         """Checks for duplicate id values across all arrays in the container.
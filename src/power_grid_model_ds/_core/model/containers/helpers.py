@@ -41,7 +41,9 @@ def container_equal(
     is_equal = True
 
     for field in fields(container_a):
-        if field.name in fields_to_ignore or (ignore_extras and not hasattr(container_b, field.name)):
+        if not field.compare or field.name in fields_to_ignore:
+            continue
+        if ignore_extras and not hasattr(container_b, field.name):
             continue
 
         if not _fields_are_equal(container_a, container_b, field, ignore_extras):
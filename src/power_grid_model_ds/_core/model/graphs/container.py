@@ -131,11 +131,16 @@ class GraphContainer:
         return cls.from_grid(arrays)
 
     @classmethod
-    def from_grid(cls, grid: "Grid") -> "GraphContainer":
-        """Build from grid"""
+    def from_grid(cls, grid: "Grid", graph_model: type[BaseGraphModel] = RustworkxGraphModel) -> "GraphContainer":
+        """Build from grid
+
+        Args:
+            grid (Grid): The grid to build the graphs from.
+            graph_model (type[BaseGraphModel]): The graph model to use. Defaults to RustworkxGraphModel.
+        """
         cls._validate_branches(arrays=grid)
 
-        new_container = cls.empty()
+        new_container = cls.empty(graph_model=graph_model)
         for graph_field in new_container.graph_attributes:
             graph: BaseGraphModel = getattr(new_container, graph_field.name)
             new_graph = graph.from_grid(grid, active_only=graph.active_only)
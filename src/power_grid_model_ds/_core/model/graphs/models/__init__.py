@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
+from power_grid_model_ds._core.model.graphs.models.csr import CsrGraphModel
 from power_grid_model_ds._core.model.graphs.models.rustworkx import RustworkxGraphModel
 
-__all__ = ["RustworkxGraphModel"]
+__all__ = ["CsrGraphModel", "RustworkxGraphModel"]
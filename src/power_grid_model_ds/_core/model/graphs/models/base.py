@@ -314,6 +314,64 @@ class BaseGraphModel(ABC):
             for path in internal_paths
         ]
 
+    def iter_all_paths(
+        self,
+        ext_start_node_id: int,
+        ext_end_node_id: int,
+        max_paths: int | None = None,
+        cutoff: int | None = None,
+        min_depth: int | None = None,
+    ) -> Generator[list[int], None, None]:
+        """Lazily yields all paths between two (external) nodes.
+
+        In contrast to get_all_paths, paths are generated one at a time, so iteration can be stopped early
+        and memory usage stays bounded on heavily meshed grids.
+
+        Example:
+            given this graph: [1] - [2] - [3] - [4] - [5] - [1]
+
+            >>> list(graph.iter_all_paths(1, 3)) == [[1, 2, 3], [1, 5, 4, 3]]
+            >>> list(graph.iter_all_paths(1, 3, cutoff=2)) == [[1, 2, 3]]
+            >>> list(graph.iter_all_paths(1, 3, min_depth=3)) == [[1, 5, 4, 3]]
+
+        Args:
+            ext_start_node_id: id of the node to start from
+            ext_end_node_id: id of the node to end at
+            max_paths: stop after this many paths have been yielded. Defaults to None (no limit).
+            cutoff: only yield paths with at most this many branches. Defaults to None (no limit).
+            min_depth: only yield paths with at least this many branches. Defaults to None (no limit).
+
+        Yields:
+            list[int]: a path as a list of external node ids. Each node sequence is yielded only once,
+            also when parallel branches are present.
+
+        Note:
+            The graph should not be modified while iterating.
+
+        Raises:
+            MissingNodeError: if one of the nodes does not exist in the graph
+        """
+        if ext_start_node_id == ext_end_node_id or max_paths == 0:
+            return
+
+        source = self.external_to_internal(ext_start_node_id)
+        target = self.external_to_internal(ext_end_node_id)
+
+        three_winding_cycles = [self._externals_to_internals(list(group)) for group in self._get_three_winding_cycles()]
+        correct_for_three_winding = bool(three_winding_cycles)
+
+        nr_yielded = 0
+        for internal_path in self._iter_all_paths(
+            source=source, target=target, cutoff=cutoff, three_winding_cycles=three_winding_cycles
+        ):
+            path = self._to_external_path(internal_path, correct_for_three_winding=correct_for_three_winding)
+            if min_depth is not None and len(path) - 1 < min_depth:
+                continue
+            yield path
+            nr_yielded += 1
+            if max_paths is not None and nr_yielded >= max_paths:
+                return
+
     def get_components(self) -> list[list[int]]:
         """Returns all separate components of the graph as lists
 
@@ -482,13 +540,17 @@ class BaseGraphModel(ABC):
 
         Yields True if branches were removed (and correction for three-winding transformers is needed).
         """
-        branches_to_remove = [
-            (group[1], group[2])
+        branches_to_remove = [(group[1], group[2]) for group in self._get_three_winding_cycles()]
+        with self.tmp_remove_branches(branches_to_remove):
+            yield bool(branches_to_remove)
+
+    def _get_three_winding_cycles(self) -> list[tuple[int, int, int]]:
+        """Return the nodes of the three winding transformers that form a cycle (all three branches are present)."""
+        return [
+            group
             for group in self._three_winding_nodes
             if all(self.has_branch(from_node, to_node) for from_node, to_node in combinations(group, 2))
         ]
-        with self.tmp_remove_branches(branches_to_remove):
-            yield bool(branches_to_remove)
 
     def _to_external_path(self, internal_path: list[int], correct_for_three_winding: bool = False) -> list[int]:
         """Convert a path of internal node ids to external node ids.
@@ -514,6 +576,54 @@ class BaseGraphModel(ABC):
             if (index in (0, len(path) - 1) or frozenset([path[index - 1], node, path[index + 1]]) not in replacements)
         ]
 
+    def _iter_all_paths(
+        self,
+        source: int,
+        target: int,
+        cutoff: int | None,
+        three_winding_cycles: list[list[int]] | None = None,
+    ) -> Generator[list[int], None, None]:
+        """Lazily yield all simple paths (internal node ids) between source and target.
+
+        Iterative depth first search, so that paths are produced one at a time.
+        Graph models can override this with an engine specific implementation.
+
+        The cycles of three winding transformers (internal node ids) are broken the same way as in
+        _without_three_winding_cycles, but without modifying the graph: the branch between the second and third
+        node is skipped. The cutoff applies to the depth of a path after _to_external_path has removed the detours
+        through the first node.
+        """
+        three_winding_cycles = three_winding_cycles or []
+        skipped_branches = {frozenset((group[1], group[2])) for group in three_winding_cycles}
+        detours = {frozenset(group) for group in three_winding_cycles}
+        detour_branches = {frozenset(pair) for group in three_winding_cycles for pair in combinations(group, 2)}
+
+        visited = [source]
+        visited_set = {source}
+        depths = [0]
+        stack = [iter(self._adjacent(source))]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                visited_set.discard(visited.pop())
+                depths.pop()
+                continue
+            if child in visited_set or frozenset((visited[-1], child)) in skipped_branches:
+                continue
+            depth = depths[-1] + 1
+            if len(visited) > 1 and frozenset((visited[-2], visited[-1], child)) in detours:
+                depth -= 1
+            if child == target:
+                if cutoff is None or depth <= cutoff:
+                    yield [*visited, target]
+            # a branch of a three winding transformer may still be shortened by the next node of the path
+            elif cutoff is None or depth < cutoff + (frozenset((visited[-1], child)) in detour_branches):
+                visited.append(child)
+                visited_set.add(child)
+                depths.append(depth)
+                stack.append(iter(self._adjacent(child)))
+
     def _branch_is_relevant(self, branch: BranchArray) -> bool:
         """Check if a branch is relevant"""
         if self.active_only:
@@ -0,0 +1,402 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Graph model backed by NumPy arrays in compressed sparse row (CSR) format"""
+
+from collections.abc import Generator, Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+from power_grid_model_ds._core.model.graphs.errors import (
+    GraphError,
+    MissingBranchError,
+    MissingNodeError,
+    NoPathBetweenNodes,
+)
+from power_grid_model_ds._core.model.graphs.models.base import BaseGraphModel
+from power_grid_model_ds.arrays import NodeArray
+
+if TYPE_CHECKING:
+    from power_grid_model_ds._core.model.grids.base import Grid
+
+_NO_NODE = -1
+
+
+class CsrGraphModel(BaseGraphModel):
+    """A graph model that stores its topology in NumPy arrays only.
+
+    Nodes and branches are kept as flat arrays of internal ids. For searching, these are converted to a
+    compressed sparse row (CSR) adjacency structure, on which breadth first searches and components are computed
+    with vectorized frontier expansion.
+
+    This model is intended for read-heavy (analytic) workloads: building it from a grid is fully vectorized and
+    it does not keep any Python objects per node or branch.
+    Modifying the topology is supported, but every modification invalidates the CSR structure, which is rebuilt
+    (at the cost of a pass over all branches) on the next search.
+    Use RustworkxGraphModel if the topology is modified frequently in between searches.
+
+    Example:
+        >>> from power_grid_model_ds import Grid
+        >>> from power_grid_model_ds.graph_models import CsrGraphModel
+        >>> grid = Grid.empty(graph_model=CsrGraphModel)
+    """
+
+    def __init__(self, active_only=False) -> None:
+        super().__init__(active_only=active_only)
+        # internal node id -> external node id. Internal ids of deleted nodes are not reused.
+        self._external_ids: NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self._node_exists: NDArray[np.bool_] = np.empty(0, dtype=np.bool_)
+
+        # one entry per branch (internal node ids)
+        self._from_nodes: NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self._to_nodes: NDArray[np.int64] = np.empty(0, dtype=np.int64)
+
+        # lazily built search structures, reset on modification
+        self._lookup: tuple[NDArray[np.int64], NDArray[np.int64]] | None = None
+        self._csr: tuple[NDArray[np.int64], NDArray[np.int64]] | None = None
+
+    @property
+    def nr_nodes(self) -> int:
+        return int(np.count_nonzero(self._node_exists))
+
+    @property
+    def nr_branches(self) -> int:
+        return self._from_nodes.size
+
+    @property
+    def external_ids(self) -> list[int]:
+        return self._external_ids[self._node_exists].tolist()
+
+    def has_parallel_edges(self) -> bool:
+        branches = np.stack(
+            [np.minimum(self._from_nodes, self._to_nodes), np.maximum(self._from_nodes, self._to_nodes)], axis=1
+        )
+        return np.unique(branches, axis=0).shape[0] < branches.shape[0]
+
+    def external_to_internal(self, ext_node_id: int) -> int:
+        internal_node_id = self._lookup_internal(np.array([ext_node_id], dtype=np.int64))[0]
+        if internal_node_id == _NO_NODE:
+            raise MissingNodeError(f"External node id '{ext_node_id}' does NOT exist!")
+        return int(internal_node_id)
+
+    def internal_to_external(self, int_node_id: int) -> int:
+        return int(self._external_ids[int_node_id])
+
+    def add_node_array(self, node_array: NodeArray, raise_on_fail: bool = True) -> None:
+        if raise_on_fail and np.any(self._lookup_internal(node_array.id.astype(np.int64)) != _NO_NODE):
+            raise GraphError("At least one node id already exists in the Graph.")
+        self._add_nodes(node_array.id)
+
+    def delete_node_array(self, node_array: NodeArray, raise_on_fail: bool = True) -> None:
+        internal_node_ids = self._lookup_internal(node_array.id.astype(np.int64))
+        missing_mask = internal_node_ids == _NO_NODE
+        if raise_on_fail and np.any(missing_mask):
+            missing_node_id = node_array.id[missing_mask][0]
+            raise MissingNodeError(f"External node id '{missing_node_id}' does NOT exist!")
+        self._delete_nodes(internal_node_ids[~missing_mask])
+
+    @classmethod
+    def from_grid(cls, grid: "Grid", active_only=False) -> "CsrGraphModel":
+        """Build from grid.
+
+        All nodes and branches are added in bulk, without any per-element Python operations.
+        """
+        new_graph = cls(active_only=active_only)
+        new_graph._add_nodes(grid.node.id)
+        new_graph.add_branch_array(grid.branches)
+        new_graph.add_branch3_array(grid.three_winding_transformer)
+        return new_graph
+
+    def _internals_to_externals(self, internal_nodes: list[int]) -> list[int]:
+        return self._external_ids[np.asarray(internal_nodes, dtype=np.int64)].tolist()
+
+    def _externals_to_internals(self, external_nodes: Sequence[int] | NDArray) -> list[int]:
+        if isinstance(external_nodes, np.ndarray):
+            external_array = external_nodes.astype(np.int64)
+        else:
+            external_array = np.fromiter(external_nodes, dtype=np.int64)
+        internal_node_ids = self._lookup_internal(external_array)
+        if np.any(missing_mask := internal_node_ids == _NO_NODE):
+            raise MissingNodeError(f"External node id '{external_array[missing_mask][0]}' does NOT exist!")
+        return internal_node_ids.tolist()
+
+    def _add_node(self, ext_node_id: int) -> None:
+        self._add_nodes([ext_node_id])
+
+    def _add_nodes(self, ext_node_ids: list[int] | NDArray) -> None:
+        new_ids = np.asarray(ext_node_ids, dtype=np.int64)
+        self._external_ids = np.concatenate([self._external_ids, new_ids])
+        self._node_exists = np.concatenate([self._node_exists, np.ones(new_ids.size, dtype=np.bool_)])
+        self._invalidate(nodes=True)
+
+    def _delete_node(self, node_id: int) -> None:
+        self._delete_nodes(np.array([node_id], dtype=np.int64))
+
+    def _delete_nodes(self, node_ids: NDArray[np.int64]) -> None:
+        self._node_exists[node_ids] = False
+        keep_mask = self._node_exists[self._from_nodes] & self._node_exists[self._to_nodes]
+        self._from_nodes = self._from_nodes[keep_mask]
+        self._to_nodes = self._to_nodes[keep_mask]
+        self._invalidate(nodes=True)
+
+    def _has_branch(self, from_node_id: int, to_node_id: int) -> bool:
+        return bool(np.any(self._neighbors(from_node_id) == to_node_id))
+
+    def _has_node(self, node_id: int) -> bool:
+        return 0 <= node_id < self._node_exists.size and bool(self._node_exists[node_id])
+
+    def _add_branch(self, from_node_id: int, to_node_id: int) -> None:
+        self._add_branches([from_node_id], [to_node_id])
+
+    def _add_branches(self, from_node_ids: list[int], to_node_ids: list[int]) -> None:
+        self._from_nodes = np.concatenate([self._from_nodes, np.asarray(from_node_ids, dtype=np.int64)])
+        self._to_nodes = np.concatenate([self._to_nodes, np.asarray(to_node_ids, dtype=np.int64)])
+        self._invalidate()
+
+    def _delete_branch(self, from_node_id: int, to_node_id: int) -> None:
+        matches = np.flatnonzero(
+            ((self._from_nodes == from_node_id) & (self._to_nodes == to_node_id))
+            | ((self._from_nodes == to_node_id) & (self._to_nodes == from_node_id))
+        )
+        if not matches.size:
+            raise MissingBranchError(f"No edge between (internal) nodes {from_node_id} and {to_node_id}")
+        # like other graph models, only a single (parallel) branch is removed
+        self._from_nodes = np.delete(self._from_nodes, matches[0])
+        self._to_nodes = np.delete(self._to_nodes, matches[0])
+        self._invalidate()
+
+    def _in_branches(self, int_node_id: int) -> Generator[tuple[int, int], None, None]:
+        return ((neighbor, int_node_id) for neighbor in self._neighbors(int_node_id).tolist())
+
+    def _adjacent(self, int_node_id: int) -> list[int]:
+        return np.unique(self._neighbors(int_node_id)).tolist()
+
+    def _get_connected(self, node_id: int, nodes_to_ignore: list[int], inclusive: bool = False) -> list[int]:
+        visited = np.zeros(self._external_ids.size, dtype=np.bool_)
+        visited[nodes_to_ignore] = True
+        levels = [nodes for nodes, _ in self._iter_bfs_levels(node_id, visited)]
+        connected_nodes = np.concatenate(levels).tolist()
+        if not inclusive:
+            connected_nodes.remove(node_id)
+        return connected_nodes
+
+    def _find_first_connected(self, node_id: int, candidate_node_ids: list[int]) -> int:
+        candidate_mask = np.zeros(self._external_ids.size, dtype=np.bool_)
+        candidate_mask[candidate_node_ids] = True
+        visited = np.zeros(self._external_ids.size, dtype=np.bool_)
+        for nodes, _ in self._iter_bfs_levels(node_id, visited):
+            found = nodes[candidate_mask[nodes]]
+            if found.size:
+                return int(found[0])
+        raise MissingNodeError(f"node {node_id} is not connected to any of the candidate nodes")
+
+    def _get_shortest_path(self, source: int, target: int) -> tuple[list[int], int]:
+        visited = np.zeros(self._external_ids.size, dtype=np.bool_)
+        parents = np.full(self._external_ids.size, _NO_NODE, dtype=np.int64)
+        for nodes, level_parents in self._iter_bfs_levels(source, visited):
+            parents[nodes] = level_parents
+            if visited[target]:
+                break
+        else:
+            raise NoPathBetweenNodes(f"No path between internal nodes {source} and {target}")
+
+        path_nodes = [target]
+        while path_nodes[-1] != source:
+            path_nodes.append(int(parents[path_nodes[-1]]))
+        path_nodes.reverse()
+        return path_nodes, len(path_nodes) - 1
+
+    def _get_all_paths(self, source: int, target: int) -> list[list[int]]:
+        return list(self._iter_all_paths(source=source, target=target, cutoff=None))
+
+    def _get_components(self) -> list[list[int]]:
+        labels = self._get_component_labels()
+        nodes = np.flatnonzero(self._node_exists)
+        node_labels = labels[nodes]
+        order = np.argsort(node_labels, kind="stable")
+        split_indices = np.flatnonzero(np.diff(node_labels[order])) + 1
+        return [component.tolist() for component in np.split(nodes[order], split_indices) if component.size]
+
+    def _dfs(self, source: list[int]) -> dict[int, int | None]:
+        indptr, indices = self._get_csr()
+        visited = np.zeros(self._external_ids.size, dtype=np.bool_)
+        result: dict[int, int | None] = {}
+        for start_node in source:
+            if visited[start_node]:
+                continue
+            visited[start_node] = True
+            result[start_node] = None
+            stack = [(start_node, iter(indices[indptr[start_node] : indptr[start_node + 1]].tolist()))]
+            while stack:
+                node, children = stack[-1]
+                for child in children:
+                    if not visited[child]:
+                        visited[child] = True
+                        result[child] = node
+                        stack.append((child, iter(indices[indptr[child] : indptr[child + 1]].tolist())))
+                        break
+                else:
+                    stack.pop()
+        return result
+
+    def _bfs(self, source: list[int]) -> dict[int, int | None]:
+        visited = np.zeros(self._external_ids.size, dtype=np.bool_)
+        result: dict[int, int | None] = {}
+        for start_node in source:
+            if visited[start_node]:
+                continue
+            for nodes, parents in self._iter_bfs_levels(start_node, visited):
+                result.update(zip(nodes.tolist(), parents.tolist(), strict=True))
+        return {node: None if parent == _NO_NODE else parent for node, parent in result.items()}
+
+    def _find_fundamental_cycles(self) -> list[list[int]]:
+        """Find all fundamental cycles in the graph, using a breadth first spanning forest.
+
+        Every branch that is not part of the spanning forest closes exactly one cycle: the path between its
+        nodes within the forest, together with the branch itself.
+
+        Returns:
+            list[list[int]]: A list of cycles, each cycle is a list of node IDs.
+        """
+        parents, depths = self._get_spanning_forest()
+        cycle_branches = self._get_cycle_branches(parents)
+
+        cycles = []
+        for source, target in zip(
+            self._from_nodes[cycle_branches].tolist(), self._to_nodes[cycle_branches].tolist(), strict=True
+        ):
+            source_path, target_path = [source], [target]
+            while source_path[-1] != target_path[-1]:
+                if depths[source_path[-1]] >= depths[target_path[-1]]:
+                    source_path.append(int(parents[source_path[-1]]))
+                else:
+                    target_path.append(int(parents[target_path[-1]]))
+            cycles.append([*source_path, *reversed(target_path[:-1]), source])
+        return cycles
+
+    def _all_branches(self) -> Generator[tuple[int, int], None, None]:
+        return (
+            (source, target) for source, target in zip(self._from_nodes.tolist(), self._to_nodes.tolist(), strict=True)
+        )
+
+    def _invalidate(self, nodes: bool = False) -> None:
+        """Reset the search structures after a modification of the topology."""
+        self._csr = None
+        if nodes:
+            self._lookup = None
+
+    def _get_lookup(self) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Return the sorted external ids of all existing nodes and their corresponding internal ids."""
+        if self._lookup is None:
+            internal_node_ids = np.flatnonzero(self._node_exists)
+            external_node_ids = self._external_ids[internal_node_ids]
+            order = np.argsort(external_node_ids, kind="stable")
+            self._lookup = (external_node_ids[order], internal_node_ids[order])
+        return self._lookup
+
+    def _lookup_internal(self, external_node_ids: NDArray[np.int64]) -> NDArray[np.int64]:
+        """Convert external node ids to internal node ids. Missing nodes are returned as -1"""
+        sorted_external_ids, internal_node_ids = self._get_lookup()
+        if not sorted_external_ids.size:
+            return np.full(external_node_ids.size, _NO_NODE, dtype=np.int64)
+        positions = np.minimum(np.searchsorted(sorted_external_ids, external_node_ids), sorted_external_ids.size - 1)
+        found_mask = sorted_external_ids[positions] == external_node_ids
+        return np.where(found_mask, internal_node_ids[positions], _NO_NODE)
+
+    def _get_csr(self) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Return the (indptr, indices) CSR adjacency arrays. Every branch is stored in both directions."""
+        if self._csr is None:
+            not_a_loop = self._from_nodes != self._to_nodes
+            sources = np.concatenate([self._from_nodes, self._to_nodes[not_a_loop]])
+            targets = np.concatenate([self._to_nodes, self._from_nodes[not_a_loop]])
+            order = np.argsort(sources, kind="stable")
+            counts = np.bincount(sources, minlength=self._external_ids.size)
+            indptr = np.zeros(self._external_ids.size + 1, dtype=np.int64)
+            np.cumsum(counts, out=indptr[1:])
+            self._csr = (indptr, targets[order])
+        return self._csr
+
+    def _neighbors(self, node_id: int) -> NDArray[np.int64]:
+        """Return the neighbors of a node. Neighbors connected through parallel branches occur multiple times."""
+        indptr, indices = self._get_csr()
+        return indices[indptr[node_id] : indptr[node_id + 1]]
+
+    def _expand(self, frontier: NDArray[np.int64]) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Return all (node, neighbor) pairs for the nodes in the frontier."""
+        indptr, indices = self._get_csr()
+        starts = indptr[frontier]
+        counts = indptr[frontier + 1] - starts
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return np.repeat(frontier, counts), indices[np.repeat(starts, counts) + offsets]
+
+    def _iter_bfs_levels(
+        self, source: int, visited: NDArray[np.bool_]
+    ) -> Generator[tuple[NDArray[np.int64], NDArray[np.int64]], None, None]:
+        """Breadth first search from source that yields one level at a time as (nodes, parents) arrays.
+
+        Nodes that are marked in visited are not traversed. The visited array is updated in place.
+        """
+        visited[source] = True
+        frontier = np.array([source], dtype=np.int64)
+        yield frontier, np.array([_NO_NODE], dtype=np.int64)
+        while frontier.size:
+            parents, children = self._expand(frontier)
+            new_mask = ~visited[children]
+            parents, children = parents[new_mask], children[new_mask]
+            _, first_indices = np.unique(children, return_index=True)
+            first_indices.sort()  # keep discovery order
+            parents, frontier = parents[first_indices], children[first_indices]
+            if not frontier.size:
+                return
+            visited[frontier] = True
+            yield frontier, parents
+
+    def _get_spanning_forest(self) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Return the parent and depth of each internal node in a breadth first spanning forest."""
+        visited = np.zeros(self._external_ids.size, dtype=np.bool_)
+        parents = np.full(self._external_ids.size, _NO_NODE, dtype=np.int64)
+        depths = np.zeros(self._external_ids.size, dtype=np.int64)
+        for start_node in np.flatnonzero(self._node_exists).tolist():
+            if visited[start_node]:
+                continue
+            for depth, (nodes, level_parents) in enumerate(self._iter_bfs_levels(start_node, visited)):
+                parents[nodes] = level_parents
+                depths[nodes] = depth
+        return parents, depths
+
+    def _get_cycle_branches(self, parents: NDArray[np.int64]) -> NDArray[np.int64]:
+        """Return the indices of the branches that are not part of the spanning forest given by parents.
+
+        Parallel branches between the same nodes close the same cycle, so only the first one is returned.
+        """
+        nr_slots = self._external_ids.size
+        branch_keys = np.minimum(self._from_nodes, self._to_nodes) * nr_slots + np.maximum(
+            self._from_nodes, self._to_nodes
+        )
+        # Each tree branch (parent -> child) matches one branch in the graph
+        children = np.flatnonzero(parents != _NO_NODE)
+        tree_keys = np.minimum(parents[children], children) * nr_slots + np.maximum(parents[children], children)
+        order = np.argsort(branch_keys, kind="stable")
+        is_tree_branch = np.zeros(branch_keys.size, dtype=np.bool_)
+        is_tree_branch[order[np.searchsorted(branch_keys[order], tree_keys)]] = True
+
+        _, first_indices = np.unique(np.where(is_tree_branch, _NO_NODE, branch_keys), return_index=True)
+        return np.sort(first_indices[~is_tree_branch[first_indices]])
+
+    def _get_component_labels(self) -> NDArray[np.int64]:
+        """Label each internal node with the lowest internal node id in its component.
+
+        Uses vectorized min-label hooking with pointer jumping, which converges in a few iterations.
+        """
+        labels = np.arange(self._external_ids.size, dtype=np.int64)
+        while True:
+            previous_labels = labels.copy()
+            np.minimum.at(labels, labels[self._from_nodes], labels[self._to_nodes])
+            np.minimum.at(labels, labels[self._to_nodes], labels[self._from_nodes])
+            while not np.array_equal(jumped_labels := labels[labels], labels):
+                labels = jumped_labels
+            if np.array_equal(labels, previous_labels):
+                return labels
@@ -2,11 +2,14 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
+from dataclasses import fields
 from typing import TYPE_CHECKING
 
 import numpy as np
 
+from power_grid_model_ds._core.model.constants import EMPTY_ID
 from power_grid_model_ds._core.model.enums.nodes import NodeType
+from power_grid_model_ds._core.model.grids._journal import journal_operation, record_change
 from power_grid_model_ds.arrays import BranchArray
 
 if TYPE_CHECKING:
@@ -44,35 +47,84 @@ def set_feeder_ids(grid: "Grid"):
     301 | 101          | 201
     601 | 101          | 204
     """
+    with journal_operation(grid):
+        _set_feeder_ids(grid)
+        for field in fields(grid):
+            if field.name in ("link", "line", "transformer"):
+                record_change(grid, "update", field.name, columns=("is_feeder", "feeder_branch_id", "feeder_node_id"))
+            elif field.name == "node" or isinstance(getattr(grid, field.name), BranchArray):
+                record_change(grid, "update", field.name, columns=("feeder_branch_id", "feeder_node_id"))
+
+
+def _set_feeder_ids(grid: "Grid") -> None:
     _set_is_feeder(grid=grid)
     _reset_feeder_ids(grid)
     feeder_node_ids = grid.node.filter(node_type=NodeType.SUBSTATION_NODE)["id"]
     with grid.graphs.active_graph.tmp_remove_nodes(feeder_node_ids.tolist()):
         components = grid.graphs.active_graph.get_components()
-    for component_node_ids in components:
-        component_branches = _get_active_component_branches(grid, component_node_ids)
+    if not components:
+        return
 
-        feeder_branch = _get_feeder_branch(component_branches)
+    # label each node with the index of its component, so all components are handled in a single pass
+    component_node_ids = np.concatenate([np.asarray(component, dtype=np.int64) for component in components])
+    component_labels = np.repeat(np.arange(len(components)), [len(component) for component in components])
 
-        if feeder_branch.size == 0:
-            continue  # early exit
+    feeder_branch_ids, component_feeder_node_ids = _get_component_feeders(
+        grid.branches, feeder_node_ids, component_node_ids, component_labels, len(components)
+    )
 
-        feeder_node_id = _get_feeder_node_id(feeder_branch, feeder_node_ids)
+    for array in grid.branch_arrays:
+        labels = _get_branch_labels(array, component_node_ids, component_labels)
+        if np.any(labels >= 0):
+            array.feeder_branch_id = np.where(labels >= 0, feeder_branch_ids[labels], EMPTY_ID)
+            array.feeder_node_id = np.where(labels >= 0, component_feeder_node_ids[labels], EMPTY_ID)
+
+    node_labels = _get_labels(component_node_ids, component_labels, grid.node.id)
+    grid.node.feeder_branch_id = np.where(node_labels >= 0, feeder_branch_ids[node_labels], EMPTY_ID)
+    grid.node.feeder_node_id = np.where(node_labels >= 0, component_feeder_node_ids[node_labels], EMPTY_ID)
+
+
+def _get_component_feeders(
+    branches: BranchArray,
+    feeder_node_ids: np.ndarray,
+    node_ids: np.ndarray,
+    labels: np.ndarray,
+    nr_components: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the feeder branch id and the feeder node id of each component, or EMPTY_ID if it is not fed."""
+    branch_labels = _get_branch_labels(branches, node_ids, labels)
+    is_feeding = branches.is_feeder & (branch_labels >= 0)
+    # a component can not point to multiple feeder branches, so just pick the first one
+    feeding_labels, first_index = np.unique(branch_labels[is_feeding], return_index=True)
+    feeder_branches = branches[is_feeding][first_index]
+
+    feeder_branch_ids = np.full(nr_components, EMPTY_ID, dtype=np.int32)
+    feeder_branch_ids[feeding_labels] = feeder_branches.id
+    component_feeder_node_ids = np.full(nr_components, EMPTY_ID, dtype=np.int32)
+    component_feeder_node_ids[feeding_labels] = np.where(
+        np.isin(feeder_branches.from_node, feeder_node_ids), feeder_branches.from_node, feeder_branches.to_node
+    )
+    return feeder_branch_ids, component_feeder_node_ids
+
+
+def _get_branch_labels(branches: BranchArray, node_ids: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """Return the component label of each active branch, or -1 for inactive branches and branches outside a component.
+
+    Active branches connect nodes of the same component, or a node of a component to a substation node.
+    """
+    from_labels = _get_labels(node_ids, labels, branches.from_node)
+    to_labels = _get_labels(node_ids, labels, branches.to_node)
+    branch_labels = np.where(from_labels >= 0, from_labels, to_labels)
+    return np.where((branches.from_status == 1) & (branches.to_status == 1), branch_labels, -1)
 
-        for array in grid.branch_arrays:
-            array.update_by_id(
-                component_branches.id,
-                feeder_branch_id=feeder_branch.id.item(),
-                feeder_node_id=feeder_node_id,
-                allow_missing=True,
-            )
 
-        grid.node.update_by_id(
-            component_node_ids,
-            feeder_branch_id=feeder_branch.id.item(),
-            feeder_node_id=feeder_node_id,
-            allow_missing=True,
-        )
+def _get_labels(node_ids: np.ndarray, labels: np.ndarray, lookup_ids: np.ndarray) -> np.ndarray:
+    """Return the labels of lookup_ids (using a sorted lookup in node_ids), or -1 for the ids that are not found."""
+    if node_ids.size == 0:
+        return np.full(len(lookup_ids), -1)
+    sorter = np.argsort(node_ids, kind="stable")
+    positions = sorter[np.searchsorted(node_ids, lookup_ids, sorter=sorter).clip(max=len(node_ids) - 1)]
+    return np.where(node_ids[positions] == lookup_ids, labels[positions], -1)
 
 
 def _set_is_feeder(grid: "Grid") -> None:
@@ -93,31 +145,3 @@ def _reset_feeder_ids(grid: "Grid"):
 
     grid.node.set_empty("feeder_branch_id")
     grid.node.set_empty("feeder_node_id")
-
-
-def _get_active_component_branches(grid: "Grid", component_node_ids: list[int]) -> BranchArray:
-    # a component is a set of actively connected nodes (ids)
-    # returns all active branches in the component
-
-    branches = grid.branches
-    branches_in_component = branches.filter(from_node=component_node_ids, to_node=component_node_ids, mode_="OR")
-    return branches_in_component.filter(from_status=1, to_status=1)  # active branches
-
-
-def _get_feeder_branch(component_branches: BranchArray) -> BranchArray:
-    feeder_branches = component_branches.filter(is_feeder=True)
-
-    if feeder_branches.size == 1:
-        return feeder_branches
-
-    if feeder_branches.size > 1:
-        # Cannot point to multiple branches, so just pick the first one
-        return feeder_branches[0]
-
-    return BranchArray()
-
-
-def _get_feeder_node_id(feeder_branch: BranchArray, feeder_node_ids: np.ndarray) -> int:
-    # intersect to retrieve the feeder node id
-    feeder_node_id = np.intersect1d(feeder_branch.node_ids, feeder_node_ids)
-    return feeder_node_id.item()
@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Change journal that records modifications of the arrays in a grid"""
+
+import dataclasses
+from collections.abc import Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+from numpy.typing import NDArray
+
+from power_grid_model_ds._core.model.arrays.base.array import FancyArray
+
+if TYPE_CHECKING:
+    from .base import Grid
+
+ChangeType = Literal["append", "delete", "status", "update"]
+
+
+@dataclass(frozen=True)
+class GridChange:
+    """A single change to one of the arrays of a grid."""
+
+    version: int
+    """The grid version directly after the change."""
+
+    change_type: ChangeType
+    """The type of change: 'append', 'delete', 'status' (make_active/make_inactive) or 'update'."""
+
+    array_name: str
+    """The name of the array (grid field) that changed."""
+
+    ids: NDArray[np.int64] | None
+    """The ids of the changed records. None if the change (potentially) affects all records."""
+
+    columns: tuple[str, ...] | None = None
+    """The changed columns for 'status' and 'update' changes. None if all columns may have changed."""
+
+    records: NDArray | None = None
+    """The appended records for 'append' changes."""
+
+
+class ChangeJournal:
+    """Records changes to the arrays of a grid as compact array-based deltas.
+
+    Grid operations (append, delete_*, make_active/make_inactive, reverse_branches, set_feeder_ids) are recorded
+    precisely. Any other modification of an array (e.g. grid.line.update_by_id(...)) is detected through the array
+    versions and recorded as an 'update' of the entire array, since its details are unknown.
+    """
+
+    def __init__(self, grid: "Grid") -> None:
+        self._grid = grid
+        self.start_version = grid.version
+        self._entries: list[GridChange] = []
+        self._known_versions = grid.array_versions
+        self._depth = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def changes_since(self, version: int) -> list[GridChange]:
+        """Return all changes after the given grid version, in chronological order.
+
+        Raises:
+            ValueError: if the version is older than the start of the journal.
+        """
+        if version < self.start_version:
+            raise ValueError(f"Changes before version {self.start_version} have not been recorded.")
+        self._sync()
+        return [entry for entry in self._entries if entry.version > version]
+
+    def clear(self) -> None:
+        """Remove all entries from the journal and restart recording from the current grid version."""
+        self._sync()
+        self._entries = []
+        self.start_version = self._grid.version
+
+    @contextmanager
+    def operation(self, track_deletions: bool = False) -> Generator[None, None, None]:
+        """Group the changes made by a single grid operation.
+
+        Modifications made during the operation that are not recorded explicitly are considered part of it.
+        If track_deletions is True, the deleted records are determined by comparing ids before and after the
+        operation. For nested operations, this is done only by the outermost operation.
+        """
+        outermost = self._depth == 0
+        ids_before: dict[str, NDArray] = {}
+        if outermost:
+            self._sync()
+            if track_deletions:
+                ids_before = {name: array.id.copy() for name, array in _id_arrays(self._grid)}
+
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+
+        if outermost:
+            for name, array in _id_arrays(self._grid):
+                if name in ids_before and (deleted := np.setdiff1d(ids_before[name], array.id)).size:
+                    self.record("delete", name, ids=deleted)
+            self._known_versions = self._grid.array_versions
+
+    def record(self, change_type: ChangeType, array_name: str, ids: NDArray | None = None, **details):
+        """Add an entry to the journal. Should be called within an operation (see ChangeJournal.operation).
+
+        Args:
+            change_type (ChangeType): The type of change.
+            array_name (str): The name of the array that changed.
+            ids (NDArray | None): The ids of the changed records. None if all records may have changed.
+            **details: The columns and/or records of the change (see GridChange).
+        """
+        entry_ids = None if ids is None else np.array(ids, dtype=np.int64)
+        self._entries.append(
+            GridChange(
+                version=self._grid.version, change_type=change_type, array_name=array_name, ids=entry_ids, **details
+            )
+        )
+
+    def _sync(self) -> None:
+        """Record modifications of arrays that happened outside grid operations."""
+        current_versions = self._grid.array_versions
+        changed = sorted(
+            (version, name) for name, version in current_versions.items() if self._known_versions.get(name) != version
+        )
+        self._entries.extend(
+            GridChange(version=version, change_type="update", array_name=name, ids=None) for version, name in changed
+        )
+        self._known_versions = current_versions
+
+
+def journal_operation(grid: "Grid", track_deletions: bool = False) -> AbstractContextManager:
+    """Return a context manager that groups the changes of a grid operation (if the grid has a journal)."""
+    if grid.journal is None:
+        return nullcontext()
+    return grid.journal.operation(track_deletions=track_deletions)
+
+
+def record_change(grid: "Grid", change_type: ChangeType, array_name: str, ids: NDArray | None = None, **details):
+    """Record a change in the journal of the grid (if the grid has a journal). See ChangeJournal.record()."""
+    if grid.journal is not None:
+        grid.journal.record(change_type, array_name, ids=ids, **details)
+
+
+def _id_arrays(grid: "Grid") -> Iterator[tuple[str, FancyArray]]:
+    for field in dataclasses.fields(grid):
+        array = getattr(grid, field.name)
+        if isinstance(array, FancyArray) and "id" in array.columns:
+            yield field.name, array
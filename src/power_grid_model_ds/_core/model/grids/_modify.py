@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 import numpy as np
 
 from power_grid_model_ds._core.model.arrays.base.array import FancyArray
+from power_grid_model_ds._core.model.grids._journal import journal_operation, record_change
 from power_grid_model_ds.arrays import (
     ApplianceArray,
     Branch3Array,
@@ -24,9 +25,14 @@ _logger = logging.getLogger(__name__)
 
 def add_array_to_grid(grid: "Grid", array: FancyArray, check_max_id: bool = True) -> None:
     """See Grid.append()"""
-    grid._append(array, check_max_id=check_max_id)  # noqa # pylint: disable=protected-access
-    # pylint: disable=protected-access
-    grid.graphs._append(array)  # noqa: SLF001
+    with journal_operation(grid):
+        grid._append(array, check_max_id=check_max_id)  # noqa # pylint: disable=protected-access
+        # pylint: disable=protected-access
+        grid.graphs._append(array)  # noqa: SLF001
+        if array.size:
+            array_field = grid.find_array_field(array.__class__)
+            ids = array.id if "id" in array.columns else None
+            record_change(grid, "append", array_field.name, ids=ids, records=array.data.copy())
 
 
 def make_active(grid: "Grid", branch: BranchArray) -> None:
@@ -35,9 +41,11 @@ def make_active(grid: "Grid", branch: BranchArray) -> None:
     array_attr = getattr(grid, array_field.name)
     branch_mask = array_attr.id == branch.id
     already_active = bool(array_attr[branch_mask].is_active)
-    array_attr.from_status[branch_mask] = 1
-    array_attr.to_status[branch_mask] = 1
-    setattr(grid, array_field.name, array_attr)
+    with journal_operation(grid):
+        array_attr.from_status[branch_mask] = 1
+        array_attr.to_status[branch_mask] = 1
+        setattr(grid, array_field.name, array_attr)
+        record_change(grid, "status", array_field.name, ids=branch.id, columns=("from_status", "to_status"))
 
     if not already_active:
         grid.graphs.make_active(branch=branch)
@@ -53,8 +61,10 @@ def make_inactive(grid, branch: BranchArray, at_to_side: bool = True) -> None:
     branch_mask = array_attr.id == branch.id
     already_inactive = bool(~array_attr[branch_mask].is_active)
     status_side = "to_status" if at_to_side else "from_status"
-    array_attr[status_side][branch_mask] = 0
-    setattr(grid, array_field.name, array_attr)
+    with journal_operation(grid):
+        array_attr[status_side][branch_mask] = 0
+        setattr(grid, array_field.name, array_attr)
+        record_change(grid, "status", array_field.name, ids=branch.id, columns=(status_side,))
 
     if not already_inactive:
         grid.graphs.make_inactive(branch=branch)
@@ -65,6 +75,12 @@ def make_inactive(grid, branch: BranchArray, at_to_side: bool = True) -> None:
 
 def delete_node(grid: "Grid", node: NodeArray) -> None:
     """See Grid.delete_node()"""
+    with journal_operation(grid, track_deletions=True):
+        _delete_node(grid, node=node)
+    _logger.debug("deleted node %s", node.id.tolist())
+
+
+def _delete_node(grid: "Grid", node: NodeArray) -> None:
     grid.node = grid.node.exclude(id=node.id)
 
     ids_to_exclude = np.concatenate(
@@ -105,14 +121,14 @@ def delete_node(grid: "Grid", node: NodeArray) -> None:
 
     grid.graphs.delete_node(node=node)
     grid.rebuild_ids()
-    _logger.debug("deleted node %s", node.id.tolist())
 
 
 def delete_branch(grid: "Grid", branch: BranchArray) -> None:
     """See Grid.delete_branch()"""
-    _delete_branch_array(branch=branch, grid=grid)
-    grid.graphs.delete_branch(branch=branch)
-    grid.rebuild_ids()
+    with journal_operation(grid, track_deletions=True):
+        _delete_branch_array(branch=branch, grid=grid)
+        grid.graphs.delete_branch(branch=branch)
+        grid.rebuild_ids()
     _logger.debug(
         "deleted branch %s from %s to %s", branch.id.tolist(), branch.from_node.tolist(), branch.to_node.tolist()
     )
@@ -120,9 +136,10 @@ def delete_branch(grid: "Grid", branch: BranchArray) -> None:
 
 def delete_branch3(grid: "Grid", branch: Branch3Array) -> None:
     """See Grid.delete_branch3()"""
-    _delete_branch_array(branch=branch, grid=grid)
-    grid.graphs.delete_branch3(branch=branch)
-    grid.rebuild_ids()
+    with journal_operation(grid, track_deletions=True):
+        _delete_branch_array(branch=branch, grid=grid)
+        grid.graphs.delete_branch3(branch=branch)
+        grid.rebuild_ids()
     _logger.debug("deleted branch3 %s", branch.id.tolist())
 
 
@@ -142,12 +159,13 @@ def _delete_branch_array(branch: BranchArray | Branch3Array, grid: "Grid"):
 def delete_appliance(grid: "Grid", appliance: ApplianceArray) -> None:
     """See Grid.delete_appliance()"""
     # Delete a branch or branch3 array from the grid.
-    array_field = grid.find_array_field(appliance.__class__)
-    array_attr = getattr(grid, array_field.name)
-    setattr(grid, array_field.name, array_attr.exclude(id=appliance.id))
-
-    grid.sym_power_sensor = grid.sym_power_sensor.exclude(measured_object=appliance.id)
-    grid.asym_power_sensor = grid.asym_power_sensor.exclude(measured_object=appliance.id)
-    grid.voltage_regulator = grid.voltage_regulator.exclude(regulated_object=appliance.id)
-    grid.rebuild_ids()
+    with journal_operation(grid, track_deletions=True):
+        array_field = grid.find_array_field(appliance.__class__)
+        array_attr = getattr(grid, array_field.name)
+        setattr(grid, array_field.name, array_attr.exclude(id=appliance.id))
+
+        grid.sym_power_sensor = grid.sym_power_sensor.exclude(measured_object=appliance.id)
+        grid.asym_power_sensor = grid.asym_power_sensor.exclude(measured_object=appliance.id)
+        grid.voltage_regulator = grid.voltage_regulator.exclude(regulated_object=appliance.id)
+        grid.rebuild_ids()
     _logger.debug("deleted appliance %s", appliance.id.tolist())
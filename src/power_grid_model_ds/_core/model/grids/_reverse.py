@@ -5,6 +5,7 @@
 
 from typing import TYPE_CHECKING
 
+from power_grid_model_ds._core.model.grids._journal import journal_operation, record_change
 from power_grid_model_ds.arrays import (
     AsymLineArray,
     BranchArray,
@@ -39,9 +40,12 @@ def reverse_branches(grid: "Grid", branches: BranchArray) -> None:
 
     array_field = grid.find_array_field(branches.__class__)
     array = getattr(grid, array_field.name)
-    array.update_by_id(
-        branches.id, from_node=to_nodes, from_status=to_states, to_node=from_nodes, to_status=from_states
-    )
+    with journal_operation(grid):
+        array.update_by_id(
+            branches.id, from_node=to_nodes, from_status=to_states, to_node=from_nodes, to_status=from_states
+        )
+        columns = ("from_node", "to_node", "from_status", "to_status")
+        record_change(grid, "update", array_field.name, ids=branches.id, columns=columns)
 
 
 def set_branch_orientations(grid: "Grid") -> BranchArray:
@@ -4,6 +4,7 @@
 
 """Base grid classes"""
 
+import dataclasses
 from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Literal, Self, TypeVar, overload
@@ -22,6 +23,7 @@ from power_grid_model_ds._core.model.grids._helpers import (
     create_grid_from_extended_grid,
     merge_grids,
 )
+from power_grid_model_ds._core.model.grids._journal import ChangeJournal, GridChange
 from power_grid_model_ds._core.model.grids._modify import (
     add_array_to_grid,
     delete_branch,
@@ -43,6 +45,12 @@ from power_grid_model_ds._core.model.grids._search import (
     get_nearest_substation_node,
     get_typed_branches,
 )
+from power_grid_model_ds._core.model.grids.serialization.arrow import (
+    deserialize_from_arrow,
+    deserialize_from_parquet,
+    serialize_to_arrow,
+    serialize_to_parquet,
+)
 from power_grid_model_ds._core.model.grids.serialization.json import (
     deserialize_from_json,
     deserialize_from_json_string,
@@ -54,6 +62,7 @@ from power_grid_model_ds._core.model.grids.serialization.string import (
     deserialize_from_txt_file,
     serialize_to_str,
 )
+from power_grid_model_ds._core.utils.zip import Compression
 from power_grid_model_ds.arrays import (
     AsymCurrentSensorArray,
     AsymGenArray,
@@ -133,6 +142,8 @@ class Grid(FancyArrayContainer):
 
     fault: FaultArray
 
+    _journal: ChangeJournal | None = dataclasses.field(default=None, init=False, repr=False, compare=False)
+
     def __repr__(self) -> str:
         """Display relevant information about the grid."""
         array_reprs: list[str] = []
@@ -410,29 +421,38 @@ class Grid(FancyArrayContainer):
         return merge_grids(self, other_grid, mode)
 
     @overload
-    def serialize(self, path: Path, mode: Literal["json"] = "json", **kwargs) -> Path: ...
+    def serialize(
+        self, path: Path, mode: Literal["json"] = "json", compression: Compression | None = None, **kwargs
+    ) -> Path: ...
 
     @overload
     def serialize(self, path: None = None, *, mode: Literal["json_string"], **kwargs) -> str: ...
 
-    def serialize(self, path=None, mode: Literal["json", "json_string"] = "json", **kwargs):
+    def serialize(
+        self, path=None, mode: Literal["json", "json_string"] = "json", compression: Compression | None = None, **kwargs
+    ):
         """Serialize the grid.
 
         Args:
             path: Destination file path. Required when mode is ``"json"``, ignored otherwise.
             mode: Serialization target. Use ``"json"`` (default) to write a JSON file, or ``"json_string"`` to
                 return a JSON string.
+            compression: Only for mode ``"json"``. Compress the file while writing with ``"gzip"``,
+                ``"zstd"`` (requires zstandard) or ``"lz4"`` (requires lz4). Grid.deserialize() detects the
+                compression automatically.
             **kwargs: Additional keyword arguments forwarded to ``json.dump`` / ``json.dumps``.
         Returns:
             Path when mode is ``"json"``, str when mode is ``"json_string"``.
         """
         match mode:
             case "json_string":
+                if compression is not None:
+                    raise ValueError("compression is only supported when mode='json'")
                 return serialize_to_json_string(grid=self, **kwargs)
             case "json":
                 if not isinstance(path, Path):
                     raise TypeError("path must be a Path when mode='json'")
-                return serialize_to_json(grid=self, path=path, strict=True, **kwargs)
+                return serialize_to_json(grid=self, path=path, strict=True, compression=compression, **kwargs)
             case _:
                 raise ValueError(f"Invalid mode '{mode}'. Expected 'json' or 'json_string'.")
 
@@ -449,7 +469,7 @@ class Grid(FancyArrayContainer):
 
     @classmethod
     def deserialize(cls: type[Self], path: Path) -> Self:
-        """Deserialize the grid from a JSON file.
+        """Deserialize the grid from a (gzip, zstd or lz4 compressed) JSON file.
 
         Args:
             path: Path to the JSON file.
@@ -458,9 +478,97 @@ class Grid(FancyArrayContainer):
         """
         return deserialize_from_json(path=path, target_grid_class=cls)
 
+    def to_arrow(self) -> dict:
+        """Convert the arrays of the grid to pyarrow Tables (requires pyarrow).
+
+        Columns with multiple values per record (e.g. the phases of asymmetric components) become fixed-size lists.
+        Other (non-array) attributes of the grid are not included.
+
+        Returns:
+            dict[str, pyarrow.Table]: a table per array, by array name.
+        """
+        return serialize_to_arrow(self)
+
+    @classmethod
+    def from_arrow(cls: type[Self], tables: dict) -> Self:
+        """Create a grid from pyarrow Tables (requires pyarrow), e.g. as created with Grid.to_arrow().
+
+        Args:
+            tables: a table per array, by array name. Null values are replaced by the 'empty' value of the column.
+        Returns:
+            Self: The grid instance.
+        """
+        return deserialize_from_arrow(tables, target_grid_class=cls)
+
+    def to_parquet(self, directory: Path, **kwargs) -> Path:
+        """Write the arrays of the grid to Parquet files ('<array name>.parquet') in a directory (requires pyarrow).
+
+        Args:
+            directory: the directory to write to.
+            **kwargs: Keyword arguments forwarded to pyarrow.parquet.write_table (e.g. compression).
+        Returns:
+            Path: the directory.
+        """
+        return serialize_to_parquet(self, directory=directory, **kwargs)
+
+    @classmethod
+    def from_parquet(cls: type[Self], directory: Path) -> Self:
+        """Create a grid from the Parquet files in a directory (requires pyarrow), as written by Grid.to_parquet().
+
+        Args:
+            directory: the directory to read from.
+        Returns:
+            Self: The grid instance.
+        """
+        return deserialize_from_parquet(directory, target_grid_class=cls)
+
     def rebuild_graphs(self) -> None:
-        """(Re)build the graphs in the grid."""
-        self.graphs = GraphContainer.from_grid(self)
+        """(Re)build the graphs in the grid. The graph model of the current graphs is preserved."""
+        self.graphs = GraphContainer.from_grid(self, graph_model=self.graphs.active_graph.__class__)
+
+    @property
+    def journal(self) -> ChangeJournal | None:
+        """The change journal of the grid, or None if changes are not recorded. See Grid.enable_journal()."""
+        return self._journal
+
+    def enable_journal(self) -> None:
+        """Start recording the changes made to the grid arrays.
+
+        Recording is disabled by default. Once enabled, Grid.changes_since() returns the changes made after a given
+        grid version, which allows downstream consumers to update incrementally instead of rebuilding from scratch.
+        """
+        if self._journal is None:
+            self._journal = ChangeJournal(self)
+
+    def disable_journal(self) -> None:
+        """Stop recording changes and discard the recorded changes."""
+        self._journal = None
+
+    def changes_since(self, version: int) -> list[GridChange]:
+        """Return the changes made to the grid arrays after the given grid version, in chronological order.
+
+        Appends, deletions (including cascaded deletions), status changes (make_active/make_inactive) and
+        updates by grid methods are recorded with the affected ids. Any other modification of an array is reported
+        as an 'update' of the entire array (ids=None).
+
+        Args:
+            version (int): A grid version, as obtained from Grid.version.
+
+        Raises:
+            ValueError: If the journal is not enabled or if the version is older than the start of the journal.
+
+        Returns:
+            list[GridChange]: The changes made after the given version.
+
+        Examples:
+            >>> grid.enable_journal()
+            >>> version = grid.version
+            >>> grid.make_inactive(grid.line[0])
+            >>> grid.changes_since(version)
+        """
+        if self._journal is None:
+            raise ValueError("Changes are not recorded. Use Grid.enable_journal() to start recording changes.")
+        return self._journal.changes_since(version)
 
     def diff(self, other_grid: Self) -> None:
         """Print the differences between two grids
@@ -0,0 +1,17 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Optional dependencies for the serialization module."""
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # pylint: disable=invalid-name
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None  # pylint: disable=invalid-name
+
+__all__ = ["orjson", "pq"]
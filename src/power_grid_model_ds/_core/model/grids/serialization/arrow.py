@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Serialization of the arrays of Grid objects to Arrow tables and Parquet files."""
+
+import dataclasses
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from power_grid_model_ds._core.model.arrays.base.array import FancyArray
+from power_grid_model_ds._core.model.grids.serialization._optional import pq
+
+if TYPE_CHECKING:
+    # Import only for type checking to avoid circular imports at runtime
+    from power_grid_model_ds._core.model.grids.base import Grid
+
+_logger = logging.getLogger(__name__)
+
+
+def serialize_to_arrow[G: Grid](grid: G) -> dict[str, Any]:
+    """See Grid.to_arrow()"""
+    return {
+        field.name: getattr(grid, field.name).as_arrow()
+        for field in dataclasses.fields(grid)
+        if isinstance(getattr(grid, field.name), FancyArray)
+    }
+
+
+def deserialize_from_arrow[G: Grid](tables: dict[str, Any], target_grid_class: type[G]) -> G:
+    """See Grid.from_arrow()"""
+    grid = target_grid_class.empty()
+    for array_name, table in tables.items():
+        grid_array = getattr(grid, array_name, None)
+        if not isinstance(grid_array, FancyArray):
+            _logger.warning("Unexpected array '%s'", array_name)
+            continue
+        setattr(grid, array_name, grid_array.__class__.from_arrow(table))
+    grid.rebuild_ids()
+    grid.rebuild_graphs()
+    return grid
+
+
+def serialize_to_parquet[G: Grid](grid: G, directory: Path, **kwargs) -> Path:
+    """See Grid.to_parquet()"""
+    if pq is None:
+        raise ImportError("pyarrow is not installed")
+    directory.mkdir(parents=True, exist_ok=True)
+    for array_name, table in serialize_to_arrow(grid).items():
+        pq.write_table(table, directory / f"{array_name}.parquet", **kwargs)
+    return directory
+
+
+def deserialize_from_parquet[G: Grid](directory: Path, target_grid_class: type[G]) -> G:
+    """See Grid.from_parquet()"""
+    if pq is None:
+        raise ImportError("pyarrow is not installed")
+    tables = {path.stem: pq.read_table(path, memory_map=True) for path in sorted(directory.glob("*.parquet"))}
+    return deserialize_from_arrow(tables, target_grid_class=target_grid_class)
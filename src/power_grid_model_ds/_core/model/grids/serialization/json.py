@@ -5,13 +5,19 @@
 """Serialization utilities for Grid objects using power-grid-model serialization with extensions support."""
 
 import dataclasses
+import io
 import json
 import logging
-import math
+import re
+from collections.abc import Iterator
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TextIO
+
+import numpy as np
 
 from power_grid_model_ds._core.model.arrays.base.array import FancyArray
+from power_grid_model_ds._core.model.grids.serialization._optional import orjson
+from power_grid_model_ds._core.utils.zip import Compression, detect_compression, open_text
 
 if TYPE_CHECKING:
     # Import only for type checking to avoid circular imports at runtime
@@ -20,26 +26,89 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+# The number of rows that is serialized or parsed at once
+_CHUNK_SIZE = 10_000
+# The number of characters that is read from a file at once
+_BLOCK_SIZE = 1 << 20
+# The number of characters of which the rows of an array are decoded at once
+_DECODE_SIZE = 1 << 18
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_SCALAR_END = re.compile(r"[,\]} \t\n\r]")
+
 
-def serialize_to_json[G: Grid](grid: G, path: Path, strict: bool = True, **kwargs) -> Path:
+def serialize_to_json[G: Grid](
+    grid: G, path: Path, strict: bool = True, compression: Compression | None = None, **kwargs
+) -> Path:
     """Save a Grid object to JSON format using power-grid-model serialization with extensions support.
 
+    The file is written incrementally (one chunk of rows at a time), so the grid is never held in memory twice.
+
     Args:
         grid: The Grid object to serialize
         path: The file path to save to
         strict: Whether to raise an error if the grid object is not serializable.
-        **kwargs: Keyword arguments forwarded to json.dump (for example, indent, sort_keys,
+        compression: The codec to compress the file with: None (default), "gzip", "zstd" or "lz4".
+        **kwargs: Keyword arguments forwarded to json.dumps (for example, indent, sort_keys,
             ensure_ascii, etc.).
     Returns:
         Path: The path where the file was saved
     """
+    # encode the non-array values first, so that a value that is not serializable raises before the file is opened
+    encoded_values = _encode_values(grid, strict, **kwargs)
     path.parent.mkdir(parents=True, exist_ok=True)
-    json_data = serialize_to_dict(grid=grid, strict=strict, **kwargs)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(json_data, f, **kwargs)
+    with open_text(path, "w", compression=compression) as f:
+        _write_json(grid=grid, file=f, encoded_values=encoded_values, **kwargs)
     return path
 
 
+def write_json[G: Grid](grid: G, file: TextIO, strict: bool = True, **kwargs) -> None:
+    """Write a Grid object as JSON to a text file handle, one array (in chunks of rows) at a time.
+
+    The output is equal to json.dump(serialize_to_dict(grid), file) (apart from whitespace when indenting).
+    If orjson is installed and supports the kwargs (only indent=2 and sort_keys), it is used to encode the rows,
+    which results in compact output.
+
+    Args:
+        grid: The Grid object to serialize
+        file: The text file handle to write to
+        strict: Whether to raise an error if the grid object is not serializable.
+        **kwargs: Keyword arguments forwarded to json.dumps (for example, indent, sort_keys, cls).
+    """
+    _write_json(grid=grid, file=file, encoded_values=_encode_values(grid, strict, **kwargs), **kwargs)
+
+
+def _write_json[G: Grid](grid: G, file: TextIO, encoded_values: dict[str, str], **kwargs) -> None:
+    """Write the arrays of a Grid object and its encoded (non-array) values as JSON to a text file handle."""
+    orjson_option = _get_orjson_option(kwargs)
+    if orjson_option is not None:
+        item_separator, key_separator = ",", ":"
+    else:
+        item_separator, key_separator = kwargs.get("separators") or (
+            (",", ": ") if kwargs.get("indent") is not None else (", ", ": ")
+        )
+    fields = _get_field_names(grid)
+    if kwargs.get("sort_keys"):
+        fields.sort()
+
+    file.write(f'{{"data"{key_separator}{{')
+    separator = ""
+    for field_name in fields:
+        field_value = getattr(grid, field_name)
+        if isinstance(field_value, FancyArray):
+            file.write(f"{separator}{json.dumps(field_name)}{key_separator}[")
+            for start in range(0, field_value.size, _CHUNK_SIZE):
+                rows = _serialize_array(field_value[start : start + _CHUNK_SIZE])
+                file.write(item_separator if start else "")
+                file.write(_dump_rows(rows, item_separator, orjson_option, **kwargs))
+            file.write("]")
+        elif field_name in encoded_values:
+            file.write(f"{separator}{json.dumps(field_name)}{key_separator}{encoded_values[field_name]}")
+        else:
+            continue
+        separator = item_separator
+    file.write("}}")
+
+
 def serialize_to_dict[G: Grid](grid: G, strict: bool = True, **kwargs) -> dict:
     """Serialize a Grid object to a Python dict.
 
@@ -53,7 +122,7 @@ def serialize_to_dict[G: Grid](grid: G, strict: bool = True, **kwargs) -> dict:
     serialized_data = {}
 
     for field in dataclasses.fields(grid):
-        if field.name in ["graphs", "_id_tracker"]:
+        if field.name in ["graphs", "_id_tracker"] or not field.init:
             continue
 
         field_value = getattr(grid, field.name)
@@ -62,7 +131,7 @@ def serialize_to_dict[G: Grid](grid: G, strict: bool = True, **kwargs) -> dict:
             serialized_data[field.name] = _serialize_array(field_value)
             continue
 
-        if _is_serializable(field_value, strict, **kwargs):
+        if _encode_value(field_value, strict, **kwargs) is not None:
             serialized_data[field.name] = field_value
 
     return {"data": serialized_data}
@@ -71,6 +140,10 @@ def serialize_to_dict[G: Grid](grid: G, strict: bool = True, **kwargs) -> dict:
 def deserialize_from_json[G: Grid](path: Path, target_grid_class: type[G]) -> G:
     """Load a Grid object from JSON format with cross-type loading support.
 
+    The file is parsed incrementally: the rows of each array are decoded block by block into column buffers,
+    so the peak memory stays close to the size of the resulting grid.
+    Compressed files (gzip, zstd or lz4) are detected and decompressed transparently.
+
     Args:
         path: The file path to load from
         target_grid_class: Grid class to load into.
@@ -78,9 +151,43 @@ def deserialize_from_json[G: Grid](path: Path, target_grid_class: type[G]) -> G:
     Returns:
         Grid: The deserialized Grid object of the specified target class
     """
-    with path.open(encoding="utf-8") as f:
-        json_data = json.load(f)
-    return deserialize_from_dict(data=json_data, target_grid_class=target_grid_class)
+    with open_text(path, "r", compression=detect_compression(path)) as f:
+        return read_json(file=f, target_grid_class=target_grid_class)
+
+
+def read_json[G: Grid](file: TextIO, target_grid_class: type[G]) -> G:
+    """Load a Grid object from a JSON text file handle, one array at a time.
+
+    Args:
+        file: The text file handle to read from.
+        target_grid_class: Grid class to load into.
+
+    Returns:
+        Grid: The deserialized Grid object of the specified target class
+    """
+    grid = target_grid_class.empty()
+    reader = _JsonStreamReader(file)
+    found_data = False
+    for key in reader.iter_object_keys():
+        if key != "data":
+            reader.skip_value()
+            continue
+        found_data = True
+        for attr_name in reader.iter_object_keys():
+            if not hasattr(grid, attr_name):
+                _logger.warning("Unexpected attribute '%s'", attr_name)
+                reader.skip_value()
+                continue
+            grid_attr = getattr(grid, attr_name)
+            if isinstance(grid_attr, FancyArray):
+                setattr(grid, attr_name, _read_array(reader, grid_attr.__class__))
+            else:
+                setattr(grid, attr_name, grid_attr.__class__(reader.decode_value()))
+    if not found_data:
+        raise KeyError("data")
+    grid.rebuild_ids()
+    grid.rebuild_graphs()
+    return grid
 
 
 def deserialize_from_dict[G: Grid](data: dict, target_grid_class: type[G]) -> G:
@@ -110,8 +217,9 @@ def serialize_to_json_string[G: Grid](grid: G, strict: bool = True, **kwargs) ->
     Returns:
         str: A JSON string representation of the grid.
     """
-    data = serialize_to_dict(grid=grid, strict=strict, **kwargs)
-    return json.dumps(data, **kwargs)
+    buffer = io.StringIO()
+    write_json(grid=grid, file=buffer, strict=strict, **kwargs)
+    return buffer.getvalue()
 
 
 def deserialize_from_json_string[G: Grid](json_string: str, target_grid_class: type[G]) -> G:
@@ -123,7 +231,7 @@ def deserialize_from_json_string[G: Grid](json_string: str, target_grid_class: t
     Returns:
         Grid: The deserialized Grid object.
     """
-    return deserialize_from_dict(data=json.loads(json_string), target_grid_class=target_grid_class)
+    return deserialize_from_dict(data=_loads(json_string), target_grid_class=target_grid_class)
 
 
 def _restore_grid_values[G: Grid](grid: G, json_data: dict) -> None:
@@ -145,19 +253,65 @@ def _restore_grid_values[G: Grid](grid: G, json_data: dict) -> None:
 
 
 def _serialize_array(array: FancyArray) -> list[dict[str, Any]]:
-    return [{name: _replace_nan_with_none(record[name].item()) for name in array.columns} for record in array]
+    columns = [_column_to_list(array.data[name]) for name in array.columns]
+    return [dict(zip(array.columns, values, strict=True)) for values in zip(*columns, strict=True)]
+
+
+def _column_to_list(column: np.ndarray) -> list[Any]:
+    """Convert a column to a list of Python values, with NaN values replaced by a JSON-compatible null value."""
+    if not np.issubdtype(column.dtype, np.floating):
+        return column.tolist()
+    nan_mask = np.isnan(column)
+    if not nan_mask.any():
+        return column.tolist()
+    values = column.astype(object)
+    values[nan_mask] = None
+    return values.tolist()
 
 
 def _deserialize_array(array_data: list[dict[str, Any]], array_class: type[FancyArray]) -> FancyArray:
     if not array_data:
         return array_class()
 
-    array_columns = set(array_class.get_dtype().names)
+    data_as_dict_of_lists, extra_columns = _rows_to_columns(array_data, set(array_class.get_dtype().names))
+    if extra_columns:
+        _logger.warning("Ignoring extra columns %s from array data for %s.", extra_columns, array_class.__name__)
+    return array_class(**data_as_dict_of_lists)
+
+
+def _read_array(reader: "_JsonStreamReader", array_class: type[FancyArray]) -> FancyArray:
+    """Read the rows of a JSON array chunk by chunk into column buffers and create the array at once."""
+    dtype = array_class.get_dtype()
+    array_columns = set(dtype.names)
+    column_chunks: dict[str, list[np.ndarray]] = {}
+    extra_columns: set[str] = set()
+    n_rows = 0
+    for rows in reader.iter_array_chunks():
+        chunk_columns, chunk_extra_columns = _rows_to_columns(rows, array_columns)
+        if n_rows and chunk_columns.keys() != column_chunks.keys():
+            missing_column = next(iter(chunk_columns.keys() ^ column_chunks.keys()))
+            raise ValueError(
+                f"Some records in column '{missing_column}' have missing values. "
+                f"For defaulted columns, either provide all values or none."
+            )
+        for column, values in chunk_columns.items():
+            column_chunks.setdefault(column, []).append(np.asarray(values, dtype=dtype[column].base))
+        extra_columns |= chunk_extra_columns
+        n_rows += len(rows)
+
+    if not n_rows:
+        return array_class()
+    if extra_columns:
+        _logger.warning("Ignoring extra columns %s from array data for %s.", extra_columns, array_class.__name__)
+    return array_class(**{column: np.concatenate(chunks) for column, chunks in column_chunks.items()})
+
 
+def _rows_to_columns(rows: list[dict[str, Any]], array_columns: set[str]) -> tuple[dict[str, Any], set[str]]:
+    """Convert rows to lists per column. Returns the columns and the extra columns (that are not in the array)."""
     data_as_dict_of_lists: dict[str, Any] = {}
     for column in array_columns:
-        column_data = [row[column] for row in array_data if column in row]
-        if len(column_data) not in [0, len(array_data)]:
+        column_data = [row[column] for row in rows if column in row]
+        if len(column_data) not in [0, len(rows)]:
             raise ValueError(
                 f"Some records in column '{column}' have missing values. "
                 f"For defaulted columns, either provide all values or none."
@@ -165,28 +319,210 @@ def _deserialize_array(array_data: list[dict[str, Any]], array_class: type[Fancy
         if column_data:
             data_as_dict_of_lists[column] = column_data
 
-    all_columns_in_array_data = set().union(*(row.keys() for row in array_data))
-    extra_columns = all_columns_in_array_data - array_columns
-    if extra_columns:
-        _logger.warning("Ignoring extra columns %s from array data for %s.", extra_columns, array_class.__name__)
-    return array_class(**data_as_dict_of_lists)
+    all_columns_in_rows = set().union(*(row.keys() for row in rows))
+    return data_as_dict_of_lists, all_columns_in_rows - array_columns
 
 
-def _is_serializable(value: Any, strict: bool, **kwargs) -> bool:
-    # Check if a value is JSON serializable.
+def _get_field_names[G: Grid](grid: G) -> list[str]:
+    """Return the names of the fields of a Grid object that are serialized."""
+    return [
+        field.name for field in dataclasses.fields(grid) if field.name not in ["graphs", "_id_tracker"] and field.init
+    ]
+
+
+def _encode_values[G: Grid](grid: G, strict: bool, **kwargs) -> dict[str, str]:
+    """Encode the non-array values of a Grid object as JSON, by field name.
+
+    Values that are not serializable are left out if strict is False.
+    """
+    encoded_values = {}
+    for field_name in _get_field_names(grid):
+        field_value = getattr(grid, field_name)
+        if isinstance(field_value, FancyArray):
+            continue
+        if (encoded_value := _encode_value(field_value, strict, **kwargs)) is not None:
+            encoded_values[field_name] = encoded_value
+    return encoded_values
+
+
+def _encode_value(value: Any, strict: bool, **kwargs) -> str | None:
+    """Encode a (non-array) value as JSON. Returns None if the value is not serializable and strict is False.
+
+    Values are always encoded with the json module, so the same values are accepted with or without orjson:
+    orjson also encodes e.g. datetimes and NumPy scalars, which can not be loaded into the grid again.
+    """
+    if _get_orjson_option(kwargs) is not None and kwargs.get("indent") is None:
+        kwargs = {**kwargs, "separators": (",", ":")}  # compact, like the rows encoded by orjson
     try:
-        json.dumps(value, **kwargs)
+        return json.dumps(value, **kwargs)
     except TypeError as error:
         msg = f"Failed to serialize '{value}'. You can set strict=False to ignore this attribute."
         if strict:
             raise TypeError(msg) from error
         _logger.warning(msg)
-        return False
-    return True
+        return None
 
 
-def _replace_nan_with_none(value: Any) -> Any:
-    """Replace a NaN value with a JSON-compatible null value."""
-    if isinstance(value, float) and math.isnan(value):
+def _get_orjson_option(kwargs: dict[str, Any]) -> int | None:
+    """Return the orjson option for the json.dumps kwargs, or None if orjson is not installed or cannot be used."""
+    if orjson is None or not set(kwargs) <= {"indent", "sort_keys"} or kwargs.get("indent") not in (None, 2):
         return None
-    return value
+    option = 0
+    if kwargs.get("indent") is not None:
+        option |= orjson.OPT_INDENT_2
+    if kwargs.get("sort_keys"):
+        option |= orjson.OPT_SORT_KEYS
+    return option
+
+
+def _dump_rows(rows: list[dict[str, Any]], item_separator: str, orjson_option: int | None, **kwargs) -> str:
+    """Encode rows as JSON objects, separated by item_separator (without the enclosing brackets)."""
+    if orjson_option is None:
+        return item_separator.join(json.dumps(row, **kwargs) for row in rows)
+    return orjson.dumps(rows, option=orjson_option).decode()[1:-1]
+
+
+def _loads(json_string: str) -> Any:
+    """Decode a JSON string with orjson if possible, otherwise with the json module."""
+    if orjson is not None:
+        try:
+            return orjson.loads(json_string)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN values in older files, which only the json module supports
+    return json.loads(json_string)
+
+
+class _JsonStreamReader:
+    """Incremental JSON reader that parses a file handle value by value, keeping only a small buffer in memory.
+
+    Objects and arrays can be iterated (key by key, or item by item) without decoding them as a whole.
+    """
+
+    def __init__(self, file: TextIO):
+        self._file = file
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def iter_object_keys(self) -> Iterator[str]:
+        """Iterate the keys of the next JSON object. The caller must consume the value of each key."""
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.decode_value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expecting property name", self._buffer, self._pos)
+            self._expect(":")
+            yield key
+            if self._next_delimiter("}"):
+                return
+
+    def iter_array(self) -> Iterator[Any]:
+        """Iterate the (decoded) items of the next JSON array."""
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.decode_value()
+            if self._next_delimiter("]"):
+                return
+
+    def iter_array_chunks(self) -> Iterator[list[Any]]:
+        """Iterate the (decoded) items of the next JSON array in chunks.
+
+        Each chunk contains the items up to the last '}' in the next _DECODE_SIZE characters, decoded with a single
+        call of the json decoder. If that is not possible (e.g. the items are not objects, or a string contains a
+        '}'), the remaining items are decoded one by one.
+        """
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        decode_in_bulk = True
+        while True:
+            items = self._decode_items() if decode_in_bulk else None
+            if items is None:
+                decode_in_bulk = False
+                items = [self.decode_value()]
+            yield items
+            if self._next_delimiter("]"):
+                return
+
+    def decode_value(self) -> Any:
+        """Decode the next JSON value as a whole."""
+        if self._peek() not in ("{", "[", '"'):
+            # a scalar (e.g. a number) is only complete if it is followed by a delimiter
+            while not _SCALAR_END.search(self._buffer, self._pos) and self._read_more():
+                pass
+        while True:
+            try:
+                value, self._pos = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # double the buffer on every retry, so that large values are decoded in linear time
+                if not self._read_more(max(_BLOCK_SIZE, len(self._buffer) - self._pos)):
+                    raise
+                continue
+            return value
+
+    def skip_value(self) -> None:
+        """Skip the next JSON value, without decoding arrays as a whole."""
+        if self._peek() == "[":
+            for _ in self.iter_array():
+                pass
+        else:
+            self.decode_value()
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character (or an empty string at the end of the file)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buffer) or not self._read_more():
+                return self._buffer[self._pos : self._pos + 1]
+
+    def _expect(self, character: str) -> None:
+        if self._peek() != character:
+            raise json.JSONDecodeError(f"Expecting '{character}'", self._buffer, self._pos)
+        self._pos += 1
+
+    def _next_delimiter(self, closing: str) -> bool:
+        """Consume a ',' or the closing character. Returns whether the closing character was found."""
+        character = self._peek()
+        if character not in (",", closing):
+            raise json.JSONDecodeError(f"Expecting ',' or '{closing}'", self._buffer, self._pos)
+        self._pos += 1
+        return character == closing
+
+    def _decode_items(self) -> list[Any] | None:
+        """Decode the next items of the current array at once, up to the last '}' in the next _DECODE_SIZE characters.
+
+        Returns None if there is no '}' or if the items up to it can not be decoded at once.
+        """
+        while len(self._buffer) - self._pos < _DECODE_SIZE and self._read_more():
+            pass
+        end = self._buffer.rfind("}", self._pos, self._pos + _DECODE_SIZE)
+        if end < 0:
+            return None
+        text = "[" + self._buffer[self._pos : end + 1] + "]"
+        try:
+            items, text_end = self._decoder.raw_decode(text)
+        except json.JSONDecodeError:
+            return None
+        # continue after the last decoded item: at the end of the text, or at the closing bracket of the array
+        self._pos += text_end - 2
+        return items
+
+    def _read_more(self, size: int = _BLOCK_SIZE) -> bool:
+        """Read the next size characters of the file into the buffer. Returns False at the end of the file."""
+        if self._eof:
+            return False
+        block = self._file.read(size)
+        if not block:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + block
+        self._pos = 0
+        return True
@@ -6,49 +6,102 @@ import itertools
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 from power_grid_model import ComponentType
 
+from power_grid_model_ds._core.model.arrays.base.errors import RecordDoesNotExist
+from power_grid_model_ds._core.model.constants import EMPTY_ID
 from power_grid_model_ds._core.model.enums.nodes import NodeType
 
 if TYPE_CHECKING:
     from power_grid_model_ds._core.model.grids.base import Grid
 
+# each text line starts with the from node and the to node of a branch, followed by optional comments
+_NR_NODE_COLUMNS = 2
+
 
 def serialize_to_str[G: Grid](grid: G) -> str:
     """See Grid.__str__()"""
-    grid_str = ""
-
-    for transformer3 in grid.three_winding_transformer:
-        nodes = [transformer3.node_1.item(), transformer3.node_2.item(), transformer3.node_3.item()]
-        for combo in itertools.combinations(nodes, 2):
-            grid_str += f"S{combo[0]} S{combo[1]} {transformer3.id.item()},3-transformer\n"
-
-    for branch in grid.branches:
-        from_node = grid.node.get(id=branch.from_node).record
-        to_node = grid.node.get(id=branch.to_node).record
-
-        from_node_str = f"S{from_node.id}" if from_node.node_type == NodeType.SUBSTATION_NODE else str(from_node.id)
-        to_node_str = f"S{to_node.id}" if to_node.node_type == NodeType.SUBSTATION_NODE else str(to_node.id)
-
-        suffix_str = str(branch.id.item())
-        if branch.from_status.item() == 0 or branch.to_status.item() == 0:
-            suffix_str = f"{suffix_str},open"
-
-        if branch.id in grid.transformer.id:
-            suffix_str = f"{suffix_str},{ComponentType.transformer.value}"
-        elif branch.id in grid.link.id:
-            suffix_str = f"{suffix_str},{ComponentType.link.value}"
-        elif branch.id in grid.line.id:
-            pass  # no suffix needed
-        elif branch.id in grid.generic_branch.id:
-            suffix_str = f"{suffix_str},{ComponentType.generic_branch.value}"
-        elif branch.id in grid.asym_line.id:
-            suffix_str = f"{suffix_str},{ComponentType.asym_line.value}"
-        else:
-            raise ValueError(f"Branch {branch.id} is not a transformer, link, line, generic_branch or asym_line")
-
-        grid_str += f"{from_node_str} {to_node_str} {suffix_str}\n"
-    return grid_str
+    grid_lines = [*_serialize_three_winding_transformers(grid), *_serialize_branches(grid)]
+    return "".join(f"{line}\n" for line in grid_lines)
+
+
+def _serialize_three_winding_transformers(grid: "Grid") -> list[str]:
+    """Serialize each three-winding transformer as the three branches between its nodes"""
+    transformer3 = grid.three_winding_transformer
+    return [
+        f"S{combo[0]} S{combo[1]} {transformer3_id},3-transformer"
+        for node_1, node_2, node_3, transformer3_id in zip(
+            transformer3.node_1.tolist(),
+            transformer3.node_2.tolist(),
+            transformer3.node_3.tolist(),
+            transformer3.id.tolist(),
+            strict=True,
+        )
+        for combo in itertools.combinations([node_1, node_2, node_3], 2)
+    ]
+
+
+def _serialize_branches(grid: "Grid") -> list[str]:
+    """Serialize the branches, using vectorized lookups of the node types and branch types"""
+    branches = grid.branches
+    from_positions, from_found = _get_positions(grid.node.id, branches.from_node)
+    to_positions, to_found = _get_positions(grid.node.id, branches.to_node)
+    if not np.all(from_found & to_found):
+        missing = np.union1d(branches.from_node[~from_found], branches.to_node[~to_found])
+        raise RecordDoesNotExist(f"Nodes {missing.tolist()} not found in grid.")
+
+    is_substation = grid.node.node_type == NodeType.SUBSTATION_NODE
+    from_prefix = np.where(is_substation[from_positions], "S", "")
+    to_prefix = np.where(is_substation[to_positions], "S", "")
+    open_suffix = np.where((branches.from_status == 0) | (branches.to_status == 0), ",open", "")
+    type_suffix = _get_branch_type_suffixes(grid, branches.id)
+
+    return [
+        f"{from_prefix_}{from_node} {to_prefix_}{to_node} {branch_id}{open_suffix_}{type_suffix_}"
+        for from_prefix_, from_node, to_prefix_, to_node, branch_id, open_suffix_, type_suffix_ in zip(
+            from_prefix.tolist(),
+            branches.from_node.tolist(),
+            to_prefix.tolist(),
+            branches.to_node.tolist(),
+            branches.id.tolist(),
+            open_suffix.tolist(),
+            type_suffix.tolist(),
+            strict=True,
+        )
+    ]
+
+
+def _get_positions(ids: np.ndarray, lookup_ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the positions of lookup_ids in ids (using a sorted lookup) and a mask of the lookup_ids that were found.
+
+    If an id occurs multiple times in ids, the position of the first occurrence is returned.
+    """
+    if ids.size == 0:
+        return np.zeros(len(lookup_ids), dtype=np.int64), np.zeros(len(lookup_ids), dtype=bool)
+    sorter = np.argsort(ids, kind="stable")
+    positions = sorter[np.searchsorted(ids, lookup_ids, sorter=sorter).clip(max=len(ids) - 1)]
+    return positions, ids[positions] == lookup_ids
+
+
+def _get_branch_type_suffixes(grid: "Grid", branch_ids: np.ndarray) -> np.ndarray:
+    """Return the type suffix of each branch (no suffix for lines), based on the first branch array with its id"""
+    branch_types = [
+        (grid.transformer, f",{ComponentType.transformer.value}"),
+        (grid.link, f",{ComponentType.link.value}"),
+        (grid.line, ""),
+        (grid.generic_branch, f",{ComponentType.generic_branch.value}"),
+        (grid.asym_line, f",{ComponentType.asym_line.value}"),
+    ]
+    type_ids = np.concatenate([array.id for array, _ in branch_types])
+    type_suffixes = np.concatenate([np.full(array.size, suffix, dtype=object) for array, suffix in branch_types])
+
+    positions, found = _get_positions(type_ids, branch_ids)
+    if not np.all(found):
+        raise ValueError(
+            f"Branch {branch_ids[~found][0]} is not a transformer, link, line, generic_branch or asym_line"
+        )
+    return type_suffixes[positions]
 
 
 def deserialize_from_str[G: Grid](grid_class: type[G], *args: str) -> G:
@@ -87,83 +140,116 @@ class _TextSource[G: Grid]:
 
         text_lines = [line for arg in args for line in arg.strip().split("\n")]
 
-        txt_nodes, txt_branches = self.read_txt(text_lines)
-        self.add_nodes(txt_nodes)
-        self.add_branches(txt_branches)
+        from_nodes, to_nodes, comments = self.read_txt(text_lines)
+        self.add_nodes(np.concatenate((from_nodes, to_nodes)))
+        self.add_branches(from_nodes, to_nodes, comments)
         self.grid.set_feeder_ids()
         return self.grid
 
     @staticmethod
-    def read_txt(txt_lines: list[str]) -> tuple[set, list[tuple[str, str, list[str]]]]:
-        """Extract assets from text"""
-
-        txt_nodes = set()
-        txt_branches: list[tuple[str, str, list[str]]] = []
-        for text_line in txt_lines:
-            if not text_line.strip() or text_line.startswith("#"):
-                continue  # skip empty lines and comments
-            try:
-                from_node_str, to_node_str, *comments = text_line.strip().split()
-            except ValueError as err:
-                raise ValueError(f"Text line '{text_line}' is invalid. Skipping...") from err
-            comments = comments[0].split(",") if comments else []
-
-            txt_nodes |= {from_node_str, to_node_str}
-            txt_branches.append((from_node_str, to_node_str, comments))
-        return txt_nodes, txt_branches
-
-    def add_nodes(self, nodes: set[str]):
-        """Add nodes to the grid"""
-        source_nodes = {int(node[1:]) for node in nodes if node.startswith("S")}
-        regular_nodes = {int(node) for node in nodes if not node.startswith("S")}
-
-        if source_nodes.intersection(regular_nodes):
+    def read_txt(txt_lines: list[str]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Extract the from nodes, to nodes and comments of the branches from text, as string arrays"""
+
+        txt_lines = [text_line for text_line in txt_lines if text_line.strip() and not text_line.startswith("#")]
+        rows = [text_line.split() for text_line in txt_lines]
+        for text_line, row in zip(txt_lines, rows, strict=True):
+            if len(row) < _NR_NODE_COLUMNS:
+                raise ValueError(f"Text line '{text_line}' is invalid. Skipping...")
+        if not rows:
+            return np.array([], dtype=str), np.array([], dtype=str), np.array([], dtype=str)
+        # transpose the rows to columns in one go; only the first comment of each row is used
+        columns = list(itertools.zip_longest(*rows, fillvalue=""))
+        comments = columns[_NR_NODE_COLUMNS] if len(columns) > _NR_NODE_COLUMNS else [""] * len(rows)
+        return np.array(columns[0]), np.array(columns[1]), np.array(comments)
+
+    def add_nodes(self, nodes: np.ndarray):
+        """Add all nodes to the grid at once"""
+        is_source = np.char.startswith(nodes, "S")
+        node_ids = _to_node_ids(nodes)
+        source_nodes = np.unique(node_ids[is_source])
+        regular_nodes = np.unique(node_ids[~is_source])
+
+        if np.intersect1d(source_nodes, regular_nodes).size:
             raise ValueError("Source nodes and regular nodes have overlapping ids")
 
-        for node_id in sorted(source_nodes):
-            new_node = self.grid.node.empty(1)
-            new_node.id = node_id
-            new_node.node_type = NodeType.SUBSTATION_NODE
-            self.grid.append(new_node, check_max_id=False)
-
-        for node_id in sorted(regular_nodes):
-            new_node = self.grid.node.empty(1)
-            new_node.id = node_id
-            self.grid.append(new_node, check_max_id=False)
-
-    def add_branches(self, branches: list[tuple[str, str, list[str]]]):
-        """Add branches to the grid"""
-        for from_node_str, to_node_str, comments in branches:
-            self.add_branch((from_node_str, to_node_str), comments)
-
-    def add_branch(self, branch: tuple[str, str], comments: list[str]):
-        """Add a branch to the grid"""
-        from_node_str, to_node_str = branch
-        from_node = int(from_node_str.replace("S", ""))
-        to_node = int(to_node_str.replace("S", ""))
-
-        if ComponentType.transformer.value in comments:
-            new_branch = self.grid.transformer.empty(1)
-        elif ComponentType.link.value in comments:
-            new_branch = self.grid.link.empty(1)
-        elif ComponentType.generic_branch.value in comments:
-            new_branch = self.grid.generic_branch.empty(1)
-        elif ComponentType.asym_line.value in comments:
-            new_branch = self.grid.asym_line.empty(1)
-        else:  # assume it is a line
-            new_branch = self.grid.line.empty(1)
+        new_nodes = self.grid.node.empty(len(source_nodes) + len(regular_nodes))
+        new_nodes.id = np.concatenate((source_nodes, regular_nodes))
+        new_nodes.node_type = np.where(
+            np.arange(new_nodes.size) < len(source_nodes), NodeType.SUBSTATION_NODE, new_nodes.node_type
+        )
+        self.grid.append(new_nodes, check_max_id=False)
+
+    def add_branches(self, from_nodes: np.ndarray, to_nodes: np.ndarray, comments: np.ndarray):
+        """Add all branches to the grid, with a single append per branch type.
+
+        Branches without an id get an id in order of appearance, as if they were appended one by one.
+        """
+        if not from_nodes.size:
+            return
+        # surround the comments with commas, so that each comment can be matched as a whole
+        padded_comments = np.char.add(np.char.add(",", comments), ",")
+        branch_types = self._get_branch_types(padded_comments)
+        branch_ids = np.array(
+            [
+                self._get_branch_id((from_node, to_node), comment.split(",")) if comment else EMPTY_ID
+                for from_node, to_node, comment in zip(
+                    from_nodes.tolist(), to_nodes.tolist(), comments.tolist(), strict=True
+                )
+            ]
+        )
+        branch_ids = _fill_missing_ids(branch_ids, start_max_id=self.grid.max_id)
+        from_node_ids = _to_node_ids(from_nodes)
+        to_node_ids = _to_node_ids(to_nodes)
+        is_open = np.char.find(padded_comments, ",open,") >= 0
+
+        for branch_type in dict.fromkeys(branch_types.tolist()):
+            mask = branch_types == branch_type
+            new_branches = getattr(self.grid, branch_type).empty(int(mask.sum()))
+            new_branches.id = branch_ids[mask]
+            new_branches.from_node = from_node_ids[mask]
+            new_branches.to_node = to_node_ids[mask]
+            new_branches.from_status = 1
+            new_branches.to_status = np.where(is_open[mask], 0, 1)
+            self.grid.append(new_branches, check_max_id=False)
 
+    @staticmethod
+    def _get_branch_types(padded_comments: np.ndarray) -> np.ndarray:
+        """Return the name of the grid array of each branch, based on its comments (surrounded by commas)"""
+        component_types = [
+            ComponentType.transformer,
+            ComponentType.link,
+            ComponentType.generic_branch,
+            ComponentType.asym_line,
+        ]
+        return np.select(
+            [np.char.find(padded_comments, f",{component_type.value},") >= 0 for component_type in component_types],
+            [component_type.value for component_type in component_types],
+            default=ComponentType.line.value,  # assume it is a line
+        )
+
+    @staticmethod
+    def _get_branch_id(branch: tuple[str, str], comments: list[str]) -> int:
+        """Return the id of a branch, or EMPTY_ID if the branch has no id"""
         branch_ids = [branch_id for branch_id in comments if branch_id.isdigit()]
-        if branch_ids:
-            if len(branch_ids) > 1:
-                raise ValueError(f"Multiple branch ids found in row {branch} {','.join(comments)}")
-            new_branch.id = int(branch_ids[0])
-
-        new_branch.from_node = from_node
-        new_branch.to_node = to_node
-        new_branch.from_status = 1
-        if "open" in comments:
-            new_branch.to_status = 0
-        else:
-            new_branch.to_status = 1
-        self.grid.append(new_branch, check_max_id=False)
+        if len(branch_ids) > 1:
+            raise ValueError(f"Multiple branch ids found in row {branch} {','.join(comments)}")
+        return int(branch_ids[0]) if branch_ids else EMPTY_ID
+
+
+def _to_node_ids(nodes: np.ndarray) -> np.ndarray:
+    """Convert node strings (with an 'S' prefix for source nodes) to node ids"""
+    # int() on a list is faster than casting a string array with astype
+    return np.array(list(map(int, np.char.replace(nodes, "S", "").tolist())), dtype=np.int64)
+
+
+def _fill_missing_ids(ids: np.ndarray, start_max_id: int) -> np.ndarray:
+    """Replace EMPTY_ID values with max_id + 1, where max_id is the maximum id before that position (or start_max_id).
+
+    This gives the same ids as appending the rows one by one, without a loop:
+    the max id at position i equals max_k(ids[k] - n_missing[k]) + n_missing[i] over the given ids k <= i.
+    """
+    missing = ids == EMPTY_ID
+    n_missing = np.cumsum(missing)
+    offsets = np.where(missing, np.iinfo(np.int64).min, ids.astype(np.int64) - n_missing)
+    max_offsets = np.maximum.accumulate(np.maximum(offsets, start_max_id))
+    return np.where(missing, max_offsets + n_missing, ids)
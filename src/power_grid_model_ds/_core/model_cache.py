@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Stores the ModelCache class"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+from power_grid_model import PowerGridModel
+from power_grid_model.data_types import SingleDataset
+
+from power_grid_model_ds._core.utils.misc import update_digest_with_array
+
+_logger = logging.getLogger(__name__)
+
+
+class ModelCache:
+    """Least-recently-used cache of constructed PowerGridModel instances, keyed on the content of the input data.
+
+    Constructing a PowerGridModel is expensive for large grids. When the same (base) grid is calculated repeatedly,
+    e.g. by a service that applies different updates to it, the cache constructs the model once and hands out copies.
+    A copy can be updated freely without affecting the cached model.
+
+    Examples:
+        >>> cache = ModelCache(maxsize=4)
+        >>> PowerGridModelInterface(grid, model_cache=cache).calculate_power_flow()  # constructs the model
+        >>> PowerGridModelInterface(grid, model_cache=cache).calculate_power_flow()  # copies the cached model
+
+    Args:
+        maxsize: the maximum number of models to keep.
+    """
+
+    def __init__(self, maxsize: int = 8):
+        if maxsize < 1:
+            raise ValueError("maxsize should be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._models: OrderedDict[str, PowerGridModel] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def get_model(self, input_data: SingleDataset, system_frequency: float = 50.0) -> PowerGridModel:
+        """Return a copy of the cached model for this input data, constructing (and caching) it if needed."""
+        key = get_input_key(input_data, system_frequency)
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+                self.hits += 1
+                return model.copy()
+            self.misses += 1
+
+        _logger.debug("Constructing PowerGridModel for key %s", key)
+        model = PowerGridModel(input_data, system_frequency=system_frequency)
+        with self._lock:
+            self._models[key] = model
+            self._models.move_to_end(key)
+            while len(self._models) > self.maxsize:
+                self._models.popitem(last=False)
+        return model.copy()
+
+    def clear(self) -> None:
+        """Remove all models from the cache."""
+        with self._lock:
+            self._models.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def get_input_key(input_data: SingleDataset, system_frequency: float) -> str:
+    """Return a hash of the content of (row based or columnar) input data and the system frequency."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(float(system_frequency)).encode())
+    for component in sorted(input_data, key=str):
+        digest.update(str(component).encode())
+        data = input_data[component]
+        if isinstance(data, dict):
+            for attribute in sorted(data, key=str):
+                digest.update(str(attribute).encode())
+                update_digest_with_array(digest, data[attribute])
+        else:
+            update_digest_with_array(digest, data)
+    return digest.hexdigest()
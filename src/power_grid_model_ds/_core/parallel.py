@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Helpers to run power-grid-model batch calculations in worker processes"""
+
+from collections import deque
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor, Future
+from typing import Any
+
+import numpy as np
+from power_grid_model import PowerGridModel
+from power_grid_model.data_types import BatchDataset, Dataset, SingleDataset
+
+# The model of the current worker process, created once per worker by init_worker()
+_WORKER_MODELS: dict[str, PowerGridModel] = {}
+
+
+def init_worker(input_data: SingleDataset, system_frequency: float) -> None:
+    """Create the model of a worker process. The input data is sent to each worker only once."""
+    _WORKER_MODELS["model"] = PowerGridModel(input_data, system_frequency=system_frequency)
+
+
+def calculate_chunk(update_data: BatchDataset, kwargs: dict[str, Any]) -> Dataset:
+    """Calculate the power flow of a chunk of scenarios with the model of the worker process."""
+    if "model" not in _WORKER_MODELS:
+        raise RuntimeError("The worker process has not been initialized.")
+    return _WORKER_MODELS["model"].calculate_power_flow(update_data=update_data, **kwargs)
+
+
+def calculate_chunks(
+    executor: Executor, chunks: Iterable[BatchDataset], kwargs: dict[str, Any], max_pending: int
+) -> list[Dataset]:
+    """Calculate the chunks in the worker processes of the executor and return the outputs in order.
+
+    At most max_pending chunks are submitted at a time, so a chunk is only taken from the iterable (and kept in
+    memory) shortly before a worker needs it.
+    """
+    outputs: list[Dataset] = []
+    pending: deque[Future[Dataset]] = deque()
+    for chunk in chunks:
+        if len(pending) >= max_pending:
+            outputs.append(pending.popleft().result())
+        pending.append(executor.submit(calculate_chunk, chunk, kwargs))
+    outputs.extend(future.result() for future in pending)
+    return outputs
+
+
+def concatenate_batches(outputs: Sequence[Dataset]) -> Dataset:
+    """Concatenate the (dense) batch output of consecutive chunks into a single batch dataset."""
+    if not outputs:
+        return {}
+    result: Dataset = {}
+    for component, array in outputs[0].items():
+        if not isinstance(array, np.ndarray):
+            raise NotImplementedError(f"Columnar output is not supported in parallel calculations ({component}).")
+        result[component] = np.concatenate([output[component] for output in outputs], axis=0)
+    return result
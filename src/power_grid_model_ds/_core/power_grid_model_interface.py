@@ -4,27 +4,82 @@
 
 """Power flow functions and classes"""
 
+import dataclasses
+import logging
+import math
+import os
+import time
 import warnings
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
 import numpy as np
-from power_grid_model import CalculationMethod, ComponentType, PowerGridModel, initialize_array
-from power_grid_model.data_types import Dataset, SingleArray, SingleDataset
-
+import numpy.typing as npt
+from power_grid_model import (
+    CalculationMethod,
+    ComponentType,
+    DatasetType,
+    PowerGridModel,
+    initialize_array,
+    power_grid_meta_data,
+)
+from power_grid_model.data_types import (
+    BatchArray,
+    BatchDataset,
+    Dataset,
+    SingleArray,
+    SingleColumnarData,
+    SingleDataset,
+)
+
+from power_grid_model_ds._core import fancypy as fp
+from power_grid_model_ds._core.grid_results import GridResults
 from power_grid_model_ds._core.model.arrays.base.array import FancyArray
+from power_grid_model_ds._core.model.constants import EMPTY_ID
 from power_grid_model_ds._core.model.grids.base import Grid
+from power_grid_model_ds._core.model_cache import ModelCache
+from power_grid_model_ds._core.parallel import calculate_chunks, concatenate_batches, init_worker
+from power_grid_model_ds._core.time_series import (
+    TimeSeriesResult,
+    allocate_output,
+    get_n_steps,
+    iter_chunks,
+    write_chunk,
+)
+from power_grid_model_ds._core.utils.fields import copy_fields, get_field_plan
+from power_grid_model_ds.arrays import Branch3Array, BranchArray
+
+_logger = logging.getLogger(__name__)
+
+_STATUS_COLUMNS = ("from_status", "to_status", "status_1", "status_2", "status_3")
 
 
 class PGMCoreException(Exception):
     """Raised when there is an error in running the power grid model"""
 
 
-class PowerGridModelInterface:
+# The interface holds the grid, the model with its input and output data, and the model settings.
+class PowerGridModelInterface:  # pylint: disable=too-many-instance-attributes
     """Interface between the Grid and the PowerGridModel (pgm).
 
     - Can convert grid data to pgm input
-    - Can calculate power flow
+    - Can calculate power flow, state estimation and short circuit
     - Can do batch calculations using pgm
     - Can update grid with output from power flow
+
+    Args:
+        grid: the grid to calculate
+        input_data: power-grid-model input data, as an alternative to the grid
+        system_frequency: the system frequency in Hz
+        zero_copy: if True, the input data refers to the grid arrays instead of copying them.
+            Arrays with the same dtype as the power-grid-model input are used as is, other arrays are passed
+            as columnar data (views on the matching columns). The interface then keeps no copy of the grid as
+            input data. Note that the column views are strided, so power-grid-model still copies each column
+            into a contiguous buffer while the model is constructed; these copies are released afterwards.
+            Any change to the grid is reflected in the input data and sync_from_grid() will always rebuild.
+        model_cache: if given, the model is taken from this cache (as a copy) instead of being constructed
+            whenever a model with the same input data has been constructed before.
     """
 
     def __init__(
@@ -32,13 +87,20 @@ class PowerGridModelInterface:
         grid: Grid | None = None,
         input_data: SingleDataset | None = None,
         system_frequency: float = 50.0,
+        zero_copy: bool = False,
+        *,
+        model_cache: ModelCache | None = None,
     ):
         self.grid = grid or Grid.empty()
         self.system_frequency = system_frequency
+        self.zero_copy = zero_copy
+        self.model_cache = model_cache
 
         self._input_data: SingleDataset = input_data or {}
         self.output_data: Dataset = {}
         self.model: PowerGridModel | None = None
+        # True when the model has been updated with update_model(), i.e. it differs from the input data
+        self._has_model_updates = False
 
     @property
     def input_data(self) -> SingleDataset:
@@ -68,6 +130,9 @@ class PowerGridModelInterface:
         Note that for some arrays, not all fields are available in the PowerGridModel input.
         In this case, the default values are used.
 
+        All arrays are created first (from row based or columnar input), after which the ids and the graphs
+        of the grid are built in a single step.
+
         Args:
             check_ids: if True, check if the ids are unique
 
@@ -75,9 +140,13 @@ class PowerGridModelInterface:
         """
         for pgm_name in ComponentType:
             if pgm_name in self._input_data and hasattr(self.grid, pgm_name):
-                self.grid.append(self._create_pgm_ds_array(pgm_name), check_max_id=False)
+                array = self._create_pgm_ds_array(pgm_name)
+                current_array = getattr(self.grid, pgm_name)
+                setattr(self.grid, pgm_name, fp.concatenate(current_array, array) if current_array.size else array)
         if check_ids:
             self.grid.check_ids()
+        self.grid.rebuild_ids(check_ids=False)
+        self.grid.rebuild_graphs()
         return self.grid
 
     def calculate_power_flow(
@@ -99,6 +168,162 @@ class PowerGridModelInterface:
         )
         return self.output_data
 
+    def calculate_state_estimation(
+        self,
+        calculation_method: CalculationMethod = CalculationMethod.iterative_linear,
+        update_data: Dataset | None = None,
+        **kwargs,
+    ) -> Dataset:
+        """Initialize the PowerGridModel and calculate the state estimation over input data.
+
+        The input data and model are shared with the other calculations of this interface, so the model is
+        constructed only once. Sensor time series can be passed as (batch) update_data.
+        Use self.update_grid() to write the (single) output into the grid.
+
+        Returns output of the state estimation (also stored in self.output_data)
+        """
+        self.model = self.model or self.setup_model()
+
+        self.output_data = self.model.calculate_state_estimation(
+            calculation_method=calculation_method, update_data=update_data, **kwargs
+        )
+        return self.output_data
+
+    def calculate_short_circuit(
+        self,
+        calculation_method: CalculationMethod = CalculationMethod.iec60909,
+        update_data: Dataset | None = None,
+        **kwargs,
+    ) -> Dataset:
+        """Initialize the PowerGridModel and calculate the short circuit currents of the faults in the grid.
+
+        The input data and model are shared with the other calculations of this interface, so the model is
+        constructed only once. Fault scenarios can be passed as (batch) update_data.
+        Use self.update_grid() to write the (single) output into the grid.
+
+        Returns output of the short circuit calculation (also stored in self.output_data)
+        """
+        self.model = self.model or self.setup_model()
+
+        self.output_data = self.model.calculate_short_circuit(
+            calculation_method=calculation_method, update_data=update_data, **kwargs
+        )
+        return self.output_data
+
+    def run_time_series(
+        self,
+        profile_source: BatchDataset | Iterable[BatchDataset],
+        chunk_size: int = 1000,
+        threading: int = -1,
+        *,
+        n_steps: int | None = None,
+        output_dir: Path | None = None,
+        **kwargs,
+    ) -> TimeSeriesResult:
+        """Run a time series of power flow calculations in chunks of time steps.
+
+        Each chunk is calculated as a single power-grid-model batch calculation. The output of all chunks is written
+        into preallocated arrays, so the memory use of the calculation itself is bounded by the chunk size.
+
+        Args:
+            profile_source: the update data of all time steps. Either a batch dataset (e.g. load profiles with
+                shape (n_steps, n_loads)), which is split in chunks of chunk_size time steps,
+                or an iterable that yields the batch datasets chunk by chunk.
+            chunk_size: the number of time steps per chunk (only used when profile_source is a batch dataset).
+            threading: the threading option of power-grid-model (-1: sequential, 0: all cores, n: n threads).
+            n_steps: the total number of time steps. Required when profile_source is an iterable of chunks.
+            output_dir: if given, the output is stored in memory-mapped .npy files ('<component>.npy') in this
+                directory instead of in memory.
+            **kwargs: keyword arguments passed to PowerGridModel.calculate_power_flow
+                (e.g. calculation_method or output_component_types).
+
+        Returns:
+            TimeSeriesResult: the output per component with shape (n_steps, n_elements) and the timing per chunk.
+                The output is also stored in self.output_data.
+
+        Raises:
+            ValueError: if the profile source contains more time steps than n_steps.
+        """
+        self.model = self.model or self.setup_model()
+        total_steps = get_n_steps(profile_source, n_steps)
+
+        result = TimeSeriesResult(output_data={})
+        start = 0
+        for chunk_index, (chunk, chunk_steps) in enumerate(iter_chunks(profile_source, chunk_size)):
+            if start + chunk_steps > total_steps:
+                raise ValueError(f"The profile source contains more than n_steps ({total_steps}) time steps.")
+
+            chunk_start_time = time.perf_counter()
+            chunk_output = self.model.calculate_power_flow(update_data=chunk, threading=threading, **kwargs)
+            if not result.output_data:
+                result.output_data = allocate_output(chunk_output, total_steps, output_dir)
+            write_chunk(result.output_data, chunk_output, start)
+            result.chunk_timings.append(time.perf_counter() - chunk_start_time)
+
+            _logger.debug(
+                "Calculated chunk %d (%d time steps) in %.3f s", chunk_index, chunk_steps, result.chunk_timings[-1]
+            )
+            start += chunk_steps
+
+        if start < total_steps:
+            _logger.warning("The profile source contained %d of %d time steps", start, total_steps)
+            result.output_data = {component: array[:start] for component, array in result.output_data.items()}
+
+        self.output_data = result.output_data
+        return result
+
+    def calculate_parallel(
+        self,
+        update_batches: BatchDataset | Iterable[BatchDataset],
+        workers: int | None = None,
+        chunk_size: int | None = None,
+        **kwargs,
+    ) -> Dataset:
+        """Calculate power flow for independent batches of scenarios in parallel worker processes.
+
+        The input data is sent to each worker process once, after which only the update data of each chunk and its
+        output are transferred. Use this for large studies (e.g. N-1 or Monte Carlo) on machines with many cores;
+        within a single process, the threading option of power-grid-model can be used instead.
+        The chunks are submitted as the workers become available, so an iterable of chunks is consumed lazily.
+
+        The workers are built from the input data, which includes the changes applied with sync_from_grid().
+        Updates applied with update_model() are not part of the input data and can not be sent to the workers.
+
+        Args:
+            update_batches: either a batch dataset, which is split in chunks of chunk_size scenarios,
+                or an iterable of batch datasets (chunks).
+            workers: the number of worker processes. Defaults to the number of processors.
+            chunk_size: the number of scenarios per chunk when update_batches is a batch dataset.
+                Defaults to an equal division over the workers.
+            **kwargs: keyword arguments passed to PowerGridModel.calculate_power_flow.
+
+        Returns:
+            Dataset: the output of all scenarios as a single batch dataset, in the order of update_batches
+                (also stored in self.output_data).
+
+        Raises:
+            PGMCoreException: if the model has been updated with update_model().
+        """
+        if self._has_model_updates:
+            raise PGMCoreException(
+                "Can not calculate in parallel after update_model(): the workers are built from the input data. "
+                "Apply the changes to the grid and use sync_from_grid() instead."
+            )
+        self._input_data = self._input_data or self.create_input_from_grid()
+        n_workers = workers or os.cpu_count() or 1
+        if isinstance(update_batches, dict) and chunk_size is None:
+            chunk_size = max(1, math.ceil(get_n_steps(update_batches, None) / n_workers))
+        chunks = (chunk for chunk, _ in iter_chunks(update_batches, chunk_size or 1))
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers, initializer=init_worker, initargs=(self._input_data, self.system_frequency)
+        ) as executor:
+            # keep each worker busy with one chunk, while the next chunk is waiting
+            outputs = calculate_chunks(executor, chunks, kwargs, max_pending=2 * n_workers)
+
+        self.output_data = concatenate_batches(outputs)
+        return self.output_data
+
     def update_model(self, update_data: Dataset) -> None:
         """
         Updates the power-grid-model using update_data, this allows for batch calculations
@@ -125,6 +350,55 @@ class PowerGridModelInterface:
         """
         self.model = self.model or self.setup_model()
         self.model.update(update_data=update_data)
+        self._has_model_updates = True
+
+    def sync_from_grid(self) -> SingleDataset:
+        """Synchronise the model with the current state of the grid.
+
+        The grid arrays are compared with the input data of the model (by id, on the power-grid-model input columns)
+        and only the changed values are passed to the model as an update. The values themselves are compared, so
+        changes that are written directly into a column (e.g. grid.sym_load.p_specified[0] = 1e6) are found as well.
+        If components have been added or removed, or if values changed that can not be updated in the
+        power-grid-model (e.g. from_node), the input data and the model are rebuilt from the grid instead.
+        With zero_copy, the input data refers to the grid arrays, so changes can not be detected and the input data
+        and the model are always rebuilt. The same holds after update_model(), since those updates are not part of
+        the input data.
+
+        Returns:
+            SingleDataset: the update data that was applied to the model.
+                Empty if nothing changed or if the model has been (re)built.
+        """
+        if self.model is None or self.zero_copy or self._has_model_updates:
+            self._rebuild_model()
+            return {}
+
+        update_data: SingleDataset = {}
+        new_input_data: SingleDataset = {}
+        for array_name in ComponentType:
+            if not hasattr(self.grid, array_name):
+                continue
+
+            pgm_array = self._copy_power_grid_array(array_name=array_name)
+            if array_name not in self._input_data:
+                if not pgm_array.size:
+                    continue
+                update_array = None
+            else:
+                update_array = _create_update_array(array_name, self._input_data[array_name], pgm_array)
+
+            if update_array is None:
+                _logger.debug("Rebuilding the model: %s can not be updated incrementally", array_name)
+                self._rebuild_model()
+                return {}
+
+            if update_array.size:
+                new_input_data[array_name] = pgm_array
+                update_data[array_name] = update_array
+
+        if update_data:
+            self.model.update(update_data=update_data)
+        self._input_data.update(new_input_data)
+        return update_data
 
     def update_grid(self) -> None:
         """
@@ -136,22 +410,49 @@ class PowerGridModelInterface:
             if not hasattr(self.grid, array_name):
                 continue
             internal_array = getattr(self.grid, array_name)
-            pgm_output_array = self.output_data[array_name]
-            fields = self._match_dtypes(pgm_output_array.dtype, internal_array.dtype)
-            internal_array[fields] = pgm_output_array[fields]
+            if copy_fields(self.output_data[array_name], internal_array.data):
+                internal_array.mark_modified()
+
+    def get_results(self, output_dir: Path | None = None) -> GridResults:
+        """Get the output (of a single or batch calculation) as GridResults, aligned with the grid arrays.
+
+        Args:
+            output_dir: if given, the results are stored in memory-mapped files in this directory.
+        """
+        if not self.output_data:
+            raise PGMCoreException("Can not get results without output_data")
+        return GridResults.from_output(self.output_data, grid=self.grid, output_dir=output_dir)
 
     def setup_model(self) -> PowerGridModel:
         """Set up the PowerGridModel with the input data."""
         self._input_data = self._input_data or self.create_input_from_grid()
-        self.model = PowerGridModel(self._input_data, system_frequency=self.system_frequency)
+        if self.model_cache is None:
+            self.model = PowerGridModel(self._input_data, system_frequency=self.system_frequency)
+        else:
+            self.model = self.model_cache.get_model(self._input_data, system_frequency=self.system_frequency)
+        self._has_model_updates = False
         return self.model
 
-    def _create_power_grid_array(self, array_name: str) -> SingleArray:
+    def _rebuild_model(self) -> None:
+        self._input_data = {}
+        self.model = None
+        self.setup_model()
+
+    def _create_power_grid_array(self, array_name: str) -> SingleArray | SingleColumnarData:
         """Create power grid model array"""
+        if not self.zero_copy:
+            return self._copy_power_grid_array(array_name)
+
+        internal_array = getattr(self.grid, array_name)
+        pgm_dtype = power_grid_meta_data[DatasetType.input][array_name].dtype
+        if internal_array.dtype == pgm_dtype:
+            return internal_array.data
+        return {field: internal_array.data[field] for field in get_field_plan(internal_array.dtype, pgm_dtype)}
+
+    def _copy_power_grid_array(self, array_name: str) -> SingleArray:
         internal_array = getattr(self.grid, array_name)
         pgm_array = initialize_array("input", array_name, internal_array.size)
-        fields = self._match_dtypes(pgm_array.dtype, internal_array.dtype)
-        pgm_array[fields] = internal_array.data[fields]
+        copy_fields(internal_array.data, pgm_array)
         return pgm_array
 
     def _create_pgm_ds_array(self, pgm_name: str) -> FancyArray:
@@ -159,12 +460,153 @@ class PowerGridModelInterface:
         pgm_ds_array_class: type[FancyArray] = getattr(self.grid, pgm_name).__class__
 
         # If a dict, then the keys are the column names and the values the array for that column.
+        # Columns that are not part of the array (e.g. zero sequence parameters) are ignored, as for structured input.
         if isinstance(input_component, dict):
-            return pgm_ds_array_class(**input_component)
+            columns = set(pgm_ds_array_class.get_dtype().names)
+            return pgm_ds_array_class(
+                **{column: values for column, values in input_component.items() if column in columns}
+            )
 
         # Otherwise it should be a structured array that can be passed directly to the constructor.
         return pgm_ds_array_class(input_component)
 
-    @staticmethod
-    def _match_dtypes(first_dtype: np.dtype, second_dtype: np.dtype) -> list[str]:
-        return list(set(first_dtype.names).intersection(set(second_dtype.names)))  # type: ignore[arg-type]
+
+def build_n_minus_1_batch(grid: Grid, branch_ids: npt.ArrayLike, dense: bool = True) -> BatchDataset:
+    """Build a batch update with one scenario per outage of the given branches.
+
+    In scenario i, branch_ids[i] is switched off at all sides (from_status/to_status or status_1/2/3).
+    All branch arrays and three-winding transformers of the grid are supported.
+
+    Args:
+        grid: the grid that contains the branches.
+        branch_ids: the ids of the branches to take out, one scenario per id.
+        dense: if True, a dense batch is created with shape (n_scenarios, n_outages_in_component) per component.
+            If False, a sparse batch is created, which needs only one record per scenario
+            (recommended for a large number of contingencies).
+
+    Returns:
+        BatchDataset: the update data, to be used as update_data in a batch calculation.
+
+    Raises:
+        ValueError: if a branch id is not found in the branch arrays of the grid.
+
+    Example:
+        >>> update_data = build_n_minus_1_batch(grid, grid.line.id)
+        >>> output = PowerGridModelInterface(grid).calculate_power_flow(update_data=update_data)
+        >>> max_loading = get_n_minus_1_max_loading(output, grid.line.id)
+    """
+    branch_ids = np.asarray(branch_ids)
+    n_scenarios = branch_ids.size
+    update_data: BatchDataset = {}
+    found = np.zeros(n_scenarios, dtype=bool)
+    for field in dataclasses.fields(grid):
+        array = getattr(grid, field.name)
+        if not isinstance(array, (BranchArray, Branch3Array)):
+            continue
+        scenarios = np.flatnonzero(np.isin(branch_ids, array.id))
+        if not scenarios.size:
+            continue
+        found[scenarios] = True
+        update_data[field.name] = _create_outage_update(
+            field.name, branch_ids[scenarios], scenarios, n_scenarios, dense
+        )
+
+    if not found.all():
+        raise ValueError(f"Branches {branch_ids[~found].tolist()} not found in the grid.")
+    return update_data
+
+
+def get_n_minus_1_max_loading(output_data: Dataset, branch_ids: npt.ArrayLike) -> np.ndarray:
+    """Get the maximum branch loading per contingency from the output of an N-1 batch calculation.
+
+    Args:
+        output_data: the (dense) batch output of a calculation with build_n_minus_1_batch(grid, branch_ids).
+        branch_ids: the branch ids that were used to build the batch.
+
+    Returns:
+        np.ndarray: a structured array with one record per contingency and the fields
+            'id' (the branch that was taken out), 'max_loading' and 'max_loading_id' (the most loaded branch).
+    """
+    branch_ids = np.asarray(branch_ids)
+    result = np.zeros(
+        branch_ids.size, dtype=[("id", np.int32), ("max_loading", np.float64), ("max_loading_id", np.int32)]
+    )
+    result["id"] = branch_ids
+    result["max_loading"] = -np.inf
+    result["max_loading_id"] = EMPTY_ID
+    scenarios = np.arange(branch_ids.size)
+    for array in output_data.values():
+        if not isinstance(array, np.ndarray) or not array.size or "loading" not in (array.dtype.names or ()):
+            continue
+        loading = np.where(np.isnan(array["loading"]), -np.inf, array["loading"])
+        max_index = np.argmax(loading, axis=1)
+        max_loading = loading[scenarios, max_index]
+        is_higher = max_loading > result["max_loading"]
+        result["max_loading"][is_higher] = max_loading[is_higher]
+        result["max_loading_id"][is_higher] = array["id"][scenarios, max_index][is_higher]
+    result["max_loading"][np.isneginf(result["max_loading"])] = np.nan
+    return result
+
+
+def _create_outage_update(
+    component: str, outage_ids: np.ndarray, scenarios: np.ndarray, n_scenarios: int, dense: bool
+) -> BatchArray:
+    """Create the update data of a single component, in which outage_ids[i] is switched off in scenarios[i]."""
+    update_columns = power_grid_meta_data[DatasetType.update][component].dtype.names or ()
+    status_columns = [column for column in update_columns if column in _STATUS_COLUMNS]
+    if dense:
+        update_array = initialize_array("update", component, (n_scenarios, outage_ids.size))
+        update_array["id"] = outage_ids
+        for column in status_columns:
+            update_array[column][scenarios, np.arange(outage_ids.size)] = 0
+        return update_array
+
+    update_array = initialize_array("update", component, outage_ids.size)
+    update_array["id"] = outage_ids
+    for column in status_columns:
+        update_array[column] = 0
+    indptr = np.zeros(n_scenarios + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum(np.bincount(scenarios, minlength=n_scenarios))
+    return {"indptr": indptr, "data": update_array}
+
+
+def _create_update_array(component: str, previous: np.ndarray, current: np.ndarray) -> np.ndarray | None:
+    """Create an update array with the records of current that differ from previous.
+
+    Returns None if the records can not be updated, i.e. when ids differ or non-updatable columns changed.
+    """
+    if previous.size != current.size:
+        return None
+    if not np.array_equal(previous["id"], current["id"]):
+        previous = previous[np.argsort(previous["id"], kind="stable")]
+        current = current[np.argsort(current["id"], kind="stable")]
+        if not np.array_equal(previous["id"], current["id"]):
+            return None
+
+    update_columns = initialize_array("update", component, 0).dtype.names or ()
+    changed_rows = np.zeros(current.size, dtype=bool)
+    changed_columns = []
+    for column in current.dtype.names or ():
+        changed = _get_changed_rows(previous[column], current[column])
+        if not changed.any():
+            continue
+        if column not in update_columns:
+            return None
+        changed_columns.append(column)
+        changed_rows |= changed
+
+    update_array = initialize_array("update", component, int(np.count_nonzero(changed_rows)))
+    update_array["id"] = current["id"][changed_rows]
+    for column in changed_columns:
+        update_array[column] = current[column][changed_rows]
+    return update_array
+
+
+def _get_changed_rows(previous: np.ndarray, current: np.ndarray) -> np.ndarray:
+    """Compare two columns row-wise. NaN values are considered equal."""
+    changed = previous != current
+    if np.issubdtype(current.dtype, np.floating):
+        changed &= ~(np.isnan(previous) & np.isnan(current))
+    if changed.ndim > 1:
+        changed = changed.any(axis=tuple(range(1, changed.ndim)))
+    return changed
@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Helpers to run time series (batch) calculations in chunks"""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+from power_grid_model.data_types import BatchDataset, Dataset
+from power_grid_model.utils import get_dataset_batch_size
+
+
+@dataclass
+class TimeSeriesResult:
+    """Result of PowerGridModelInterface.run_time_series()"""
+
+    output_data: Dataset
+    """The output of all time steps per component, with shape (n_steps, n_elements)."""
+
+    chunk_timings: list[float] = field(default_factory=list)
+    """The calculation time of each chunk in seconds."""
+
+    @property
+    def n_steps(self) -> int:
+        """The number of calculated time steps."""
+        return next((len(array) for array in self.output_data.values()), 0)
+
+
+def iter_chunks(
+    profile_source: BatchDataset | Iterable[BatchDataset], chunk_size: int
+) -> Iterator[tuple[BatchDataset, int]]:
+    """Yield (chunk, chunk_batch_size) for a batch dataset or an iterable of batch datasets.
+
+    A batch dataset is split in chunks of chunk_size time steps (as views where possible).
+    An iterable of batch datasets is assumed to be chunked already.
+    """
+    if not isinstance(profile_source, dict):
+        for chunk in profile_source:
+            yield chunk, get_dataset_batch_size(chunk)
+        return
+
+    n_steps = get_dataset_batch_size(profile_source)
+    for start in range(0, n_steps, chunk_size):
+        stop = min(start + chunk_size, n_steps)
+        chunk = {component: _slice_batch(data, start, stop) for component, data in profile_source.items()}
+        yield chunk, stop - start
+
+
+def get_n_steps(profile_source: BatchDataset | Iterable[BatchDataset], n_steps: int | None) -> int:
+    """Determine the total number of time steps of the profile source."""
+    if isinstance(profile_source, dict):
+        return get_dataset_batch_size(profile_source)
+    if n_steps is None:
+        raise ValueError("n_steps is required when the profile source is an iterable of chunks.")
+    return n_steps
+
+
+def allocate_output(chunk_output: Dataset, n_steps: int, output_dir: Path | None) -> Dataset:
+    """Allocate output arrays for n_steps time steps, based on the output of the first chunk.
+
+    If output_dir is given, the arrays are memory-mapped .npy files in that directory.
+    """
+    output: Dataset = {}
+    for component, array in chunk_output.items():
+        if not isinstance(array, np.ndarray):
+            raise NotImplementedError(f"Columnar output is not supported in time series calculations ({component}).")
+        shape = (n_steps, *array.shape[1:])
+        if output_dir is None:
+            output[component] = np.empty(shape, dtype=array.dtype)
+        else:
+            output[component] = create_memmap(Path(output_dir) / f"{component}.npy", array.dtype, shape)
+    return output
+
+
+def create_memmap(path: Path, dtype: np.dtype, shape: tuple[int, ...]) -> np.memmap:
+    """Create a memory-mapped .npy file for (power-grid-model) output with the given dtype and shape."""
+    return np.lib.format.open_memmap(path, mode="w+", dtype=_with_str_field_names(dtype), shape=shape)
+
+
+def write_chunk(output_data: Dataset, chunk_output: Dataset, start: int) -> None:
+    """Write the output of a chunk into the preallocated output, starting at time step start."""
+    for component, output_array in output_data.items():
+        chunk_array = chunk_output[component]
+        output_array[start : start + len(chunk_array)] = chunk_array  # type: ignore[index]
+
+
+def _with_str_field_names(dtype: np.dtype) -> np.dtype:
+    """Return the dtype with plain str field names, so it can be stored in the header of a .npy file.
+
+    The field names of power-grid-model dtypes are enums, which are not written correctly by numpy.
+    """
+    fields = dtype.fields
+    if fields is None:
+        return dtype
+    return np.dtype(
+        {  # type: ignore[call-overload]
+            "names": [str(name) for name in fields],
+            "formats": [field[0] for field in fields.values()],
+            "offsets": [field[1] for field in fields.values()],
+            "itemsize": dtype.itemsize,
+        }
+    )
+
+
+def _slice_batch(data, start: int, stop: int):
+    """Slice time steps [start, stop) from the batch data of a single component."""
+    if isinstance(data, np.ndarray):
+        return data[start:stop]
+    if "indptr" in data:  # sparse batch
+        indptr = data["indptr"]
+        sliced_data = data["data"]
+        sliced_data = (
+            sliced_data[indptr[start] : indptr[stop]]
+            if isinstance(sliced_data, np.ndarray)
+            else {attribute: values[indptr[start] : indptr[stop]] for attribute, values in sliced_data.items()}
+        )
+        return {"indptr": indptr[start : stop + 1] - indptr[start], "data": sliced_data}
+    return {attribute: values[start:stop] for attribute, values in data.items()}  # dense columnar batch
@@ -0,0 +1,17 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Optional dependencies for the utils module."""
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # pylint: disable=invalid-name
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None  # pylint: disable=invalid-name
+
+__all__ = ["lz4_frame", "zstandard"]
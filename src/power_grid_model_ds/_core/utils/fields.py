@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Helpers to copy fields between structured arrays"""
+
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=1024)
+def get_field_plan(source_dtype: np.dtype, target_dtype: np.dtype) -> tuple[str, ...]:
+    """Returns the fields shared by both dtypes, in the order of the target dtype.
+
+    The result is cached per dtype pair, so repeated conversions between the same array types are cheap.
+    """
+    source_fields = set(source_dtype.names or ())
+    return tuple(field for field in target_dtype.names or () if field in source_fields)
+
+
+def copy_fields(source: np.ndarray, target: np.ndarray) -> tuple[str, ...]:
+    """Copy the fields shared by source and target from source to target (in place).
+
+    The fields are copied in a single multi-field assignment, ordered as in the target dtype.
+    This is faster than copying column by column, since both arrays are traversed only once.
+
+    Returns:
+        tuple[str, ...]: the copied fields.
+    """
+    fields = get_field_plan(source.dtype, target.dtype)
+    if fields:
+        target[list(fields)] = source[list(fields)]
+    return fields
@@ -4,6 +4,7 @@
 
 """Misc utils"""
 
+import hashlib
 from collections.abc import Sequence
 from typing import get_type_hints
 
@@ -74,6 +75,24 @@ def array_equal_with_nan(array1: np.ndarray, array2: np.ndarray) -> bool:
     return True
 
 
+def update_digest_with_array(digest: hashlib.blake2b, array: np.ndarray) -> None:
+    """Add the content of a (structured) array to a hashlib digest, consistent with array_equal_with_nan.
+
+    Structured arrays are hashed column by column, so padding bytes are ignored.
+    Float values are canonicalised first: all NaN values hash the same, as do 0.0 and -0.0.
+    """
+    if array.dtype.names is not None:
+        for column in array.dtype.names:
+            digest.update(str(column).encode())
+            update_digest_with_array(digest, array[column])
+        return
+
+    if array.dtype.kind in "fc":
+        array = np.where(np.isnan(array), np.nan, array + 0.0)  # adding 0.0 turns -0.0 into 0.0
+    digest.update(f"{array.dtype.str}{array.shape}".encode())
+    digest.update(np.ascontiguousarray(array).data)
+
+
 def find_diff_masks_with_equal_nan(array1: np.ndarray, array2: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     """Return the rows in array1 that are not in array2, treating NaN values as equal."""
     if array1.dtype != array2.dtype:
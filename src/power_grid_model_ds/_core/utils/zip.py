@@ -9,10 +9,22 @@ import logging
 import os
 import shutil
 from pathlib import Path
+from typing import Literal, TextIO
 from zipfile import ZipFile
 
+from power_grid_model_ds._core.utils._optional import lz4_frame, zstandard
+
 _logger = logging.getLogger(__name__)
 
+Compression = Literal["gzip", "zstd", "lz4"]
+
+# The first bytes of a file compressed with each codec
+_MAGIC_NUMBERS: dict[Compression, bytes] = {
+    "gzip": b"\x1f\x8b",
+    "zstd": b"\x28\xb5\x2f\xfd",
+    "lz4": b"\x04\x22\x4d\x18",
+}
+
 
 def zip_folder(folder_to_zip: Path) -> Path:
     """Zip folder contents"""
@@ -67,3 +79,39 @@ def file2gzip(file_path: Path) -> Path:
     with Path(file_path).open("rb") as f_in, gzip.open(gzip_path, "wb") as f_out:
         shutil.copyfileobj(f_in, f_out)
     return gzip_path
+
+
+def open_text(path: Path, mode: Literal["r", "w"], compression: Compression | None = None) -> TextIO:
+    """Open a (compressed) utf-8 text file. The data is streamed through the codec, without temporary files.
+
+    Args:
+        path: the path of the file.
+        mode: "r" to read or "w" to write.
+        compression: the codec: None (no compression), "gzip", "zstd" (requires zstandard) or "lz4" (requires lz4).
+
+    Raises:
+        ValueError: if the compression is invalid.
+        ImportError: if the package of the codec is not installed.
+    """
+    match compression:
+        case None:
+            return Path(path).open(mode, encoding="utf-8")
+        case "gzip":
+            return gzip.open(path, f"{mode}t", encoding="utf-8")  # type: ignore[return-value]
+        case "zstd":
+            if zstandard is None:
+                raise ImportError("zstandard is not installed")
+            return zstandard.open(path, f"{mode}t", encoding="utf-8")
+        case "lz4":
+            if lz4_frame is None:
+                raise ImportError("lz4 is not installed")
+            return lz4_frame.open(path, f"{mode}t", encoding="utf-8")
+        case _:
+            raise ValueError(f"Invalid compression '{compression}'. Expected 'gzip', 'zstd' or 'lz4'.")
+
+
+def detect_compression(path: Path) -> Compression | None:
+    """Detect the codec of a compressed file from its first bytes. Returns None for an uncompressed file."""
+    with Path(path).open("rb") as f:
+        header = f.read(4)
+    return next((codec for codec, magic in _MAGIC_NUMBERS.items() if header.startswith(magic)), None)
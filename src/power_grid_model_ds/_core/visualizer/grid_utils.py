@@ -20,6 +20,9 @@ def extend_grid_dynamically(base_grid_class: type[Grid], extra_dataset: BatchDat
     and return a new Grid class with the extended schema."""
     grid_annotations = {}
     for field in fields(base_grid_class):
+        if not field.init:
+            # keep the field definition of the base class (e.g. Grid._journal), which is not part of the grid data
+            continue
         grid_attr = field.name
         base_class = field.type
         if (
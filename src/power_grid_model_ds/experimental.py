@@ -4,6 +4,12 @@
 """This module exposes functions/classes that are still under development and potentially subject to change."""
 
 from power_grid_model_ds._core.model.grids._search import find_differences_between_grids
+from power_grid_model_ds._core.power_grid_model_interface import build_n_minus_1_batch, get_n_minus_1_max_loading
 from power_grid_model_ds._core.utils.misc import find_diff_masks_with_equal_nan
 
-__all__ = ["find_diff_masks_with_equal_nan", "find_differences_between_grids"]
+__all__ = [
+    "build_n_minus_1_batch",
+    "find_diff_masks_with_equal_nan",
+    "find_differences_between_grids",
+    "get_n_minus_1_max_loading",
+]
@@ -4,8 +4,24 @@
 
 from power_grid_model_ds._core.data_source.generator.arrays.line import LineGenerator
 from power_grid_model_ds._core.data_source.generator.arrays.node import NodeGenerator
+from power_grid_model_ds._core.data_source.generator.arrays.profile import LoadProfileGenerator
+from power_grid_model_ds._core.data_source.generator.arrays.sensor import SensorGenerator
 from power_grid_model_ds._core.data_source.generator.arrays.source import SourceGenerator
 from power_grid_model_ds._core.data_source.generator.arrays.transformer import TransformerGenerator
-from power_grid_model_ds._core.data_source.generator.grid_generators import RadialGridGenerator
+from power_grid_model_ds._core.data_source.generator.grid_generators import (
+    MeshedGridGenerator,
+    MeshedGridStatistics,
+    RadialGridGenerator,
+)
 
-__all__ = ["LineGenerator", "NodeGenerator", "RadialGridGenerator", "SourceGenerator", "TransformerGenerator"]
+__all__ = [
+    "LineGenerator",
+    "LoadProfileGenerator",
+    "MeshedGridGenerator",
+    "MeshedGridStatistics",
+    "NodeGenerator",
+    "RadialGridGenerator",
+    "SensorGenerator",
+    "SourceGenerator",
+    "TransformerGenerator",
+]
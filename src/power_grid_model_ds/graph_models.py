@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
-from power_grid_model_ds._core.model.graphs.models import RustworkxGraphModel
+from power_grid_model_ds._core.model.graphs.models import CsrGraphModel, RustworkxGraphModel
 from power_grid_model_ds._core.model.graphs.models.base import BaseGraphModel
 
-__all__ = ["BaseGraphModel", "RustworkxGraphModel"]
+__all__ = ["BaseGraphModel", "CsrGraphModel", "RustworkxGraphModel"]
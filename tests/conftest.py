@@ -8,7 +8,7 @@ import numpy as np
 import pytest
 from power_grid_model import AttributeType, ComponentType, DatasetType, attribute_dtype, initialize_array
 
-from power_grid_model_ds._core.model.graphs.models import RustworkxGraphModel
+from power_grid_model_ds._core.model.graphs.models import CsrGraphModel, RustworkxGraphModel
 from power_grid_model_ds._core.model.graphs.models.base import BaseGraphModel
 from power_grid_model_ds._core.model.grids.base import Grid
 from tests.fixtures.arrays import FancyTestArray
@@ -18,6 +18,7 @@ from tests.fixtures.grids import build_basic_grid, build_basic_grid_with_three_w
 
 IMPLEMENTED_GRAPH_MODELS: dict[str, type[BaseGraphModel]] = {
     "rustworkx": RustworkxGraphModel,
+    "csr": CsrGraphModel,
 }
 
 
@@ -38,10 +39,10 @@ def grid() -> Grid:
     return Grid.empty()
 
 
-@pytest.fixture
-def graph() -> RustworkxGraphModel:
+@pytest.fixture(params=list(get_installed_graph_models().values()), ids=list(get_installed_graph_models().keys()))
+def graph(request) -> BaseGraphModel:
     """A graph fixture that will be parametrized"""
-    return RustworkxGraphModel()
+    return request.param()
 
 
 @pytest.fixture
@@ -8,16 +8,32 @@ from unittest.mock import patch
 
 import numpy as np
 import pytest
-from power_grid_model import ComponentType, TapChangingStrategy, initialize_array
+from power_grid_model import (
+    ComponentType,
+    FaultPhase,
+    FaultType,
+    MeasuredTerminalType,
+    TapChangingStrategy,
+    initialize_array,
+)
 
+from power_grid_model_ds import GridResults, ModelCache
 from power_grid_model_ds._core.data_source.generator.grid_generators import RadialGridGenerator
 from power_grid_model_ds._core.model.grids.base import Grid
-from power_grid_model_ds._core.power_grid_model_interface import PowerGridModelInterface
+from power_grid_model_ds._core.power_grid_model_interface import (
+    PGMCoreException,
+    PowerGridModelInterface,
+    build_n_minus_1_batch,
+    get_n_minus_1_max_loading,
+)
 from power_grid_model_ds.arrays import (
+    FaultArray,
     LineArray,
     NodeArray,
     SourceArray,
     SymLoadArray,
+    SymPowerSensorArray,
+    SymVoltageSensorArray,
 )
 from tests.fixtures.arrays import DefaultedCustomNodeArray
 from tests.fixtures.grid_classes import ExtendedGrid, ExtendedGridNoDefaults
@@ -219,6 +235,486 @@ class TestPowerGridModelInterfaceMethods:
         assert core_interface._input_data
 
 
+class TestSyncFromGrid:
+    def test_sync_without_model(self, base_grid: Grid):
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        assert core_interface.sync_from_grid() == {}
+        assert core_interface.model is not None
+
+    def test_sync_without_model_uses_current_grid(self, base_grid: Grid):
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        core_interface.create_input_from_grid()
+        base_grid.sym_load.update_by_id(base_grid.sym_load.id[0], p_specified=2e6)
+
+        assert core_interface.sync_from_grid() == {}
+        assert core_interface._input_data["sym_load"]["p_specified"][0] == 2e6
+
+    def test_sync_without_changes(self, base_grid: Grid):
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        core_interface.setup_model()
+        model = core_interface.model
+
+        assert core_interface.sync_from_grid() == {}
+        assert core_interface.model is model
+
+    def test_sync_updates_changed_values(self, base_grid: Grid):
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        output_1 = core_interface.calculate_power_flow()
+        model = core_interface.model
+
+        load_id = base_grid.sym_load.id[0]
+        base_grid.sym_load.update_by_id(load_id, p_specified=2e6)
+        base_grid.make_inactive(base_grid.line[0])
+
+        update_data = core_interface.sync_from_grid()
+        assert core_interface.model is model
+        assert set(update_data) == {"sym_load", "line"}
+        assert update_data["sym_load"]["id"].tolist() == [load_id]
+        assert update_data["sym_load"]["p_specified"].tolist() == [2e6]
+        assert np.isnan(update_data["sym_load"]["q_specified"]).all()
+        assert update_data["line"]["id"].tolist() == [base_grid.line.id[0]]
+
+        output_2 = core_interface.calculate_power_flow()
+        rebuilt_output = PowerGridModelInterface(grid=base_grid).calculate_power_flow()
+        assert not np.allclose(output_1["node"]["u"], output_2["node"]["u"])
+        np.testing.assert_allclose(output_2["node"]["u"], rebuilt_output["node"]["u"])
+
+    def test_sync_updates_values_written_in_place(self, base_grid: Grid):
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        core_interface.setup_model()
+        model = core_interface.model
+
+        base_grid.sym_load.p_specified[0] = 2e6
+
+        update_data = core_interface.sync_from_grid()
+        assert core_interface.model is model
+        assert update_data["sym_load"]["id"].tolist() == [base_grid.sym_load.id[0]]
+        assert update_data["sym_load"]["p_specified"].tolist() == [2e6]
+        assert core_interface.sync_from_grid() == {}
+
+    def test_sync_rebuilds_after_update_model(self, base_grid: Grid):
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        update_sym_load = initialize_array("update", "sym_load", 1)
+        update_sym_load["id"] = base_grid.sym_load.id[0]
+        update_sym_load["p_specified"] = 2e6
+        core_interface.update_model({"sym_load": update_sym_load})
+        model = core_interface.model
+
+        assert core_interface.sync_from_grid() == {}
+        assert core_interface.model is not model
+
+        output = core_interface.calculate_power_flow()
+        expected = PowerGridModelInterface(grid=base_grid).calculate_power_flow()
+        np.testing.assert_allclose(output["sym_load"]["p"], expected["sym_load"]["p"])
+
+    def test_sync_rebuilds_after_append(self, base_grid: Grid):
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        core_interface.setup_model()
+        model = core_interface.model
+
+        new_node = base_grid.node.__class__(u_rated=[10_500.0])
+        base_grid.append(new_node)
+
+        assert core_interface.sync_from_grid() == {}
+        assert core_interface.model is not model
+        assert core_interface._input_data["node"].size == base_grid.node.size
+
+    def test_sync_rebuilds_on_non_updatable_change(self, base_grid: Grid):
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        core_interface.setup_model()
+        model = core_interface.model
+
+        base_grid.line.r1 = base_grid.line.r1 * 2
+
+        assert core_interface.sync_from_grid() == {}
+        assert core_interface.model is not model
+        np.testing.assert_array_equal(core_interface._input_data["line"]["r1"], base_grid.line.r1)
+
+
+def _load_profile(grid: Grid, n_steps: int) -> dict[str, np.ndarray]:
+    scaling = np.linspace(0.1, 1.0, n_steps).reshape(-1, 1)
+    update_sym_load = initialize_array("update", "sym_load", (n_steps, len(grid.sym_load)))
+    update_sym_load["id"] = grid.sym_load.id
+    update_sym_load["p_specified"] = grid.sym_load.p_specified * scaling
+    update_sym_load["q_specified"] = grid.sym_load.q_specified * scaling
+    return {"sym_load": update_sym_load}
+
+
+class TestRunTimeSeries:
+    def test_chunked_equals_single_batch(self, base_grid: Grid):
+        profile = _load_profile(base_grid, n_steps=10)
+        expected = PowerGridModelInterface(grid=base_grid).calculate_power_flow(update_data=profile)
+
+        result = PowerGridModelInterface(grid=base_grid).run_time_series(profile, chunk_size=3)
+
+        assert result.n_steps == 10
+        assert len(result.chunk_timings) == 4
+        assert result.output_data["line"].shape == (10, len(base_grid.line))
+        np.testing.assert_allclose(result.output_data["node"]["u"], expected["node"]["u"])
+        np.testing.assert_allclose(result.output_data["line"]["i_from"], expected["line"]["i_from"])
+
+    def test_iterable_of_chunks(self, base_grid: Grid):
+        profile = _load_profile(base_grid, n_steps=6)
+        chunks = ({"sym_load": profile["sym_load"][start : start + 2]} for start in range(0, 6, 2))
+
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        result = core_interface.run_time_series(chunks, n_steps=6, output_component_types=["node"])
+
+        assert set(result.output_data) == {"node"}
+        assert result.output_data["node"].shape == (6, len(base_grid.node))
+        assert core_interface.output_data is result.output_data
+
+    def test_iterable_without_n_steps(self, base_grid: Grid):
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        with pytest.raises(ValueError, match="n_steps is required"):
+            core_interface.run_time_series(iter([_load_profile(base_grid, n_steps=2)]))
+
+    def test_memory_mapped_output(self, base_grid: Grid, tmp_path):
+        profile = _load_profile(base_grid, n_steps=5)
+        result = PowerGridModelInterface(grid=base_grid).run_time_series(profile, chunk_size=2, output_dir=tmp_path)
+
+        assert isinstance(result.output_data["node"], np.memmap)
+        stored_output = np.load(tmp_path / "node.npy")
+        np.testing.assert_array_equal(stored_output, result.output_data["node"])
+
+
+class TestCalculateParallel:
+    def test_equals_single_batch(self, base_grid: Grid):
+        profile = _load_profile(base_grid, n_steps=5)
+        expected = PowerGridModelInterface(grid=base_grid).calculate_power_flow(update_data=profile)
+
+        output = PowerGridModelInterface(grid=base_grid).calculate_parallel(profile, workers=2)
+
+        assert output["line"].shape == (5, len(base_grid.line))
+        np.testing.assert_allclose(output["node"]["u"], expected["node"]["u"])
+        np.testing.assert_allclose(output["line"]["i_from"], expected["line"]["i_from"])
+
+    def test_iterable_of_chunks(self, base_grid: Grid):
+        profile = _load_profile(base_grid, n_steps=4)
+        chunks = [{"sym_load": profile["sym_load"][start : start + 1]} for start in range(4)]
+        expected = PowerGridModelInterface(grid=base_grid).calculate_power_flow(update_data=profile)
+
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        output = core_interface.calculate_parallel(chunks, workers=2, output_component_types=["node"])
+
+        assert set(output) == {"node"}
+        assert core_interface.output_data is output
+        np.testing.assert_allclose(output["node"]["u"], expected["node"]["u"])
+
+    def test_includes_synced_changes(self, base_grid: Grid):
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        core_interface.setup_model()
+        base_grid.sym_load.p_specified[0] = 2e6
+        core_interface.sync_from_grid()
+
+        profile = {"sym_load": initialize_array("update", "sym_load", (2, 0))}
+        output = core_interface.calculate_parallel(profile, workers=1)
+
+        expected = PowerGridModelInterface(grid=base_grid).calculate_power_flow()
+        np.testing.assert_allclose(output["node"]["u"][0], expected["node"]["u"])
+
+    def test_raises_after_update_model(self, base_grid: Grid):
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        update_sym_load = initialize_array("update", "sym_load", 1)
+        update_sym_load["id"] = base_grid.sym_load.id[0]
+        update_sym_load["p_specified"] = 2e6
+        core_interface.update_model({"sym_load": update_sym_load})
+
+        with pytest.raises(PGMCoreException, match="update_model"):
+            core_interface.calculate_parallel(_load_profile(base_grid, n_steps=2), workers=1)
+
+
+class TestNMinus1:
+    def test_dense_batch(self, base_grid: Grid):
+        line_ids = base_grid.line.id[:3]
+        update_data = build_n_minus_1_batch(base_grid, line_ids)
+
+        assert set(update_data) == {"line"}
+        update_line = update_data["line"]
+        assert update_line.shape == (3, 3)
+        assert (update_line["id"] == line_ids).all()
+        np.testing.assert_array_equal(np.diag(update_line["from_status"]), [0, 0, 0])
+        np.testing.assert_array_equal(np.diag(update_line["to_status"]), [0, 0, 0])
+        assert (update_line["from_status"][~np.eye(3, dtype=bool)] != 0).all()
+
+    def test_sparse_batch_equals_dense_batch(self, base_grid: Grid):
+        branch_ids = base_grid.branches.id
+        dense_output = PowerGridModelInterface(grid=base_grid).calculate_power_flow(
+            update_data=build_n_minus_1_batch(base_grid, branch_ids)
+        )
+        sparse_output = PowerGridModelInterface(grid=base_grid).calculate_power_flow(
+            update_data=build_n_minus_1_batch(base_grid, branch_ids, dense=False)
+        )
+        np.testing.assert_allclose(dense_output["node"]["u"], sparse_output["node"]["u"])
+
+    def test_three_winding_transformer(self, grid_with_three_winding_transformer: Grid):
+        update_data = build_n_minus_1_batch(grid_with_three_winding_transformer, [7])
+
+        update_transformer = update_data["three_winding_transformer"]
+        assert update_transformer.shape == (1, 1)
+        assert update_transformer[["status_1", "status_2", "status_3"]].tolist() == [[(0, 0, 0)]]
+
+    def test_unknown_branch(self, base_grid: Grid):
+        with pytest.raises(ValueError, match="not found"):
+            build_n_minus_1_batch(base_grid, [base_grid.line.id[0], 123_456])
+
+    def test_max_loading(self, base_grid: Grid):
+        branch_ids = base_grid.line.id
+        output = PowerGridModelInterface(grid=base_grid).calculate_power_flow(
+            update_data=build_n_minus_1_batch(base_grid, branch_ids)
+        )
+        max_loading = get_n_minus_1_max_loading(output, branch_ids)
+
+        np.testing.assert_array_equal(max_loading["id"], branch_ids)
+        np.testing.assert_allclose(max_loading["max_loading"], np.nanmax(output["line"]["loading"], axis=1))
+        for scenario, record in enumerate(max_loading):
+            line_output = output["line"][scenario]
+            assert line_output["loading"][line_output["id"] == record["max_loading_id"]] == record["max_loading"]
+
+
+class TestZeroCopyInput:
+    def test_input_shares_memory_with_grid(self, base_grid: Grid):
+        core_interface = PowerGridModelInterface(grid=base_grid, zero_copy=True)
+        input_data = core_interface.create_input_from_grid()
+
+        assert isinstance(input_data["line"], dict)
+        assert np.shares_memory(input_data["line"]["r1"], base_grid.line.data)
+        assert input_data["sym_voltage_sensor"] is base_grid.sym_voltage_sensor.data
+
+    def test_power_flow_equals_copied_input(self, base_grid: Grid):
+        output = PowerGridModelInterface(grid=base_grid).calculate_power_flow()
+        zero_copy_output = PowerGridModelInterface(grid=base_grid, zero_copy=True).calculate_power_flow()
+
+        np.testing.assert_allclose(output["node"]["u"], zero_copy_output["node"]["u"])
+        np.testing.assert_allclose(output["line"]["i_from"], zero_copy_output["line"]["i_from"])
+
+    def test_sync_rebuilds(self, base_grid: Grid):
+        core_interface = PowerGridModelInterface(grid=base_grid, zero_copy=True)
+        core_interface.setup_model()
+        model = core_interface.model
+
+        base_grid.sym_load.update_by_id(base_grid.sym_load.id[0], p_specified=2e6)
+
+        assert core_interface.sync_from_grid() == {}
+        assert core_interface.model is not model
+
+
+class TestGridResults:
+    def test_reductions(self, base_grid: Grid):
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        output = core_interface.calculate_power_flow(update_data=_load_profile(base_grid, n_steps=4))
+        results = core_interface.get_results()
+
+        assert results.n_scenarios == 4
+        np.testing.assert_array_equal(results.ids("line"), base_grid.line.id)
+        np.testing.assert_allclose(results.max("line", "loading"), output["line"]["loading"].max(axis=0))
+        np.testing.assert_array_equal(results.argmax("line", "loading"), output["line"]["loading"].argmax(axis=0))
+        np.testing.assert_allclose(results.max_loading()["line"], output["line"]["loading"].max(axis=0))
+        u_pu_min, u_pu_max = results.u_pu_range()
+        np.testing.assert_allclose(u_pu_min, output["node"]["u_pu"].min(axis=0))
+        np.testing.assert_allclose(u_pu_max, output["node"]["u_pu"].max(axis=0))
+
+    def test_ignores_nan(self):
+        output = initialize_array("sym_output", "line", (2, 2))
+        output["id"] = [1, 2]
+        output["loading"] = [[np.nan, 0.5], [0.3, np.nan]]
+        results = GridResults.from_output({"line": output})
+
+        np.testing.assert_allclose(results.max("line", "loading"), [0.3, 0.5])
+        np.testing.assert_array_equal(results.argmax("line", "loading"), [1, 0])
+
+    def test_aligned_with_grid_ids(self, base_grid: Grid):
+        output = PowerGridModelInterface(grid=base_grid).calculate_power_flow()
+        reversed_output = {"node": output["node"][::-1]}
+
+        results = GridResults.from_output(reversed_output, grid=base_grid)
+
+        assert results.get("node").shape == (1, len(base_grid.node))
+        np.testing.assert_array_equal(results.ids("node"), base_grid.node.id)
+        np.testing.assert_allclose(results.get("node", "u")[0], output["node"]["u"])
+
+    def test_missing_ids(self, base_grid: Grid):
+        output = PowerGridModelInterface(grid=base_grid).calculate_power_flow()
+        with pytest.raises(ValueError, match="does not match"):
+            GridResults.from_output({"node": output["node"][1:]}, grid=base_grid)
+
+    def test_write_scenario(self):
+        grid = RadialGridGenerator(grid_class=ExtendedGrid, nr_nodes=5, nr_sources=1, nr_nops=0).run(seed=0)
+        core_interface = PowerGridModelInterface(grid=grid)
+        output = core_interface.calculate_power_flow(update_data=_load_profile(grid, n_steps=3))
+
+        core_interface.get_results().write_scenario(grid, scenario=2)
+
+        np.testing.assert_allclose(grid.node.u, output["node"]["u"][2])
+        np.testing.assert_allclose(grid.line.i_from, output["line"]["i_from"][2])
+
+    def test_memory_mapped(self, base_grid: Grid, tmp_path):
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        core_interface.calculate_power_flow(update_data=_load_profile(base_grid, n_steps=3))
+
+        results = core_interface.get_results(output_dir=tmp_path)
+        loaded_results = GridResults.load(tmp_path)
+
+        assert isinstance(results.get("node"), np.memmap)
+        assert set(loaded_results.components) == set(results.components)
+        np.testing.assert_array_equal(loaded_results.get("node", "u"), results.get("node", "u"))
+
+    def test_memory_mapped_aligned_with_grid_ids(self, base_grid: Grid, tmp_path):
+        output = PowerGridModelInterface(grid=base_grid).calculate_power_flow(
+            update_data=_load_profile(base_grid, n_steps=3)
+        )
+        reversed_output = {"node": output["node"][:, ::-1]}
+
+        results = GridResults.from_output(reversed_output, grid=base_grid, output_dir=tmp_path)
+
+        assert isinstance(results.get("node"), np.memmap)
+        np.testing.assert_array_equal(results.get("node", "id")[2], base_grid.node.id)
+        np.testing.assert_allclose(results.get("node", "u"), output["node"]["u"])
+
+
+class TestModelCache:
+    def test_reuses_model_for_same_grid(self, base_grid: Grid):
+        cache = ModelCache()
+        first_interface = PowerGridModelInterface(grid=base_grid, model_cache=cache)
+        second_interface = PowerGridModelInterface(grid=base_grid, model_cache=cache)
+
+        first_output = first_interface.calculate_power_flow()
+        second_output = second_interface.calculate_power_flow()
+
+        assert (cache.misses, cache.hits) == (1, 1)
+        assert first_interface.model is not second_interface.model
+        np.testing.assert_allclose(first_output["node"]["u"], second_output["node"]["u"])
+
+    def test_modified_grid_constructs_new_model(self, base_grid: Grid):
+        cache = ModelCache()
+        PowerGridModelInterface(grid=base_grid, model_cache=cache).setup_model()
+        base_grid.line.update_by_id(base_grid.line.id[0], r1=1.0)
+        PowerGridModelInterface(grid=base_grid, model_cache=cache).setup_model()
+        PowerGridModelInterface(grid=base_grid, model_cache=cache, system_frequency=60.0).setup_model()
+
+        assert (cache.misses, cache.hits) == (3, 0)
+        assert len(cache) == 3
+
+    def test_updated_copy_does_not_affect_cache(self, base_grid: Grid):
+        cache = ModelCache()
+        expected = PowerGridModelInterface(grid=base_grid, model_cache=cache).calculate_power_flow()
+
+        updated_interface = PowerGridModelInterface(grid=base_grid, model_cache=cache)
+        update_data = _load_profile(base_grid, n_steps=1)
+        updated_interface.update_model({"sym_load": update_data["sym_load"][0]})
+        updated_interface.calculate_power_flow()
+
+        output = PowerGridModelInterface(grid=base_grid, model_cache=cache).calculate_power_flow()
+        np.testing.assert_allclose(output["node"]["u"], expected["node"]["u"])
+
+    def test_least_recently_used_model_is_evicted(self, base_grid: Grid):
+        cache = ModelCache(maxsize=1)
+        PowerGridModelInterface(grid=base_grid, model_cache=cache, system_frequency=50.0).setup_model()
+        PowerGridModelInterface(grid=base_grid, model_cache=cache, system_frequency=60.0).setup_model()
+        PowerGridModelInterface(grid=base_grid, model_cache=cache, system_frequency=50.0).setup_model()
+
+        assert len(cache) == 1
+        assert (cache.misses, cache.hits) == (3, 0)
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError, match="maxsize"):
+            ModelCache(maxsize=0)
+
+
+def _add_sensors(grid: Grid, node_output: np.ndarray) -> None:
+    n_nodes, n_loads = len(grid.node), len(grid.sym_load)
+    voltage_sensor = SymVoltageSensorArray(
+        id=np.arange(grid.max_id + 1, grid.max_id + 1 + n_nodes),
+        measured_object=node_output["id"],
+        u_sigma=np.full(n_nodes, 1.0),
+        u_measured=node_output["u"],
+        u_angle_measured=node_output["u_angle"],
+    )
+    grid.append(voltage_sensor)
+    power_sensor = SymPowerSensorArray(
+        id=np.arange(grid.max_id + 1, grid.max_id + 1 + n_loads),
+        measured_object=grid.sym_load.id,
+        measured_terminal_type=np.full(n_loads, MeasuredTerminalType.load),
+        power_sigma=np.full(n_loads, 1e3),
+        p_measured=grid.sym_load.p_specified,
+        q_measured=grid.sym_load.q_specified,
+        p_sigma=np.full(n_loads, np.nan),
+        q_sigma=np.full(n_loads, np.nan),
+    )
+    grid.append(power_sensor)
+
+
+class TestStateEstimation:
+    def test_equals_power_flow(self, base_grid: Grid):
+        power_flow_output = PowerGridModelInterface(grid=base_grid).calculate_power_flow()
+        _add_sensors(base_grid, power_flow_output["node"])
+
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        output = core_interface.calculate_state_estimation()
+
+        assert core_interface.output_data is output
+        np.testing.assert_allclose(output["node"]["u"], power_flow_output["node"]["u"])
+
+    def test_shares_model_with_power_flow(self, base_grid: Grid):
+        _add_sensors(base_grid, PowerGridModelInterface(grid=base_grid).calculate_power_flow()["node"])
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        core_interface.calculate_power_flow()
+        model = core_interface.model
+
+        core_interface.calculate_state_estimation()
+
+        assert core_interface.model is model
+
+    def test_sensor_time_series(self, base_grid: Grid):
+        _add_sensors(base_grid, PowerGridModelInterface(grid=base_grid).calculate_power_flow()["node"])
+        update_sensor = initialize_array("update", "sym_voltage_sensor", (2, len(base_grid.sym_voltage_sensor)))
+        update_sensor["id"] = base_grid.sym_voltage_sensor.id
+        update_sensor["u_measured"] = base_grid.sym_voltage_sensor.u_measured * np.array([[1.0], [1.01]])
+
+        output = PowerGridModelInterface(grid=base_grid).calculate_state_estimation(
+            update_data={"sym_voltage_sensor": update_sensor}
+        )
+
+        assert output["node"].shape == (2, len(base_grid.node))
+        assert (output["node"]["u"][1] > output["node"]["u"][0]).all()
+
+
+def _add_fault(grid: Grid, node_id: int) -> None:
+    fault = FaultArray(
+        id=[grid.max_id + 1],
+        status=[1],
+        fault_type=[FaultType.three_phase],
+        fault_phase=[FaultPhase.abc],
+        fault_object=[node_id],
+        r_f=[0.0],
+        x_f=[0.0],
+    )
+    grid.append(fault)
+
+
+class TestShortCircuit:
+    def test_fault_current(self, base_grid: Grid):
+        _add_fault(base_grid, base_grid.node.id[1])
+
+        core_interface = PowerGridModelInterface(grid=base_grid)
+        output = core_interface.calculate_short_circuit()
+
+        assert core_interface.output_data is output
+        assert output["fault"]["i_f"].shape == (1, 3)
+        assert (output["fault"]["i_f"] > 0).all()
+
+    def test_fault_scenarios(self, base_grid: Grid):
+        _add_fault(base_grid, base_grid.node.id[1])
+        update_fault = initialize_array("update", "fault", (2, 1))
+        update_fault["id"] = base_grid.fault.id
+        update_fault["fault_object"] = [[base_grid.node.id[1]], [base_grid.node.id[-1]]]
+
+        output = PowerGridModelInterface(grid=base_grid).calculate_short_circuit(update_data={"fault": update_fault})
+
+        assert output["fault"].shape == (2, 1)
+        assert not np.allclose(output["fault"]["i_f"][0], output["fault"]["i_f"][1])
+
+
 class TestCreateGridFromInputData:
     def test_create_grid_from_input_data(self, input_data_pgm):
         core_interface = PowerGridModelInterface(input_data=input_data_pgm)
@@ -368,3 +864,30 @@ class TestCreateGridFromInputData:
         with patch("power_grid_model_ds._core.power_grid_model_interface.ComponentType", ExtendedComponentType):
             core_interface = PowerGridModelInterface(input_data=input_data_pgm)
             core_interface.create_grid_from_input_data()
+
+    def test_ids_and_graphs_are_built(self, input_data_pgm):
+        grid = PowerGridModelInterface(input_data=input_data_pgm).create_grid_from_input_data()
+
+        assert grid.ids == {1, 2, 7, 9, 10, 5, 6, 8}
+        assert grid.max_id == 10
+        assert grid.graphs.complete_graph.nr_nodes == 3
+        assert grid.graphs.complete_graph.nr_branches == 2
+        assert grid.graphs.active_graph.nr_branches == 2
+
+    def test_columnar_input_data(self, input_data_pgm):
+        columnar_input = {
+            component: array if isinstance(array, dict) else {name: array[name] for name in array.dtype.names}
+            for component, array in input_data_pgm.items()
+        }
+        expected = PowerGridModelInterface(input_data=input_data_pgm).create_grid_from_input_data()
+
+        grid = PowerGridModelInterface(input_data=columnar_input).create_grid_from_input_data()
+
+        assert grid.node.data.tolist() == expected.node.data.tolist()
+        assert grid.line.data.tolist() == expected.line.data.tolist()
+        assert grid.ids == expected.ids
+
+    def test_duplicate_ids(self, input_data_pgm):
+        input_data_pgm["sym_load"]["id"] = [1, 6]
+        with pytest.raises(ValueError, match="Duplicates found"):
+            PowerGridModelInterface(input_data=input_data_pgm).create_grid_from_input_data()
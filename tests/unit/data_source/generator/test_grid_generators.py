@@ -6,12 +6,22 @@
 Test for Generator Data Source
 """
 
+import pickle
+
 import numpy as np
+import pytest
+from power_grid_model import CalculationMethod, ComponentType
 
 from power_grid_model_ds._core.data_source.generator.arrays.line import LineGenerator
 from power_grid_model_ds._core.data_source.generator.arrays.node import NodeGenerator
+from power_grid_model_ds._core.data_source.generator.arrays.profile import LoadProfileGenerator
 from power_grid_model_ds._core.data_source.generator.arrays.source import SourceGenerator
-from power_grid_model_ds._core.data_source.generator.grid_generators import RadialGridGenerator
+from power_grid_model_ds._core.data_source.generator.grid_generators import (
+    MeshedGridGenerator,
+    MeshedGridStatistics,
+    RadialGridGenerator,
+)
+from power_grid_model_ds._core.model.enums.nodes import NodeType
 from power_grid_model_ds._core.model.graphs.models.base import BaseGraphModel
 from power_grid_model_ds._core.model.grids.base import Grid
 from power_grid_model_ds._core.power_grid_model_interface import PowerGridModelInterface
@@ -244,6 +254,24 @@ def test_create_nops(grid: Grid):
     assert sum(inactive_line_mask) == 1
 
 
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_create_nops_ids_above_grid_max_id(grid: Grid, vectorized: bool):
+    """The ids of the normally open points do not collide with ids in the grid"""
+    nodes = NodeArray.zeros(3)
+    nodes.id = [0, 1, 20]
+    nodes.u_rated = [10_500] * 3
+    grid.append(nodes)
+
+    line_generator = LineGenerator(grid=grid, seed=0)
+    line_generator.line_array = LineArray.empty(0)
+    if vectorized:
+        line_generator.create_nop_lines_vectorized(2)
+    else:
+        line_generator.create_nop_lines(2)
+
+    assert line_generator.line_array.id.tolist() == [21, 22]
+
+
 def test_generate_random_grid_with_tranformers():
     """Generate a random grid with correct structure"""
     grid_generator = RadialGridGenerator(grid_class=Grid)
@@ -257,3 +285,190 @@ def test_generate_random_grid_with_tranformers():
     core_interface = PowerGridModelInterface(grid=grid)
     core_interface.create_input_from_grid()
     core_interface.calculate_power_flow()
+
+
+def test_generate_vectorized_radial_grid():
+    grid_generator = RadialGridGenerator(grid_class=Grid, nr_nodes=500, nr_sources=3, nr_nops=20)
+    grid = grid_generator.run(seed=0, vectorized=True)
+
+    assert len(grid.node) == 503
+    assert grid.line.id.tolist() == sorted(set(grid.line.id.tolist()))
+    assert (grid.line.from_node != grid.line.to_node).all()
+    inactive_mask = np.logical_or(grid.line.from_status == 0, grid.line.to_status == 0)
+    assert inactive_mask.sum() == 20
+    # a radial grid: every node but the source nodes is fed by exactly one active line
+    assert grid.graphs.active_graph.nr_branches == len(grid.node) - len(grid.source)
+
+    output = PowerGridModelInterface(grid=grid).calculate_power_flow()
+    assert not np.isnan(output["node"]["u_pu"]).any()
+
+
+def test_generate_vectorized_radial_grid_is_reproducible():
+    grid_generator = RadialGridGenerator(grid_class=Grid, nr_nodes=50)
+    assert grid_generator.run(seed=1, vectorized=True).line == grid_generator.run(seed=1, vectorized=True).line
+
+
+def test_generate_vectorized_radial_grid_with_transformers():
+    grid_generator = RadialGridGenerator(grid_class=Grid, nr_nodes=50)
+    grid = grid_generator.run(seed=0, create_10_3_kv_net=True, vectorized=True)
+
+    assert len(grid.transformer) == 2
+    assert grid.graphs.active_graph.nr_branches == len(grid.node) - len(grid.source)
+
+
+def test_connect_all_nodes_without_connected_node(grid: Grid):
+    nodes = NodeArray(id=[1, 2], u_rated=[10_500, 10_500])
+    grid.append(nodes)
+
+    line_generator = LineGenerator(grid=grid, seed=0, vectorized=True)
+    line_generator.set_unconnected_nodes()
+    with pytest.raises(ValueError, match="no connected node"):
+        line_generator.connect_all_nodes()
+
+
+def test_generate_many():
+    grid_generator = RadialGridGenerator(grid_class=Grid, nr_nodes=20, nr_sources=1, nr_nops=2)
+    grids = grid_generator.generate_many(3, seed=42, workers=2)
+
+    assert len(grids) == 3
+    assert all(isinstance(grid, Grid) for grid in grids)
+    assert grids[0].line != grids[1].line
+    # the grids do not depend on the number of workers
+    assert [grid.line for grid in grid_generator.generate_many(3, seed=42, workers=1)] == [grid.line for grid in grids]
+
+
+def test_generate_many_to_directory(tmp_path):
+    grid_generator = RadialGridGenerator(grid_class=Grid, nr_nodes=20, nr_sources=1, nr_nops=2)
+    paths = grid_generator.generate_many(2, seed=1, workers=1, output_dir=tmp_path, vectorized=True)
+
+    assert paths == [tmp_path / "grid_0.pkl", tmp_path / "grid_1.pkl"]
+    with paths[1].open("rb") as file:
+        grid = pickle.load(file)  # noqa: S301
+    assert grid == grid_generator.generate_many(2, seed=1, workers=1, vectorized=True)[1]
+
+
+def test_generate_meshed_grid():
+    statistics = MeshedGridStatistics(nr_nodes=300, nr_sources=2, cycles_per_feeder=1.0, nops_per_feeder=0.5)
+    grid = MeshedGridGenerator(grid_class=Grid, statistics=statistics).run(seed=0)
+
+    assert len(grid.node) == 302
+    assert set(grid.node.u_rated.tolist()) == {10_500, 3_000}
+    assert (grid.node.u_rated == 3_000).sum() == 150
+    # 3 kV feeders start at a transformer: 150 nodes / 20 nodes per feeder
+    assert len(grid.transformer) == 8
+    inactive_mask = np.logical_or(grid.line.from_status == 0, grid.line.to_status == 0)
+    assert inactive_mask.sum() <= 8
+    # a spanning tree plus the cycles (16 feeders, drawn node pairs within a feeder)
+    nr_cycles = grid.graphs.active_graph.nr_branches - (len(grid.node) - len(grid.source))
+    assert 0 < nr_cycles <= 16
+    assert (grid.sym_load.p_specified > 0).all()
+
+    output = PowerGridModelInterface(grid=grid).calculate_power_flow()
+    assert (output["node"]["u_pu"] > 0.9).all()
+    assert (output["node"]["u_pu"] < 1.1).all()
+    assert (output["line"]["loading"] < 1).all()
+
+
+def test_generate_meshed_grid_cycles_within_feeder():
+    statistics = MeshedGridStatistics(
+        nr_nodes=200, voltage_levels=(10_500,), branching_probability=0.0, cycles_per_feeder=1, nops_per_feeder=0
+    )
+    grid = MeshedGridGenerator(grid_class=Grid, statistics=statistics).run(seed=0)
+
+    assert len(grid.line) == 210
+    with grid.graphs.active_graph.tmp_remove_nodes(grid.source.node.tolist()):
+        feeders = grid.graphs.active_graph.get_components()
+    # the cycles do not connect the (chain) feeders to each other
+    assert len(feeders) == 10
+
+
+def test_generate_meshed_grid_with_three_winding_transformers_and_sensors():
+    statistics = MeshedGridStatistics(
+        nr_nodes=300,
+        voltage_levels=(20_000, 10_500, 3_000),
+        nr_three_winding_transformers=2,
+        sensors_per_node=0.5,
+    )
+    grid = MeshedGridGenerator(grid_class=Grid, statistics=statistics).run(seed=0)
+
+    assert len(grid.three_winding_transformer) == 2
+    assert grid.three_winding_transformer[["u1", "u2", "u3"]].tolist() == [(20_000, 10_500, 3_000)] * 2
+    assert len(grid.sym_voltage_sensor) == 151
+    measured_objects = np.concatenate((grid.sym_load.id, grid.source.id))
+    assert np.isin(grid.sym_power_sensor.measured_object, measured_objects).all()
+
+    output = PowerGridModelInterface(grid=grid).calculate_power_flow()
+    assert (output["node"]["u_pu"] > 0.9).all()
+    assert (output["node"]["u_pu"] < 1.1).all()
+
+
+@pytest.mark.parametrize("nr_sources", [1, 3])
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("calculation_method", [CalculationMethod.iterative_linear, CalculationMethod.newton_raphson])
+def test_generate_meshed_grid_is_observable(nr_sources: int, seed: int, calculation_method: CalculationMethod):
+    statistics = MeshedGridStatistics(nr_nodes=200, nr_sources=nr_sources, sensors_per_node=1.0)
+    grid = MeshedGridGenerator(grid_class=Grid, statistics=statistics).run(seed=seed)
+
+    assert np.isin(grid.source.id, grid.sym_power_sensor.measured_object).all()
+    power_flow = PowerGridModelInterface(grid=grid).calculate_power_flow()
+    output = PowerGridModelInterface(grid=grid).calculate_state_estimation(calculation_method=calculation_method)
+    # the measurements are taken from the power flow, so the state estimation is close to it
+    np.testing.assert_allclose(output["node"]["u_pu"], power_flow["node"]["u_pu"], atol=0.01)
+
+
+def test_generate_meshed_grid_feeders():
+    statistics = MeshedGridStatistics(
+        nr_nodes=200, voltage_levels=(10_500,), branching_probability=0.0, cycles_per_feeder=0, nops_per_feeder=0
+    )
+    grid = MeshedGridGenerator(grid_class=Grid, statistics=statistics).run(seed=0)
+
+    # without branching, each feeder is a chain that starts at a substation
+    assert len(grid.line) == 200
+    node_degrees = np.bincount(np.concatenate((grid.line.from_node, grid.line.to_node)))
+    assert (node_degrees[grid.node.id[grid.node.node_type != NodeType.SUBSTATION_NODE]] <= 2).all()
+    with grid.graphs.active_graph.tmp_remove_nodes(grid.source.node.tolist()):
+        feeder_sizes = [len(component) for component in grid.graphs.active_graph.get_components()]
+    assert len(feeder_sizes) == 10
+    assert min(feeder_sizes) < 20 < max(feeder_sizes)
+
+
+def test_generate_meshed_grid_is_reproducible():
+    generator = MeshedGridGenerator(grid_class=Grid, statistics=MeshedGridStatistics(nr_nodes=100))
+    assert generator.run(seed=3) == generator.run(seed=3)
+
+
+def test_generate_meshed_grid_invalid_statistics():
+    with pytest.raises(ValueError, match="three voltage levels"):
+        MeshedGridGenerator(Grid, MeshedGridStatistics(nr_three_winding_transformers=1)).run(seed=0)
+    with pytest.raises(ValueError, match="nr_nodes"):
+        MeshedGridGenerator(Grid, MeshedGridStatistics(nr_nodes=1)).run(seed=0)
+
+
+def test_generate_load_profiles():
+    grid = RadialGridGenerator(grid_class=Grid, nr_nodes=20).run(seed=0)
+    chunks = list(LoadProfileGenerator(grid, seed=0).run(n_steps=10, chunk_size=4))
+
+    assert [chunk[ComponentType.sym_load].shape for chunk in chunks] == [(4, 20), (4, 20), (2, 20)]
+    update = np.concatenate([chunk[ComponentType.sym_load] for chunk in chunks])
+    np.testing.assert_array_equal(update["id"], np.broadcast_to(grid.sym_load.id, (10, 20)))
+    assert np.all(np.sign(update["p_specified"]) == np.sign(grid.sym_load.p_specified))
+
+
+def test_generate_load_profiles_shape():
+    grid = RadialGridGenerator(grid_class=Grid, nr_nodes=20).run(seed=0)
+    profile_generator = LoadProfileGenerator(grid, seed=0, seasonal_amplitude=0.2)
+    minutes = np.arange(0, 365 * 24 * 60, 15)
+    shape = profile_generator.get_load_shape(minutes)
+
+    assert shape[minutes == 19 * 60] > shape[minutes == 4 * 60]  # evening peak
+    assert shape[minutes == 15 * 24 * 60] > shape[minutes == 196 * 24 * 60]  # winter peak
+    assert shape.mean() == pytest.approx(1.0, abs=0.01)
+
+
+def test_run_time_series_with_load_profiles():
+    grid = RadialGridGenerator(grid_class=Grid, nr_nodes=20).run(seed=0)
+    chunks = LoadProfileGenerator(grid, seed=0).run(n_steps=6, chunk_size=4)
+
+    result = PowerGridModelInterface(grid=grid).run_time_series(chunks, n_steps=6)
+    assert result.n_steps == 6
+    assert len(result.chunk_timings) == 2
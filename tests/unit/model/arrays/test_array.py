@@ -303,3 +303,69 @@ def test_from_extended_array():
 
 def test_size(fancy_test_array: FancyTestArray):
     assert fancy_test_array.size == 3
+
+
+class TestVersion:
+    def test_new_arrays_have_different_versions(self):
+        assert LineArray().version != LineArray().version
+
+    @pytest.mark.parametrize(
+        "modify",
+        [
+            pytest.param(lambda array: setattr(array, "test_int", 7), id="setattr"),
+            pytest.param(lambda array: array.__setitem__(0, array[1]), id="setitem"),
+            pytest.param(lambda array: array.update_by_id([1], test_int=7), id="update_by_id"),
+            pytest.param(lambda array: array.set_empty("test_float"), id="set_empty"),
+            pytest.param(fp.sort, id="fp.sort"),
+            pytest.param(lambda array: array.mark_modified(), id="mark_modified"),
+        ],
+    )
+    def test_version_increases_on_modification(self, fancy_test_array: FancyTestArray, modify):
+        version = fancy_test_array.version
+        modify(fancy_test_array)
+        assert fancy_test_array.version > version
+
+    def test_version_unchanged_on_read(self, fancy_test_array: FancyTestArray):
+        version = fancy_test_array.version
+        _ = fancy_test_array.filter(id=1)
+        _ = fancy_test_array.test_int
+        _ = fancy_test_array[0]
+        assert fancy_test_array.version == version
+
+    def test_failed_update_does_not_change_version(self, fancy_test_array: FancyTestArray):
+        version = fancy_test_array.version
+        with pytest.raises(ValueError, match="Cannot update"):
+            fancy_test_array.update_by_id([99], test_int=7)
+        assert fancy_test_array.version == version
+
+
+def test_fingerprint(fancy_test_array: FancyTestArray):
+    fingerprint = fancy_test_array.fingerprint()
+
+    assert fingerprint == copy(fancy_test_array).fingerprint()
+    assert hash(fancy_test_array) == hash(copy(fancy_test_array))
+
+    fancy_test_array.test_str[0] = "b"
+    assert fancy_test_array.fingerprint() != fingerprint
+
+
+def test_fingerprint_beyond_printed_rows():
+    array = FancyTestArray.zeros(100)
+    other_array = FancyTestArray.zeros(100)
+    other_array.test_int[50] = 1
+
+    assert array.fingerprint() != other_array.fingerprint()
+
+
+def test_fingerprint_nan_and_negative_zero():
+    array = FancyTestArray.zeros(2)
+    array.test_float = [np.nan, 0.0]
+    other_array = FancyTestArray.zeros(2)
+    other_array.test_float = [-np.nan, -0.0]
+
+    assert array == other_array
+    assert array.fingerprint() == other_array.fingerprint()
+
+
+def test_fingerprint_depends_on_class():
+    assert LineArray.zeros(1).fingerprint() != TransformerArray.zeros(1).fingerprint()
@@ -2,9 +2,14 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
+import importlib.util
 import sys
 import unittest
 
+import numpy as np
+
+from power_grid_model_ds.arrays import AsymLoadArray, NodeArray
+from power_grid_model_ds.constants import EMPTY_ID
 from tests.fixtures.arrays import FancyTestArray
 
 
@@ -16,3 +21,50 @@ def test_as_df(fancy_test_array: FancyTestArray):
     import pandas as pd  # noqa: PLC0415
 
     assert isinstance(data_frame, pd.DataFrame)
+
+
+@unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed")
+def test_arrow_roundtrip(fancy_test_array: FancyTestArray):
+    """Test that .as_arrow() and .from_arrow() convert an array to a pyarrow Table and back."""
+    table = fancy_test_array.as_arrow()
+
+    assert table.column_names == fancy_test_array.columns
+    assert table.column("test_str").to_pylist() == ["a", "c", "d"]
+    assert FancyTestArray.from_arrow(table) == fancy_test_array
+
+
+@unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed")
+def test_arrow_fixed_size_list_columns():
+    """Test that NDArray3 columns are converted to fixed-size lists, with nulls replaced by empty values."""
+    # pylint: disable=import-outside-toplevel, import-error
+    import pyarrow as pa  # noqa: PLC0415
+
+    loads = AsymLoadArray.zeros(2)
+    loads.id = [1, 2]
+    loads.p_specified = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, np.nan]])
+    table = loads.as_arrow()
+
+    assert table.schema.field("p_specified").type == pa.list_(pa.float64(), 3)
+    assert AsymLoadArray.from_arrow(table) == loads
+
+    table = table.set_column(
+        table.column_names.index("q_specified"),
+        "q_specified",
+        pa.array([None, [1.0, None, 2.0]], type=pa.list_(pa.float64(), 3)),
+    )
+    np.testing.assert_array_equal(
+        AsymLoadArray.from_arrow(table).q_specified, [[np.nan, np.nan, np.nan], [1.0, np.nan, 2.0]]
+    )
+
+
+@unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed")
+def test_from_arrow_with_nulls_and_extra_columns():
+    # pylint: disable=import-outside-toplevel, import-error
+    import pyarrow as pa  # noqa: PLC0415
+
+    table = pa.table({"id": pa.array([1, None], pa.int32()), "u_rated": [10_500.0, None], "extra": [1, 2]})
+    nodes = NodeArray.from_arrow(table)
+
+    assert nodes.id.tolist() == [1, EMPTY_ID]
+    assert nodes.u_rated[0] == 10_500.0
+    assert np.isnan(nodes.u_rated[1])
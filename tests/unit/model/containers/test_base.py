@@ -308,3 +308,38 @@ def test_max_id_deepcopy():
     copied = deepcopy(grid)
     assert copied.ids == grid.ids
     assert copied.max_id == grid.max_id
+
+
+def test_array_versions():
+    grid = Grid.from_txt("1 2 20", "2 3 21")
+    versions = grid.array_versions
+
+    grid.line.update_by_id([21], i_n=100.0)
+
+    new_versions = grid.array_versions
+    assert new_versions["line"] > versions["line"]
+    assert {name: version for name, version in new_versions.items() if name != "line"} == {
+        name: version for name, version in versions.items() if name != "line"
+    }
+
+
+def test_version_increases_on_array_assignment():
+    grid = Grid.from_txt("1 2 20", "2 3 21")
+    version = grid.version
+
+    grid.line = grid.line
+    assert grid.version > version
+
+
+def test_version_increases_on_grid_modification():
+    grid = Grid.from_txt("1 2 20", "2 3 21")
+    versions = [grid.version]
+
+    grid.make_inactive(grid.line.get(id=21))
+    versions.append(grid.version)
+    grid.append(NodeArray.empty(1))
+    versions.append(grid.version)
+    grid.delete_branch(grid.line.get(id=20))
+    versions.append(grid.version)
+
+    assert versions == sorted(set(versions))
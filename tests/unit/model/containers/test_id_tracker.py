@@ -4,6 +4,8 @@
 
 """Tests for IdTracker."""
 
+import numpy as np
+
 from power_grid_model_ds._core.model.containers._id_tracker import IdTracker
 
 
@@ -19,6 +21,18 @@ def test_init_from_set():
     assert tracker.max_id == 5
 
 
+def test_from_array():
+    tracker = IdTracker.from_array(np.array([1, 5, 3, 5]))
+    assert tracker.ids == {1, 3, 5}
+    assert tracker.max_id == 5
+    assert isinstance(tracker.max_id, int)
+
+
+def test_from_empty_array():
+    tracker = IdTracker.from_array(np.array([], dtype=np.int32))
+    assert tracker == IdTracker()
+
+
 def test_init_copies_input_set():
     ids = {1, 2, 3}
     tracker = IdTracker(ids)
@@ -7,6 +7,7 @@ import pytest
 
 from power_grid_model_ds._core.model.arrays.base.errors import RecordDoesNotExist
 from power_grid_model_ds._core.model.graphs.container import GraphContainer
+from power_grid_model_ds._core.model.graphs.models import CsrGraphModel
 from power_grid_model_ds._core.model.grids.base import Grid
 from power_grid_model_ds.arrays import NodeArray, ThreeWindingTransformerArray
 
@@ -22,6 +23,17 @@ def test_rebuild_graphs(basic_grid: Grid):
     assert orig_graphs == basic_grid.graphs
 
 
+def test_rebuild_graphs_keeps_graph_model(basic_grid: Grid):
+    orig_graphs = deepcopy(basic_grid.graphs)
+
+    basic_grid.graphs = GraphContainer.empty(graph_model=CsrGraphModel)
+    basic_grid.rebuild_graphs()
+
+    assert isinstance(basic_grid.graphs.active_graph, CsrGraphModel)
+    assert isinstance(basic_grid.graphs.complete_graph, CsrGraphModel)
+    assert orig_graphs == basic_grid.graphs
+
+
 @pytest.fixture
 def graph_container_with_5_nodes():
     graph_container = GraphContainer.empty()
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Tests that are specific to the CsrGraphModel. Generic graph model tests are in test_graph_model.py"""
+
+import pytest
+
+from power_grid_model_ds._core.data_source.generator.grid_generators import RadialGridGenerator
+from power_grid_model_ds._core.model.graphs.container import GraphContainer
+from power_grid_model_ds._core.model.graphs.models import CsrGraphModel, RustworkxGraphModel
+from power_grid_model_ds._core.model.grids.base import Grid
+from power_grid_model_ds.enums import NodeType
+
+# pylint: disable=missing-function-docstring
+
+
+@pytest.fixture
+def generated_grid() -> Grid:
+    return RadialGridGenerator(grid_class=Grid, nr_nodes=200, nr_sources=3, nr_nops=20).run(seed=0)
+
+
+def test_from_grid_equals_rustworkx(generated_grid: Grid):
+    csr_graphs = GraphContainer.from_grid(generated_grid, graph_model=CsrGraphModel)
+    rx_graphs = GraphContainer.from_grid(generated_grid, graph_model=RustworkxGraphModel)
+
+    assert csr_graphs == rx_graphs
+
+
+def test_searches_equal_rustworkx(generated_grid: Grid):
+    csr_graph = CsrGraphModel.from_grid(generated_grid, active_only=True)
+    rx_graph = RustworkxGraphModel.from_grid(generated_grid, active_only=True)
+    substation_ids = generated_grid.node.filter(node_type=NodeType.SUBSTATION_NODE).id.tolist()
+    node_id = generated_grid.node.exclude(node_type=NodeType.SUBSTATION_NODE).id[0].item()
+
+    with csr_graph.tmp_remove_nodes(substation_ids), rx_graph.tmp_remove_nodes(substation_ids):
+        csr_components = {frozenset(component) for component in csr_graph.get_components()}
+        rx_components = {frozenset(component) for component in rx_graph.get_components()}
+    assert csr_components == rx_components
+
+    assert set(csr_graph.get_connected(node_id)) == set(rx_graph.get_connected(node_id))
+    assert csr_graph.bfs(substation_ids).keys() == rx_graph.bfs(substation_ids).keys()
+    assert (
+        csr_graph.get_shortest_path(node_id, substation_ids[0])[1]
+        == (rx_graph.get_shortest_path(node_id, substation_ids[0])[1])
+    )
+    assert len(csr_graph.find_fundamental_cycles()) == len(rx_graph.find_fundamental_cycles())
+
+
+def test_grid_with_csr_graph_model():
+    grid = RadialGridGenerator(grid_class=Grid, nr_nodes=50, graph_model=CsrGraphModel).run(seed=1)
+
+    assert isinstance(grid.graphs.active_graph, CsrGraphModel)
+    assert grid.graphs == GraphContainer.from_grid(grid)
+
+
+def test_node_ids_are_not_reused_after_deletion():
+    graph = CsrGraphModel()
+    graph.add_node(1)
+    graph.add_node(2)
+    graph.add_branch(1, 2)
+
+    graph.delete_node(1)
+    graph.add_node(1)
+
+    assert graph.external_to_internal(1) == 2
+    assert graph.nr_nodes == 2
+    assert graph.nr_branches == 0
@@ -5,6 +5,7 @@
 """Grid tests"""
 
 from collections import Counter
+from collections.abc import Generator
 from copy import deepcopy
 
 import numpy as np
@@ -331,6 +332,60 @@ class TestPathMethods:
         assert path == []
 
 
+class TestIterAllPaths:
+    @pytest.fixture
+    def circular_graph(self, graph_with_5_nodes: BaseGraphModel) -> BaseGraphModel:
+        graph_with_5_nodes.add_branch(1, 2)
+        graph_with_5_nodes.add_branch(2, 3)
+        graph_with_5_nodes.add_branch(3, 4)
+        graph_with_5_nodes.add_branch(4, 5)
+        graph_with_5_nodes.add_branch(5, 1)
+        return graph_with_5_nodes
+
+    def test_iter_all_paths_matches_get_all_paths(self, circular_graph: BaseGraphModel):
+        paths = list(circular_graph.iter_all_paths(1, 3))
+
+        assert sorted(paths) == sorted(circular_graph.get_all_paths(1, 3))
+
+    def test_iter_all_paths_is_lazy(self, circular_graph: BaseGraphModel):
+        paths = circular_graph.iter_all_paths(1, 3)
+
+        assert isinstance(paths, Generator)
+        assert next(paths) in [[1, 2, 3], [1, 5, 4, 3]]
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            pytest.param({"cutoff": 2}, [[1, 2, 3]], id="cutoff"),
+            pytest.param({"cutoff": 1}, [], id="cutoff_too_small"),
+            pytest.param({"min_depth": 3}, [[1, 5, 4, 3]], id="min_depth"),
+            pytest.param({"min_depth": 2, "cutoff": 3}, [[1, 2, 3], [1, 5, 4, 3]], id="min_depth_and_cutoff"),
+        ],
+    )
+    def test_iter_all_paths_depth(self, circular_graph: BaseGraphModel, kwargs, expected):
+        assert sorted(circular_graph.iter_all_paths(1, 3, **kwargs)) == expected
+
+    @pytest.mark.parametrize(("max_paths", "expected_nr_paths"), [(0, 0), (1, 1), (2, 2), (5, 2)])
+    def test_iter_all_paths_max_paths(self, circular_graph: BaseGraphModel, max_paths, expected_nr_paths):
+        assert len(list(circular_graph.iter_all_paths(1, 3, max_paths=max_paths))) == expected_nr_paths
+
+    def test_iter_all_paths_same_node(self, circular_graph: BaseGraphModel):
+        assert list(circular_graph.iter_all_paths(1, 1)) == []
+
+    def test_iter_all_paths_no_path(self, graph_with_5_nodes: BaseGraphModel):
+        assert list(graph_with_5_nodes.iter_all_paths(1, 2)) == []
+
+    def test_iter_all_paths_parallel_branches(self, graph_with_5_nodes: BaseGraphModel):
+        graph_with_5_nodes.add_branch(1, 2)
+        graph_with_5_nodes.add_branch(1, 2)
+
+        assert list(graph_with_5_nodes.iter_all_paths(1, 2)) == [[1, 2]]
+
+    def test_iter_all_paths_missing_node(self, circular_graph: BaseGraphModel):
+        with pytest.raises(MissingNodeError):
+            list(circular_graph.iter_all_paths(1, 99))
+
+
 class TestFindFundamentalCycles:
     @pytest.mark.parametrize(
         ("additional_edges", "nodes_in_cycles"),
@@ -6,8 +6,10 @@ More generic tests are in a differnt file. This file works on a more complicated
 
 import pytest
 
+from power_grid_model_ds._core.model.graphs.models.base import BaseGraphModel
 from power_grid_model_ds._core.model.graphs.models.rustworkx import RustworkxGraphModel
 from power_grid_model_ds.arrays import NodeArray, ThreeWindingTransformerArray
+from tests.conftest import get_installed_graph_models
 
 
 @pytest.fixture
@@ -23,7 +25,7 @@ def branch3_array() -> ThreeWindingTransformerArray:
     return three
 
 
-def _setup_graph(graph: RustworkxGraphModel, branch3_array: ThreeWindingTransformerArray) -> RustworkxGraphModel:
+def _setup_graph(graph: BaseGraphModel, branch3_array: ThreeWindingTransformerArray) -> BaseGraphModel:
     nodes = NodeArray.empty(12)
     nodes.id = [1, 2, 3, 4, 5, 6, 10, 20, 30, 40, 50, 60]
 
@@ -58,9 +60,14 @@ def active_only(request):
     return request.param
 
 
+@pytest.fixture(params=list(get_installed_graph_models().values()), ids=list(get_installed_graph_models().keys()))
+def graph_model(request) -> type[BaseGraphModel]:
+    return request.param
+
+
 @pytest.fixture
-def graph(active_only, branch3_array):
-    return _setup_graph(RustworkxGraphModel(active_only=active_only), branch3_array)
+def graph(graph_model, active_only, branch3_array):
+    return _setup_graph(graph_model(active_only=active_only), branch3_array)
 
 
 def list_of_paths_to_set(paths, ordered_paths=False):
@@ -150,6 +157,41 @@ class TestGetAllPaths:
 
         assert list_of_paths_to_set(actual_paths, ordered_paths=True) == expected
 
+    @pytest.mark.parametrize(
+        ("source", "dest", "active_expected", "complete_expected"),
+        [
+            pytest.param(1, 6, set(), {(1, 2, 5, 6)}, id="1->6"),
+            pytest.param(
+                10,
+                50,
+                {(10, 40, 60, 50), (10, 60, 50)},
+                {(10, 40, 60, 50), (10, 40, 30, 50), (10, 60, 50), (10, 20, 50)},
+                id="10->50",
+            ),
+        ],
+    )
+    def test_iter_all_paths_with_cutoff(self, graph, active_only, source, dest, active_expected, complete_expected):  # noqa: PLR0913
+        expected = active_expected if active_only else complete_expected
+        actual_paths = list(graph.iter_all_paths(source, dest, cutoff=3))
+
+        assert list_of_paths_to_set(actual_paths, ordered_paths=True) == expected
+
+    def test_iter_all_paths_does_not_modify_graph(self, graph):
+        original_branches = set(graph.all_branches)
+        paths = graph.iter_all_paths(10, 50)
+        next(paths)
+
+        assert set(graph.all_branches) == original_branches
+
+    @pytest.mark.parametrize("cutoff", range(6))
+    def test_iter_all_paths_cutoff_matches_get_all_paths(self, graph, cutoff):
+        expected = [path for path in graph.get_all_paths(10, 50) if len(path) - 1 <= cutoff]
+        actual_paths = list(graph.iter_all_paths(10, 50, cutoff=cutoff))
+
+        assert list_of_paths_to_set(actual_paths, ordered_paths=True) == list_of_paths_to_set(
+            expected, ordered_paths=True
+        )
+
     @pytest.mark.parametrize(
         ("source", "dest", "active_expected", "complete_expected"),
         [
@@ -182,6 +224,11 @@ class TestGetAllPaths:
 
 
 class TestGetCycles:
+    @pytest.fixture
+    def graph_model(self) -> type[BaseGraphModel]:
+        # The fundamental cycles depend on the spanning tree chosen by the graph engine
+        return RustworkxGraphModel
+
     def test_get_cycles(self, graph):
         expected = (
             {(10, 20, 30, 40, 10), (40, 30, 20, 10, 60, 40)}
@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from pathlib import Path
+
+import pytest
+
+from power_grid_model_ds import Grid
+from power_grid_model_ds._core.model.containers.helpers import container_equal
+from power_grid_model_ds.arrays import NodeArray
+
+pa = pytest.importorskip("pyarrow")
+
+
+def test_to_arrow(basic_grid: Grid):
+    tables = basic_grid.to_arrow()
+
+    assert len(tables) == len(list(basic_grid.all_arrays()))
+    assert tables["node"].num_rows == basic_grid.node.size
+    assert tables["node"].column("id").to_pylist() == basic_grid.node.id.tolist()
+
+
+def test_arrow_roundtrip(basic_grid: Grid):
+    loaded_grid = Grid.from_arrow(basic_grid.to_arrow())
+
+    assert loaded_grid == basic_grid
+    assert loaded_grid.max_id == basic_grid.max_id
+    assert loaded_grid.graphs.active_graph.nr_branches == basic_grid.graphs.active_graph.nr_branches
+
+
+def test_from_arrow_with_partial_tables():
+    tables = {"node": pa.table({"id": [1, 2], "u_rated": [10_500.0, 10_500.0]}), "unknown": pa.table({"id": [3]})}
+    grid = Grid.from_arrow(tables)
+
+    assert grid.node == NodeArray(id=[1, 2], u_rated=[10_500.0, 10_500.0])
+    assert grid.line.size == 0
+
+
+def test_parquet_roundtrip(basic_grid: Grid, tmp_path: Path):
+    directory = basic_grid.to_parquet(tmp_path / "grid", compression="zstd")
+
+    assert (directory / "node.parquet").is_file()
+    assert container_equal(Grid.from_parquet(directory), basic_grid, fields_to_ignore=["graphs"])
@@ -4,9 +4,13 @@
 
 """Comprehensive unit tests for Grid serialization with power-grid-model compatibility."""
 
+import gzip
 import json
 import re
+import tracemalloc
+import uuid
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 from typing import ClassVar
 
@@ -18,6 +22,7 @@ from power_grid_model.utils import json_serialize_to_file
 from power_grid_model_ds import Grid, PowerGridModelInterface
 from power_grid_model_ds._core.model.arrays.base.array import FancyArray
 from power_grid_model_ds._core.model.containers.helpers import container_equal
+from power_grid_model_ds._core.model.grids.serialization import json as json_serialization
 from power_grid_model_ds._core.utils.misc import array_equal_with_nan
 from power_grid_model_ds.arrays import LineArray, NodeArray as BaseNodeArray
 
@@ -259,6 +264,15 @@ class TestExtensionHandling:
 
         with pytest.raises(TypeError):
             grid.serialize(path)
+        assert not path.exists()
+
+    def test_non_serializable_extension_keeps_existing_file(self, tmp_path: Path):
+        path = tmp_path / "non_serializable.json"
+        path.write_text("previous content", encoding="utf-8")
+
+        with pytest.raises(TypeError):
+            GridWithCustomClass.empty().serialize(path)
+        assert path.read_text(encoding="utf-8") == "previous content"
 
     def test_custom_json_encoder(self, tmp_path: Path):
         path = tmp_path / "custom_json_encoder.json"
@@ -363,6 +377,161 @@ class TestDeserialize:
             Grid.deserialize(path)
 
 
+class TestStreaming:
+    """Test the incremental JSON writer and reader"""
+
+    @pytest.fixture
+    def small_chunks(self, monkeypatch):
+        monkeypatch.setattr(json_serialization, "_CHUNK_SIZE", 2)
+        monkeypatch.setattr(json_serialization, "_BLOCK_SIZE", 5)
+        monkeypatch.setattr(json_serialization, "_DECODE_SIZE", 40)
+
+    @pytest.mark.usefixtures("small_chunks")
+    def test_file_matches_dict(self, basic_grid: Grid, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(json_serialization, "orjson", None)
+        basic_grid.node.u_rated[0] = np.nan
+        path = basic_grid.serialize(tmp_path / "grid.json")
+
+        assert path.read_text(encoding="utf-8") == json.dumps(json_serialization.serialize_to_dict(basic_grid))
+
+    @pytest.mark.parametrize("kwargs", [{}, {"indent": 2}, {"sort_keys": True}, {"separators": (",", ":")}])
+    @pytest.mark.usefixtures("small_chunks")
+    def test_roundtrip_with_small_chunks(self, extended_grid: ExtendedGrid, tmp_path: Path, kwargs):
+        path = extended_grid.serialize(tmp_path / "grid.json", **kwargs)
+
+        assert ExtendedGrid.deserialize(path) == extended_grid
+
+    @pytest.mark.usefixtures("small_chunks")
+    def test_skips_other_keys(self, tmp_path: Path):
+        path = tmp_path / "grid.json"
+        data = {
+            "version": "1.0",
+            "attributes": {},
+            "data": {"node": [{"id": 1, "u_rated": 10000}, {"id": 2, "u_rated": 20000}, {"id": 3, "u_rated": 1e4}]},
+            "is_batch": False,
+        }
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+        grid = Grid.deserialize(path)
+        assert grid.node.id.tolist() == [1, 2, 3]
+        assert grid.node.u_rated.tolist() == [10000, 20000, 10000]
+
+    @pytest.mark.usefixtures("small_chunks")
+    def test_records_miss_data_in_later_chunk(self, tmp_path: Path):
+        path = tmp_path / "grid.json"
+        data = {"data": {"node": [{"id": 1, "u_rated": 1e4}, {"id": 2, "u_rated": 1e4}, {"u_rated": 1e4}]}}
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Some records in column 'id' have missing values"):
+            Grid.deserialize(path)
+
+    @pytest.mark.usefixtures("small_chunks")
+    def test_braces_in_strings(self, tmp_path: Path):
+        path = tmp_path / "grid.json"
+        rows = [{"id": node_id, "u_rated": 1e4, "name": "node}, {" * node_id} for node_id in range(1, 6)]
+        path.write_text(json.dumps({"data": {"node": rows, "line": []}}), encoding="utf-8")
+
+        grid = Grid.deserialize(path)
+        assert grid.node.id.tolist() == [1, 2, 3, 4, 5]
+
+    def test_peak_memory(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(json_serialization, "_BLOCK_SIZE", 1 << 16)
+        monkeypatch.setattr(json_serialization, "_DECODE_SIZE", 1 << 14)
+        grid = Grid.empty()
+        grid.append(BaseNodeArray(id=np.arange(20_000), u_rated=np.full(20_000, 10_500.0)), check_max_id=False)
+        path = grid.serialize(tmp_path / "grid.json")
+
+        tracemalloc.start()
+        loaded_grid = Grid.deserialize(path)
+        grid_size, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert loaded_grid.node.size == 20_000
+        # only a few blocks of the file are held in memory at once, instead of all rows as Python objects
+        assert peak < 1.5 * grid_size
+
+    def test_invalid_json(self, tmp_path: Path):
+        path = tmp_path / "grid.json"
+        path.write_text('{"data": {"node": [{"id": 1, "u_rated": 1e4}}', encoding="utf-8")
+
+        with pytest.raises(json.JSONDecodeError):
+            Grid.deserialize(path)
+
+    def test_missing_data(self, tmp_path: Path):
+        path = tmp_path / "grid.json"
+        path.write_text('{"node": []}', encoding="utf-8")
+
+        with pytest.raises(KeyError):
+            Grid.deserialize(path)
+
+
+class TestCompression:
+    """Test compressed serialization and transparent decompression"""
+
+    def test_gzip_roundtrip(self, extended_grid: ExtendedGrid, tmp_path: Path):
+        path = extended_grid.serialize(tmp_path / "grid.json.gz", compression="gzip")
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            assert json.load(f) == json.loads(extended_grid.serialize(mode="json_string"))
+        assert ExtendedGrid.deserialize(path) == extended_grid
+
+    @pytest.mark.parametrize(("compression", "package"), [("zstd", "zstandard"), ("lz4", "lz4.frame")])
+    def test_optional_codec_roundtrip(self, basic_grid: Grid, tmp_path: Path, compression, package: str):
+        pytest.importorskip(package)
+        path = basic_grid.serialize(tmp_path / "grid.json", compression=compression)
+
+        assert Grid.deserialize(path) == basic_grid
+
+    def test_compression_with_json_string(self, basic_grid: Grid):
+        with pytest.raises(ValueError, match="compression is only supported when mode='json'"):
+            basic_grid.serialize(mode="json_string", compression="gzip")  # type: ignore[call-overload]
+
+
+class TestOrjsonBackend:
+    """Test the optional orjson backend"""
+
+    @pytest.fixture(autouse=True)
+    def require_orjson(self):
+        pytest.importorskip("orjson")
+
+    def test_json_string_is_compact(self, basic_grid: Grid):
+        basic_grid.node.u_rated[0] = np.nan
+        json_string = basic_grid.serialize(mode="json_string")
+
+        assert json_string.startswith('{"data":{"node":[{"id":10,"u_rated":null,')
+        assert json.loads(json_string) == json_serialization.serialize_to_dict(basic_grid)
+
+    @pytest.mark.parametrize("kwargs", [{"indent": 2}, {"sort_keys": True}, {"indent": 4}, {"cls": CustomClassEncoder}])
+    def test_roundtrip_with_kwargs(self, extended_grid: ExtendedGrid, kwargs):
+        json_string = extended_grid.serialize(mode="json_string", **kwargs)
+
+        assert ExtendedGrid.from_json_string(json_string) == extended_grid
+
+    def test_numpy_extension_value(self):
+        grid = ExtendedGrid.empty()
+        grid.value_extension = np.float64(4.2)
+
+        assert ExtendedGrid.from_json_string(grid.serialize(mode="json_string")).value_extension == 4.2
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("value", [datetime(2024, 1, 1), uuid.UUID(int=1), np.int64(4)])
+    def test_strict_does_not_depend_on_backend(self, value, use_orjson: bool, monkeypatch):
+        if not use_orjson:
+            monkeypatch.setattr(json_serialization, "orjson", None)
+        grid = ExtendedGrid.empty()
+        grid.value_extension = value
+
+        with pytest.raises(TypeError, match="Failed to serialize"):
+            grid.serialize(mode="json_string")
+        assert "value_extension" not in json.loads(grid.serialize(mode="json_string", strict=False))["data"]
+
+    def test_legacy_nan_json_string(self):
+        json_string = (Path(__file__).parent / "data" / "legacy_nan.json").read_text(encoding="utf-8")
+
+        grid = Grid.from_json_string(json_string)
+        assert np.isnan(grid.node.u_rated[0])
+
+
 class TestJsonStringRoundtrips:
     """Test serialize/deserialize with mode="json_string"."""
 
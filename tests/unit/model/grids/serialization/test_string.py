@@ -8,6 +8,7 @@ import numpy as np
 import pytest
 
 from power_grid_model_ds import Grid
+from power_grid_model_ds.errors import RecordDoesNotExist
 
 
 def test_grid_as_str(basic_grid: Grid):
@@ -19,6 +20,45 @@ def test_grid_as_str(basic_grid: Grid):
     assert "103 104 203,open" in grid_as_string
 
 
+def test_grid_as_str_with_three_winding_transformer(grid_with_3wt: Grid):
+    grid_as_string = str(grid_with_3wt)
+
+    assert grid_as_string.startswith("S101 S102 301,3-transformer\nS101 S103 301,3-transformer\n")
+
+
+def test_grid_as_str_all_branch_types():
+    txt_lines = [
+        "1 2 12",
+        "2 3 23,link",
+        "3 4 34,transformer",
+        "4 5 45,generic_branch",
+        "5 6 56,asym_line",
+        "6 7 67,open",
+    ]
+    grid = Grid.from_txt(*txt_lines)
+
+    assert str(grid).splitlines() == [
+        "3 4 34,transformer",
+        "1 2 12",
+        "6 7 67,open",
+        "2 3 23,link",
+        "4 5 45,generic_branch",
+        "5 6 56,asym_line",
+    ]
+
+
+def test_grid_as_str_round_trip():
+    grid = Grid.from_txt("S1 2 10", "S1 3 11,open", "2 4 12,transformer", "3 4 13", "S5 4 14,link")
+    assert str(Grid.from_txt(str(grid))) == str(grid)
+
+
+def test_grid_as_str_with_unknown_node():
+    grid = Grid.from_txt("S1 2 10")
+    grid.line.to_node = 3
+    with pytest.raises(RecordDoesNotExist, match=re.escape("Nodes [3] not found in grid.")):
+        str(grid)
+
+
 class TestFromTxt:
     def test_from_txt_lines(self):
         grid = Grid.from_txt(
@@ -65,6 +105,23 @@ class TestFromTxt:
         assert grid.transformer.size == 1
         np.testing.assert_array_equal([95, 91, 92, 93, 94, 96, 97, 98], grid.branches.id)
 
+    def test_from_txt_with_partial_branch_ids(self):
+        grid = Grid.from_txt("S1 2 10", "2 3", "3 4 transformer,5", "4 5", "5 6 link")
+        assert grid.line.id.tolist() == [10, 11, 12]
+        assert grid.transformer.id.tolist() == [5]
+        assert grid.link.id.tolist() == [13]
+        assert grid.max_id == 13
+
+    def test_from_txt_with_multiple_branch_ids(self):
+        with pytest.raises(ValueError, match="Multiple branch ids found"):
+            Grid.from_txt("S1 2 10,11")
+
+    def test_from_txt_large(self):
+        grid = Grid.from_txt("S1 2", *(f"{node} {node + 1}" for node in range(2, 10_000)))
+        assert grid.node.size == 10_000
+        assert grid.line.id.tolist() == list(range(10_001, 20_000))
+        assert set(grid.node.exclude(id=1).feeder_branch_id.tolist()) == {10_001}
+
     def test_from_txt_with_conflicting_ids(self):
         with pytest.raises(ValueError, match="Source nodes and regular nodes have overlapping ids"):
             Grid.from_txt("S1 2", "1 3")
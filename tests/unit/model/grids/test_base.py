@@ -161,3 +161,15 @@ class TestGrid:
         grid2.node.u_rated[0] += 1000.0
 
         assert grid1 != grid2
+
+
+def test_fingerprint(basic_grid: Grid):
+    fingerprint = basic_grid.fingerprint()
+    assert fingerprint == deepcopy(basic_grid).fingerprint()
+
+    basic_grid.line.r1[0] += 1.0
+    assert basic_grid.fingerprint() != fingerprint
+
+
+def test_fingerprint_depends_on_grid_class():
+    assert Grid.empty().fingerprint() != ExtendedGrid.empty().fingerprint()
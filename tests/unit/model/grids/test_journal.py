@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+import numpy as np
+import pytest
+
+from power_grid_model_ds import Grid
+from power_grid_model_ds.arrays import LineArray, NodeArray
+
+
+@pytest.fixture
+def journaled_grid(basic_grid: Grid) -> Grid:
+    basic_grid.enable_journal()
+    return basic_grid
+
+
+def _summary(changes) -> list[tuple]:
+    return [(change.change_type, change.array_name, change.ids.tolist()) for change in changes]
+
+
+def test_journal_disabled_by_default(basic_grid: Grid):
+    assert basic_grid.journal is None
+    with pytest.raises(ValueError, match="enable_journal"):
+        basic_grid.changes_since(0)
+
+
+def test_changes_since_before_journal_start(journaled_grid: Grid):
+    with pytest.raises(ValueError, match="not been recorded"):
+        journaled_grid.changes_since(journaled_grid.version - 1)
+
+
+def test_no_changes(journaled_grid: Grid):
+    assert journaled_grid.changes_since(journaled_grid.version) == []
+
+
+def test_append(journaled_grid: Grid):
+    version = journaled_grid.version
+    nodes = NodeArray(id=[107, 108], u_rated=[400.0, 400.0])
+    journaled_grid.append(nodes)
+
+    changes = journaled_grid.changes_since(version)
+    assert _summary(changes) == [("append", "node", [107, 108])]
+    assert changes[0].version == journaled_grid.version
+    assert changes[0].records is not None
+    np.testing.assert_array_equal(changes[0].records["u_rated"], [400.0, 400.0])
+
+
+def test_make_inactive_and_active(journaled_grid: Grid):
+    version = journaled_grid.version
+    line = journaled_grid.line.get(201)
+    journaled_grid.make_inactive(line)
+    journaled_grid.make_active(line)
+
+    changes = journaled_grid.changes_since(version)
+    assert _summary(changes) == [("status", "line", [201]), ("status", "line", [201])]
+    assert changes[0].columns == ("to_status",)
+    assert changes[1].columns == ("from_status", "to_status")
+
+
+def test_delete_node_records_cascaded_deletions(journaled_grid: Grid):
+    version = journaled_grid.version
+    journaled_grid.delete_node(journaled_grid.node.get(106))
+
+    changes = journaled_grid.changes_since(version)
+    assert {("delete", "node", (106,)), ("delete", "transformer", (301,))} == {
+        (change_type, array_name, tuple(ids)) for change_type, array_name, ids in _summary(changes)
+    }
+
+
+def test_changes_since_intermediate_version(journaled_grid: Grid):
+    journaled_grid.delete_branch(journaled_grid.line.get(204))
+    version = journaled_grid.version
+    journaled_grid.reverse_branches(journaled_grid.line.get(201))
+
+    changes = journaled_grid.changes_since(version)
+    assert _summary(changes) == [("update", "line", [201])]
+    assert changes[0].columns == ("from_node", "to_node", "from_status", "to_status")
+
+
+def test_untracked_modification(journaled_grid: Grid):
+    version = journaled_grid.version
+    journaled_grid.line.update_by_id(201, r1=0.5)
+    journaled_grid.make_inactive(journaled_grid.line.get(202))
+
+    changes = journaled_grid.changes_since(version)
+    assert len(changes) == 2
+    assert (
+        changes[0].change_type,
+        changes[0].array_name,
+        changes[0].ids,
+        changes[0].columns,
+    ) == ("update", "line", None, None)
+    assert _summary(changes[1:])[0] == ("status", "line", [202])
+
+
+def test_set_feeder_ids(journaled_grid: Grid):
+    version = journaled_grid.version
+    journaled_grid.set_feeder_ids()
+
+    changes = journaled_grid.changes_since(version)
+    assert {"update"} == {change.change_type for change in changes}
+    assert {"node", "line", "link", "transformer"} <= {change.array_name for change in changes}
+
+
+def test_clear_and_disable_journal(journaled_grid: Grid):
+    journaled_grid.append(LineArray.empty(0))
+    journaled_grid.make_inactive(journaled_grid.line.get(201))
+    assert journaled_grid.journal is not None
+    assert len(journaled_grid.journal) == 1
+
+    journaled_grid.journal.clear()
+    assert len(journaled_grid.journal) == 0
+    assert journaled_grid.changes_since(journaled_grid.version) == []
+
+    journaled_grid.disable_journal()
+    assert journaled_grid.journal is None
+
+
+def test_journal_is_not_part_of_the_grid_data(journaled_grid: Grid):
+    json_string = journaled_grid.serialize(mode="json_string")
+    loaded_grid = Grid.from_json_string(json_string)
+
+    assert "_journal" not in json_string
+    assert loaded_grid.journal is None
+    assert loaded_grid == journaled_grid
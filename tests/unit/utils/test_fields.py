@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+import numpy as np
+
+from power_grid_model_ds._core.utils.fields import copy_fields, get_field_plan
+
+# pylint: disable=missing-function-docstring
+
+SOURCE_DTYPE = np.dtype([("id", np.int32), ("a", np.float64), ("b", np.float64), ("extra", np.int8)])
+TARGET_DTYPE = np.dtype([("b", np.float64), ("id", np.int64), ("c", np.float64), ("a", np.float64)])
+
+
+def test_get_field_plan_is_ordered_by_target():
+    assert get_field_plan(SOURCE_DTYPE, TARGET_DTYPE) == ("b", "id", "a")
+
+
+def test_get_field_plan_is_cached():
+    assert get_field_plan(SOURCE_DTYPE, TARGET_DTYPE) is get_field_plan(np.dtype(SOURCE_DTYPE), TARGET_DTYPE)
+
+
+def test_get_field_plan_without_overlap():
+    assert get_field_plan(SOURCE_DTYPE, np.dtype([("d", np.int32)])) == ()
+
+
+def test_copy_fields():
+    source = np.zeros(3, dtype=SOURCE_DTYPE)
+    source["id"] = [1, 2, 3]
+    source["a"] = [0.1, 0.2, 0.3]
+    source["b"] = [1.0, 2.0, 3.0]
+    target = np.zeros(3, dtype=TARGET_DTYPE)
+    target["c"] = np.nan
+
+    copied = copy_fields(source, target)
+
+    assert copied == ("b", "id", "a")
+    assert target["id"].tolist() == [1, 2, 3]
+    assert target["a"].tolist() == [0.1, 0.2, 0.3]
+    assert target["b"].tolist() == [1.0, 2.0, 3.0]
+    assert np.isnan(target["c"]).all()
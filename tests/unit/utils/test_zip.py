@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from pathlib import Path
+
+import pytest
+
+from power_grid_model_ds._core.utils import zip as zip_utils
+from power_grid_model_ds._core.utils.zip import detect_compression, file2gzip, open_text
+
+
+def test_open_text_gzip_roundtrip(tmp_path: Path):
+    path = tmp_path / "data.txt.gz"
+    with open_text(path, "w", compression="gzip") as f:
+        f.write("some text ✓")
+
+    assert detect_compression(path) == "gzip"
+    with open_text(path, "r", compression="gzip") as f:
+        assert f.read() == "some text ✓"
+
+
+@pytest.mark.parametrize(("compression", "package"), [("zstd", "zstandard"), ("lz4", "lz4.frame")])
+def test_open_text_optional_codecs(tmp_path: Path, compression, package: str):
+    pytest.importorskip(package)
+    path = tmp_path / "data.txt"
+    with open_text(path, "w", compression=compression) as f:
+        f.write("some text")
+
+    assert detect_compression(path) == compression
+    with open_text(path, "r", compression=compression) as f:
+        assert f.read() == "some text"
+
+
+@pytest.mark.parametrize(("compression", "attribute"), [("zstd", "zstandard"), ("lz4", "lz4_frame")])
+def test_open_text_codec_not_installed(tmp_path: Path, monkeypatch, compression, attribute: str):
+    monkeypatch.setattr(zip_utils, attribute, None)
+    with pytest.raises(ImportError, match="is not installed"):
+        open_text(tmp_path / "data.txt", "w", compression=compression)
+
+
+def test_open_text_invalid_compression(tmp_path: Path):
+    with pytest.raises(ValueError, match="Invalid compression 'bz2'"):
+        open_text(tmp_path / "data.txt", "w", compression="bz2")  # type: ignore[arg-type]
+
+
+def test_detect_compression(tmp_path: Path):
+    path = tmp_path / "data.txt"
+    path.write_text("plain text", encoding="utf-8")
+
+    assert detect_compression(path) is None
+    assert detect_compression(file2gzip(path)) == "gzip"
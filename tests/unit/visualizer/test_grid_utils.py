@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: 2025 Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
 #
 # SPDX-License-Identifier: MPL-2.0
+from dataclasses import fields
+
 import numpy as np
 import pytest
 from power_grid_model import AttributeType, ComponentType, DatasetType, initialize_array
@@ -8,6 +10,7 @@ from power_grid_model import AttributeType, ComponentType, DatasetType, initiali
 from power_grid_model_ds._core.model.arrays.base.array import FancyArray
 from power_grid_model_ds._core.model.constants import empty
 from power_grid_model_ds._core.model.grids.base import Grid
+from power_grid_model_ds._core.model.grids.serialization.json import serialize_to_dict
 from power_grid_model_ds._core.visualizer.grid_utils import (
     dynamic_grid_obj_from_grid,
     extend_grid_dynamically,
@@ -39,6 +42,19 @@ def test_extend_grid_dynamically_with_pgm_dataset(dataset_type):
             )
 
 
+def test_extend_grid_dynamically_keeps_journal_out_of_grid_data():
+    DynamicGrid = extend_grid_dynamically(Grid, extra_dataset={})
+    journal_field = next(field for field in fields(DynamicGrid) if field.name == "_journal")
+    assert not journal_field.init
+    assert not journal_field.compare
+
+    dynamic_grid_obj = DynamicGrid.empty()
+    other_grid_obj = DynamicGrid.empty()
+    dynamic_grid_obj.enable_journal()
+    assert dynamic_grid_obj == other_grid_obj
+    assert "_journal" not in serialize_to_dict(dynamic_grid_obj)["data"]
+
+
 @pytest.mark.parametrize(
     "dataset_type",
     [DatasetType.input, DatasetType.update, DatasetType.sym_output, DatasetType.sc_output, DatasetType.asym_output],